@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
@@ -6,14 +6,18 @@ from datetime import date
 from ..models.database import get_db
 from ..models.keyword import Keyword
 from ..models.user import User
-from ..services.application_service import ApplicationService
+from ..services.application_service import APPLICATION_ORDER, ApplicationService
+from ..services.group_commit import group_writer
 from ..services.keyword_service import KeywordService
+from ..services.pagination import InvalidCursor
 from ..schemas.job_application import (
+    JOB_APPLICATION_LIST,
     JobApplicationCreate,
     JobApplicationUpdate,
     JobApplicationOut,
 )
 from ..middleware.auth import get_current_user
+from .responses import json_list
 
 router = APIRouter()
 application_service = ApplicationService()
@@ -30,25 +34,28 @@ def create_application(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    db_application = application_service.create_application(
-        db=db,
-        user_id=int(current_user.id),
-        job_title=application.job_title,
-        company=application.company,
-        application_date=application.application_date,
-        status=application.status,
-        job_board=application.job_board,
-        url=application.url,
-        notes=application.notes,
-    )
+    user_id = int(current_user.id)
 
-    for term in application.keywords:
-        keyword = keyword_service.get_keyword_by_term(db, term=term)
-        if not keyword:
-            keyword = keyword_service.create_keyword(
-                db, term=term, user_id=int(current_user.id)
-            )
-        db_application.keywords.append(keyword)
+    def add_application(db: Session):
+        db_application = application_service.add_application(
+            db=db,
+            user_id=user_id,
+            job_title=application.job_title,
+            company=application.company,
+            application_date=application.application_date,
+            status=application.status,
+            job_board=application.job_board,
+            url=application.url,
+            notes=application.notes,
+        )
+        db_application.keywords = keyword_service.resolve_keywords(
+            db, application.keywords, user_id=user_id
+        )
+        return db_application
+
+    if group_writer.enabled:
+        return group_writer.submit(add_application).result()
+    db_application = add_application(db)
     db.commit()
     db.refresh(db_application)
     return db_application
@@ -58,24 +65,35 @@ def create_application(
 def read_applications(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
     company: Optional[str] = None,
     job_board: Optional[str] = None,
-    keyword_terms: Optional[List[str]] = None,
+    keyword_terms: Optional[List[str]] = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    applications = application_service.get_applications(
-        db,
-        user_id=int(current_user.id),
-        skip=skip,
-        limit=limit,
-        status=status,
-        company=company,
-        job_board=job_board,
-        keyword_terms=keyword_terms,
+    if cursor and skip:
+        raise HTTPException(status_code=400, detail="Use either skip or cursor")
+    try:
+        applications = application_service.get_applications(
+            db,
+            user_id=int(current_user.id),
+            skip=skip,
+            limit=limit,
+            status=status,
+            company=company,
+            job_board=job_board,
+            keyword_terms=keyword_terms,
+            cursor=cursor,
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    next_cursor = APPLICATION_ORDER.next_cursor(applications, limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return json_list(
+        JOB_APPLICATION_LIST, applications, from_attributes=True, headers=headers
     )
-    return applications
 
 
 @router.get("/applications/{application_id}", response_model=JobApplicationOut)
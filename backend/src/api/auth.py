@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import jwt
 from datetime import datetime, timedelta
-from ..models.database import get_db
+from ..middleware.rate_limit import limit_auth_requests
+from ..models.database import get_async_db
 from ..services.auth_service import AuthService
+from ..services.password_hasher import HasherBusy
 from ..schemas.user import UserCreate, UserLogin, UserOut, Token
 from ..config import settings
 
@@ -27,9 +29,27 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     return encoded_jwt
 
 
-@router.post("/register", response_model=UserOut)
-def register(user: UserCreate, db: Session = Depends(get_db)):
-    db_user = auth_service.register_user(db, user.username, user.email, user.password)
+# Both endpoints hash a password, so both are rate limited per client and
+# shed load when the hasher's queue is full
+_hasher_busy = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Too many logins in progress, retry shortly",
+    headers={"Retry-After": "1"},
+)
+
+
+@router.post(
+    "/register",
+    response_model=UserOut,
+    dependencies=[Depends(limit_auth_requests)],
+)
+async def register(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    try:
+        db_user = await auth_service.register_user_async(
+            db, user.username, user.email, user.password
+        )
+    except HasherBusy:
+        raise _hasher_busy
     if not db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Error registering user"
@@ -37,9 +57,18 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
     return db_user
 
 
-@router.post("/login", response_model=Token)
-def login(user: UserLogin, db: Session = Depends(get_db)):
-    db_user = auth_service.authenticate_user(db, user.username, user.password)
+@router.post(
+    "/login",
+    response_model=Token,
+    dependencies=[Depends(limit_auth_requests)],
+)
+async def login(user: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    try:
+        db_user = await auth_service.authenticate_user_async(
+            db, user.username, user.password
+        )
+    except HasherBusy:
+        raise _hasher_busy
     if not db_user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
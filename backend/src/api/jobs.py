@@ -1,33 +1,70 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from ..models.database import get_db
-from ..services import job_service
+from functools import partial
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ..models.database import get_async_db
+from ..services import job_search, job_service
+from ..services.group_commit import group_writer
+from ..services.pagination import InvalidCursor
 from ..middleware.auth import get_current_user
 from ..models.user import User as DBUser
-from ..schemas.job import JobOut
+from ..schemas.job import JOB_LIST, JobOut, JobSearchHit
+from .responses import json_list
 
 router = APIRouter()
 
 
+async def _update_status(db: AsyncSession, job_id: int, user_id: int, new_status: str):
+    if group_writer.enabled:
+        return await group_writer.run(
+            partial(
+                job_service.set_job_status,
+                job_id=job_id,
+                user_id=user_id,
+                new_status=new_status,
+            )
+        )
+    return await job_service.update_job_status_async(db, job_id, user_id, new_status)
+
+
 @router.get("/jobs/", response_model=List[JobOut])
 async def read_jobs(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    current_user: DBUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if cursor and skip:
+        raise HTTPException(status_code=400, detail="Use either skip or cursor")
+    try:
+        jobs = await job_service.get_job_rows_async(
+            db, int(current_user.id), skip=skip, limit=limit, cursor=cursor
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    next_cursor = job_service.JOB_ORDER.next_cursor(jobs, limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return json_list(JOB_LIST, [job._asdict() for job in jobs], headers=headers)
+
+
+@router.get("/jobs/search", response_model=List[JobSearchHit])
+async def search_jobs(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
     current_user: DBUser = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    jobs = job_service.get_jobs(db, int(current_user.id), skip=skip, limit=limit)
-    return jobs
+    return await job_search.search_jobs_async(db, int(current_user.id), q, limit=limit)
 
 
 @router.post("/jobs/{job_id}/save", status_code=status.HTTP_200_OK)
 async def save_job(
     job_id: int,
     current_user: DBUser = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    db_job = job_service.update_job_status(db, job_id, int(current_user.id), "saved")
+    db_job = await _update_status(db, job_id, int(current_user.id), "saved")
     if not db_job:
         raise HTTPException(status_code=404, detail="Job not found or not authorized")
     return {"message": "Job saved successfully"}
@@ -37,9 +74,9 @@ async def save_job(
 async def apply_job(
     job_id: int,
     current_user: DBUser = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    db_job = job_service.update_job_status(db, job_id, int(current_user.id), "applied")
+    db_job = await _update_status(db, job_id, int(current_user.id), "applied")
     if not db_job:
         raise HTTPException(status_code=404, detail="Job not found or not authorized")
     return {"message": "Job marked as applied"}
@@ -49,9 +86,9 @@ async def apply_job(
 async def hide_job(
     job_id: int,
     current_user: DBUser = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    db_job = job_service.update_job_status(db, job_id, int(current_user.id), "hidden")
+    db_job = await _update_status(db, job_id, int(current_user.id), "hidden")
     if not db_job:
         raise HTTPException(status_code=404, detail="Job not found or not authorized")
     return {"message": "Job hidden successfully"}
@@ -1,3 +1,4 @@
+from functools import partial
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
@@ -5,6 +6,7 @@ from typing import List
 from ..models.database import get_db
 from ..models.user import User
 from ..schemas.job_application import KeywordBase, KeywordOut
+from ..services.group_commit import group_writer
 from ..services.keyword_service import KeywordService
 from ..middleware.auth import get_current_user
 
@@ -23,6 +25,11 @@ def create_keyword(
     db_keyword = keyword_service.get_keyword_by_term(db, term=keyword.term)
     if db_keyword:
         raise HTTPException(status_code=400, detail="Keyword already registered")
+    if group_writer.enabled:
+        add_keyword = partial(
+            keyword_service.add_keyword, term=keyword.term, user_id=int(current_user.id)
+        )
+        return group_writer.submit(add_keyword).result()
     return keyword_service.create_keyword(
         db=db, term=keyword.term, user_id=int(current_user.id)
     )
@@ -0,0 +1,39 @@
+"""
+JSON responses for the list endpoints, serialized by pydantic-core.
+
+When a route returns models, FastAPI validates them against
+``response_model``, dumps them back to Python objects, walks those again in
+``jsonable_encoder`` and then encodes the result with the stdlib ``json``
+module. For a page of a thousand rows that takes most of the request.
+Here each row is validated once by a ``TypeAdapter`` built at import and
+written straight to JSON bytes. A route returning a ``Response`` keeps its
+``response_model`` for the OpenAPI schema; FastAPI skips it at runtime.
+"""
+
+from typing import Iterable, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_list(
+    adapter: TypeAdapter,
+    items: Iterable,
+    *,
+    from_attributes: bool = False,
+    headers: Optional[dict] = None,
+) -> Response:
+    """
+    Validate ``items`` with ``adapter`` and serialize them to a JSON response.
+
+    ``items`` are dicts, such as Core rows from ``Row._asdict()``, or ORM
+    objects when ``from_attributes`` is set. Reading plain dicts is the
+    faster path; validating by attribute access pays a Python ``getattr``
+    per field.
+    """
+    validated = adapter.validate_python(items, from_attributes=from_attributes)
+    return Response(
+        content=adapter.dump_json(validated),
+        media_type="application/json",
+        headers=headers,
+    )
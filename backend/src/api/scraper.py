@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from ..models.database import get_db
+from ..schemas.scrape_run import ScraperStatus
+from ..services.scheduler import scrape_scheduler
+
+router = APIRouter()
+
+
+@router.get("/scraper/status", response_model=ScraperStatus)
+def read_scraper_status(db: Session = Depends(get_db)):
+    return scrape_scheduler.status(db)
+
+
+@router.post("/scraper/run", status_code=status.HTTP_202_ACCEPTED)
+async def trigger_scrape():
+    if not scrape_scheduler.enabled:
+        raise HTTPException(status_code=409, detail="Scheduled scraping is disabled")
+    scrape_scheduler.trigger()
+    return {"message": "Scrape scheduled"}
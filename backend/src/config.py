@@ -1,12 +1,56 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
-    DATABASE_URL: str = "sqlite:////app/backend/sql_app.db"
+    DATABASE_URL: str = "sqlite:///./sql_app.db"
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_SPLIT_READS: bool = True
+    DATABASE_GROUP_COMMIT: bool = False
+    DATABASE_GROUP_COMMIT_MAX_BATCH: int = 64
+    DATABASE_GROUP_COMMIT_MAX_DELAY_MS: float = 5.0
+    DATABASE_REPEATED_QUERY_THRESHOLD: int = 10
+    SQLITE_JOURNAL_MODE: Literal["DELETE", "TRUNCATE", "PERSIST", "WAL"] = "WAL"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE: int = -64000  # negative values are KiB, so 64 MiB
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
     SECRET_KEY: str = "super-secret-key"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_HASH_WORKERS: int = 2
+    AUTH_HASH_MAX_PENDING: int = 16
+    AUTH_RATE_LIMIT_PER_MINUTE: float = 10.0
+    AUTH_RATE_LIMIT_BURST: int = 5
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_REQUEST_SAMPLE_RATE: float = 1.0
+    LOG_SLOW_REQUEST_SECONDS: float = 1.0
     VERIFIED_JOB_BOARDS: list[str] = ["LinkedIn", "Indeed", "Dice"]
+    SCRAPER_MAX_CONCURRENCY_PER_HOST: int = 2
+    SCRAPER_REQUEST_TIMEOUT: float = 15.0
+    SCRAPER_CONNECT_TIMEOUT: float = 5.0
+    SCRAPER_POOL_CONNECTIONS: int = 10
+    SCRAPER_POOL_MAXSIZE: int = 4
+    SCRAPER_HOST_POOL_SIZES: dict[str, int] = {}
+    SCRAPER_KEEPALIVE_EXPIRY: float = 30.0
+    SCRAPER_MAX_RETRIES: int = 2
+    SCRAPER_RETRY_BACKOFF: float = 0.5
+    SCRAPER_RETRY_MAX_BACKOFF: float = 30.0
+    SCRAPER_PARSE_WORKERS: int = 0
+    SCRAPER_PARSE_QUEUE_SIZE: int = 16
+    SCRAPER_ENABLED: bool = True
+    SCRAPE_INTERVAL_MINUTES: int = 360
+    SCRAPE_ON_STARTUP: bool = True
+    SCRAPER_CACHE_ENABLED: bool = True
+    SCRAPER_CACHE_PATH: str = "scraper_cache.db"
+    SCRAPER_CACHE_TTL_SECONDS: int = 3600
+    SCRAPER_CACHE_MAX_ENTRIES: int = 5000
 
     class Config:
         env_file = ".env"
@@ -1,21 +1,21 @@
+import asyncio
 import logging
 from fastapi import FastAPI, Request, HTTPException, status, Depends
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from .middleware.auth import get_current_user
-import time
 import os
 from pythonjsonlogger import jsonlogger
 
-from .api import auth, applications, jobs, keywords
-from .models.database import Base, engine, SessionLocal  # Import SessionLocal
+from .api import auth, applications, jobs, keywords, scraper
+from .models.database import async_engine, async_read_engine, engine
+from .models.migrations import migrate
 from .middleware.metrics import MetricsMiddleware, metrics_endpoint
-from .services.scraper import scrape_all_jobs  # Import scrape_all_jobs
-from .models.user import User  # Import User model
-from .services.auth_service import (
-    AuthService,
-    get_password_hash,
-)  # Import AuthService for user creation
+from .middleware.query_stats import QueryStatsMiddleware
+from .middleware.request_log import LogQueue, RequestLogMiddleware
+from .services.group_commit import group_writer
+from .services.password_hasher import password_hasher
+from .services.scheduler import scrape_scheduler
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -23,34 +23,32 @@ logger.setLevel(logging.INFO)
 handler = logging.StreamHandler()
 formatter = jsonlogger.JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s")
 handler.setFormatter(formatter)
-logger.addHandler(handler)
+# Records are formatted and written by a background thread, not the event loop
+log_queue = LogQueue([handler])
+logger.addHandler(log_queue.handler)
 
 app = FastAPI()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 
 @app.on_event("startup")
 async def startup_event():
-    logger.info("Running startup event: Scraping jobs...")
-    db = SessionLocal()
-    try:
-        # Find the first user or create a placeholder user if none exists
-        user = db.query(User).first()
-        if not user:
-            logger.info("No user found, creating a placeholder user for scraping.")
-            auth_service = AuthService()
-            user = auth_service.register_user(
-                db, "scraper_user", "scraper@example.com", "scraper_password"
-            )
-
-        scrape_all_jobs(db, user.id)
-        logger.info("Job scraping completed on startup.")
-    except Exception as e:
-        logger.error(f"Error during job scraping on startup: {e}")
-    finally:
-        db.close()
+    log_queue.start()
+    # Bring the database schema up to date before serving requests
+    version = await asyncio.to_thread(migrate, engine)
+    logger.info(f"Database schema at version {version}")
+    # Scraping runs in the background so the API accepts traffic immediately
+    logger.info("Starting background job scrape scheduler...")
+    scrape_scheduler.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await scrape_scheduler.stop()
+    await asyncio.to_thread(group_writer.stop)
+    await asyncio.to_thread(password_hasher.shutdown)
+    await async_engine.dispose()
+    await async_read_engine.dispose()
+    log_queue.stop()
 
 
 # Configure CORS
@@ -65,10 +63,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets browser clients read the keyset pagination cursor
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Add metrics middleware
 app.add_middleware(MetricsMiddleware)
+app.add_middleware(QueryStatsMiddleware, logger=logger)
+app.add_middleware(RequestLogMiddleware, logger=logger)
 
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
@@ -90,6 +92,12 @@ app.include_router(
     tags=["keywords"],
     dependencies=[Depends(get_current_user)],
 )
+app.include_router(
+    scraper.router,
+    prefix="/api",
+    tags=["scraper"],
+    dependencies=[Depends(get_current_user)],
+)
 
 
 @app.get("/metrics")
@@ -97,24 +105,6 @@ async def get_metrics(request: Request):
     return await metrics_endpoint(request)
 
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    logger.info(
-        "Request processed",
-        extra={
-            "method": request.method,
-            "url": str(request.url),
-            "process_time": f"{process_time:.4f}s",
-            "status_code": response.status_code,
-        },
-    )
-    return response
-
-
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     logger.error(
@@ -129,6 +119,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     return JSONResponse(
         status_code=exc.status_code,
         content={"message": exc.detail},
+        headers=exc.headers,
     )
 
 
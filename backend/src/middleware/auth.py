@@ -1,16 +1,18 @@
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from jwt import PyJWTError, decode
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..config import settings as config_settings
-from ..models.database import get_db
+from ..models.database import get_async_db
 from ..models.user import User
+from ..services.principal_cache import principal_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+async def get_current_user(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)
 ):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -26,7 +28,14 @@ def get_current_user(
             raise credentials_exception
     except PyJWTError:
         raise credentials_exception
-    user = db.query(User).filter(User.username == username).first()
+    # Routers that also declare this dependency at include_router reuse the
+    # per-request result, so a request resolves its user at most once
+    user = principal_cache.get(username)
+    if user is not None:
+        return user
+    result = await db.scalars(select(User).filter(User.username == username).limit(1))
+    user = result.first()
     if user is None:
         raise credentials_exception
+    principal_cache.put(username, user)
     return user
@@ -1,7 +1,8 @@
-from prometheus_client import generate_latest, Counter, Histogram
-from starlette.middleware.base import BaseHTTPMiddleware
+from time import perf_counter
+
+from prometheus_client import generate_latest, Counter, Gauge, Histogram
 from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 REQUESTS_TOTAL = Counter(
     "http_requests_total", "Total HTTP requests", ["method", "endpoint", "status_code"]
@@ -9,23 +10,75 @@ REQUESTS_TOTAL = Counter(
 REQUEST_LATENCY = Histogram(
     "http_request_duration_seconds", "HTTP request latency", ["method", "endpoint"]
 )
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests being served", ["method"]
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size",
+    ["method", "endpoint"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+
+# Label for requests no route matched, so stray paths share one series
+UNMATCHED_ENDPOINT = "<unmatched>"
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+def route_template(scope: Scope) -> str:
+    """
+    The route template the router matched, such as
+    ``/api/applications/{application_id}``. Labelling by the raw path would
+    create a series per id and grow /metrics without bound.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ENDPOINT)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request counts, latency, in-flight requests
+    and response sizes. Unlike ``BaseHTTPMiddleware`` it adds no task or
+    stream per request; it only wraps ``send`` to observe the status code and
+    body bytes on their way out.
+    """
+
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request, call_next):
-        method = request.method
-        endpoint = request.url.path
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
 
-        with REQUEST_LATENCY.labels(method=method, endpoint=endpoint).time():
-            response = await call_next(request)
+        async def send_wrapper(message: Message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
 
-        REQUESTS_TOTAL.labels(
-            method=method, endpoint=endpoint, status_code=response.status_code
-        ).inc()
-        return response
+        in_progress = REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = perf_counter() - start
+            in_progress.dec()
+            # Routing has run by now and left the matched route in the scope
+            endpoint = route_template(scope)
+            REQUEST_LATENCY.labels(method=method, endpoint=endpoint).observe(duration)
+            RESPONSE_SIZE.labels(method=method, endpoint=endpoint).observe(
+                response_size
+            )
+            REQUESTS_TOTAL.labels(
+                method=method, endpoint=endpoint, status_code=status_code
+            ).inc()
 
 
 async def metrics_endpoint(request):
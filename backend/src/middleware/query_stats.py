@@ -0,0 +1,165 @@
+"""
+Per-request SQL query counts and database time.
+
+Cursor-execute hooks on every ``Engine`` add each statement to the
+``QueryStats`` of the request being served, found through a context
+variable. Sync endpoints run in the threadpool with a copy of the request's
+context, and async sessions execute in greenlets of the request's task, so
+both are attributed to the right request. Writes handed to the group-commit
+thread run outside any request and are not counted.
+"""
+
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Iterator, Optional
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import settings
+from .metrics import route_template
+
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per HTTP request",
+    ["method", "endpoint"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_duration_seconds",
+    "Time per HTTP request spent executing SQL statements",
+    ["method", "endpoint"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+
+class QueryStats:
+    """Statements executed, time spent in them and how often each one ran."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements run ``threshold`` times or more, the usual N+1 sign."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+    def server_timing(self) -> str:
+        queries = "query" if self.count == 1 else "queries"
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.count} {queries}"'
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+# Stats that see every statement, from any thread; used by tests
+_captures: list[QueryStats] = []
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements executed in this context, e.g. one request."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """Count every statement any engine executes, in any thread or request."""
+    stats = QueryStats()
+    _captures.append(stats)
+    try:
+        yield stats
+    finally:
+        _captures.remove(stats)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if _captures or _current.get() is not None:
+        conn.info["query_started_at"] = perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    started_at = conn.info.pop("query_started_at", None)
+    if started_at is None:
+        return
+    seconds = perf_counter() - started_at
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+    for capture in _captures:
+        capture.record(statement, seconds)
+
+
+class QueryStatsMiddleware:
+    """
+    Pure ASGI middleware that counts each request's SQL statements.
+
+    The count and database time go out in a ``Server-Timing`` header and
+    into per-route Prometheus histograms. A statement repeated
+    ``repeat_threshold`` times within one request is logged as a likely N+1
+    query.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger: logging.Logger,
+        repeat_threshold: Optional[int] = None,
+    ):
+        self.app = app
+        self.logger = logger
+        self.repeat_threshold = (
+            settings.DATABASE_REPEATED_QUERY_THRESHOLD
+            if repeat_threshold is None
+            else repeat_threshold
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message):
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                self._record(scope, stats)
+
+    def _record(self, scope: Scope, stats: QueryStats) -> None:
+        labels = {"method": scope["method"], "endpoint": route_template(scope)}
+        REQUEST_QUERIES.labels(**labels).observe(stats.count)
+        REQUEST_DB_SECONDS.labels(**labels).observe(stats.seconds)
+        for statement, count in stats.repeated(self.repeat_threshold):
+            self.logger.warning(
+                "Repeated query",
+                extra={**labels, "count": count, "statement": statement},
+            )
@@ -0,0 +1,67 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from fastapi import HTTPException, Request, status
+
+from ..config import settings
+
+
+class RateLimiter:
+    """
+    Token bucket per key: ``burst`` requests at once, refilled at
+    ``per_minute``. Only the ``max_keys`` most recently seen keys are
+    tracked, so a flood of distinct clients cannot grow it without bound.
+    """
+
+    def __init__(
+        self,
+        per_minute: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_keys: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.per_minute = (
+            settings.AUTH_RATE_LIMIT_PER_MINUTE if per_minute is None else per_minute
+        )
+        self.burst = settings.AUTH_RATE_LIMIT_BURST if burst is None else burst
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: OrderedDict[tuple, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: tuple) -> float:
+        """Take a token for ``key``; return 0, or the seconds until one is free."""
+        if self.per_minute <= 0:
+            return 0.0
+        rate = self.per_minute / 60
+        now = self._clock()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * rate)
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+auth_rate_limiter = RateLimiter()
+
+
+async def limit_auth_requests(request: Request) -> None:
+    """Per-client rate limit for the login and register endpoints."""
+    client = request.client.host if request.client else "unknown"
+    wait = auth_rate_limiter.acquire((client, request.url.path))
+    if wait:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
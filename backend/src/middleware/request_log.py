@@ -0,0 +1,142 @@
+"""
+Request logging that keeps formatting and I/O off the event loop.
+
+Records go through a ``QueueHandler`` into a bounded queue. A
+``QueueListener`` thread formats them and writes them to the real handlers.
+The request path pays only for building the record and enqueuing it.
+Successful requests can be sampled, while errors and slow requests are
+always logged.
+"""
+
+import logging
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
+from time import perf_counter
+from typing import Callable, Iterable, Optional
+
+from starlette.datastructures import URL, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import settings
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Counts and drops records once the queue is full instead of blocking."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener lives in this process, so the record needs no copy or
+        # pre-formatting; merging the args is enough to freeze the message.
+        # exc_info is kept for the output formatter to render.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogQueue:
+    """
+    A bounded queue between the loggers and ``handlers``. Attach ``handler``
+    to a logger and records are written by a background thread between
+    ``start()`` and ``stop()``; ``stop()`` flushes what is still queued.
+    """
+
+    def __init__(
+        self, handlers: Iterable[logging.Handler], maxsize: Optional[int] = None
+    ):
+        if maxsize is None:
+            maxsize = settings.LOG_QUEUE_SIZE
+        self.handler = _DroppingQueueHandler(queue.Queue(maxsize))
+        self._listener = QueueListener(
+            self.handler.queue, *handlers, respect_handler_level=True
+        )
+        self._running = False
+
+    def start(self):
+        if not self._running:
+            self._listener.start()
+            self._running = True
+
+    def stop(self):
+        if self._running:
+            self._listener.stop()
+            self._running = False
+
+    @property
+    def dropped(self) -> int:
+        return self.handler.dropped
+
+
+class RequestLogMiddleware:
+    """
+    Pure ASGI middleware that sets ``X-Process-Time`` on every response and
+    logs one "Request processed" record per request.
+
+    A request is always logged if it fails (status 400 or above, or an
+    exception) or takes ``slow_seconds`` or longer. Otherwise it is logged
+    with probability ``sample_rate``. Timing uses the monotonic
+    ``perf_counter``, so wall-clock adjustments cannot skew durations.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger: logging.Logger,
+        sample_rate: Optional[float] = None,
+        slow_seconds: Optional[float] = None,
+        sample: Callable[[], float] = random.random,
+    ):
+        self.app = app
+        self.logger = logger
+        self.sample_rate = (
+            settings.LOG_REQUEST_SAMPLE_RATE if sample_rate is None else sample_rate
+        )
+        self.slow_seconds = (
+            settings.LOG_SLOW_REQUEST_SECONDS if slow_seconds is None else slow_seconds
+        )
+        self._sample = sample
+
+    def _should_log(self, status_code: int, process_time: float) -> bool:
+        if status_code >= 400 or process_time >= self.slow_seconds:
+            return True
+        return self.sample_rate >= 1 or self._sample() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", str(perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            process_time = perf_counter() - start
+            if self._should_log(status_code, process_time):
+                self.logger.info(
+                    "Request processed",
+                    extra={
+                        "method": scope["method"],
+                        "url": str(URL(scope=scope)),
+                        "process_time": f"{process_time:.4f}s",
+                        "status_code": status_code,
+                    },
+                )
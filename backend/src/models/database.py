@@ -1,19 +1,243 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import asyncio
+import contextlib
 
-# SQLite database URL. The /// means it's a relative path to the current directory.
-# You can change this to other database URLs (e.g., PostgreSQL, MySQL) as needed.
-DATABASE_URL = "sqlite:///./sql_app.db"
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.sql.dml import UpdateBase
+from ..config import Settings, settings
 
-# Create the SQLAlchemy engine
-# The connect_args is specific to SQLite for handling concurrent requests
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Drivers used for the async engine when DATABASE_URL names none
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_database_url(url: str) -> str:
+    """The same database through an asyncio driver, e.g. aiosqlite for SQLite."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if parsed.drivername != backend or backend not in _ASYNC_DRIVERS:
+        return url
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(
+        hide_password=False
+    )
+
+
+def sqlite_read_only_url(url: str) -> str | None:
+    """``url`` opened read-only, or None if it is not a SQLite database file."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite" or _is_sqlite_memory(parsed):
+        return None
+    database = parsed.database
+    if not database.startswith("file:"):
+        database = f"file:{database}"
+    query = {**parsed.query, "mode": "ro", "uri": "true"}
+    return parsed.set(database=database, query=query).render_as_string(
+        hide_password=False
+    )
+
+
+def sqlite_pragmas(config: Settings = settings) -> dict:
+    """PRAGMAs run on every new SQLite connection, in order."""
+    return {
+        "journal_mode": config.SQLITE_JOURNAL_MODE,
+        "synchronous": config.SQLITE_SYNCHRONOUS,
+        "mmap_size": config.SQLITE_MMAP_SIZE,
+        "cache_size": config.SQLITE_CACHE_SIZE,
+        "busy_timeout": config.SQLITE_BUSY_TIMEOUT_MS,
+    }
+
+
+def _is_sqlite_memory(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def _engine_options(
+    url: URL, config: Settings, pool_size: int | None, max_overflow: int | None
+) -> dict:
+    options = {}
+    if url.get_backend_name() == "sqlite":
+        # Sessions are handed between threadpool workers and the event loop
+        options["connect_args"] = {"check_same_thread": False}
+        if _is_sqlite_memory(url):
+            # In-memory databases live on a single connection: no pool to size
+            return options
+    options.update(
+        pool_size=config.DATABASE_POOL_SIZE if pool_size is None else pool_size,
+        max_overflow=(
+            config.DATABASE_MAX_OVERFLOW if max_overflow is None else max_overflow
+        ),
+        pool_timeout=config.DATABASE_POOL_TIMEOUT,
+        pool_recycle=config.DATABASE_POOL_RECYCLE,
+    )
+    return options
+
+
+def _pragmas_for(url: URL, config: Settings) -> dict:
+    pragmas = sqlite_pragmas(config)
+    if url.query.get("mode") == "ro":
+        # Readers cannot switch the journal; the writer puts the file in WAL
+        del pragmas["journal_mode"]
+    return pragmas
+
+
+def _set_pragmas_on_connect(engine: Engine, pragmas: dict) -> None:
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                # Names and values come from Settings, never from requests
+                cursor.execute(f"PRAGMA {name}={value}")  # nosec
+        finally:
+            cursor.close()
+
+
+def create_db_engine(
+    url: str | None = None,
+    config: Settings = settings,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+) -> Engine:
+    """
+    Build the engine for ``url`` (default ``config.DATABASE_URL``).
+
+    Pool size, overflow, timeout and recycle come from ``config`` unless
+    overridden; SQLite connections also get the ``sqlite_pragmas`` tuning as
+    they are opened.
+    """
+    parsed = make_url(url or config.DATABASE_URL)
+    engine = create_engine(
+        parsed, **_engine_options(parsed, config, pool_size, max_overflow)
+    )
+    if parsed.get_backend_name() == "sqlite":
+        _set_pragmas_on_connect(engine, _pragmas_for(parsed, config))
+    return engine
+
+
+def create_async_db_engine(
+    url: str | None = None,
+    config: Settings = settings,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+) -> AsyncEngine:
+    """``create_db_engine`` for the async driver of the same database."""
+    parsed = make_url(async_database_url(url or config.DATABASE_URL))
+    engine = create_async_engine(
+        parsed, **_engine_options(parsed, config, pool_size, max_overflow)
+    )
+    if parsed.get_backend_name() == "sqlite":
+        _set_pragmas_on_connect(engine.sync_engine, _pragmas_for(parsed, config))
+    return engine
+
+
+def _split_urls(url: str | None, config: Settings) -> tuple[str, str | None]:
+    url = url or config.DATABASE_URL
+    return url, sqlite_read_only_url(url) if config.DATABASE_SPLIT_READS else None
+
+
+def create_engine_pair(
+    url: str | None = None, config: Settings = settings
+) -> tuple[Engine, Engine]:
+    """
+    Writer and reader engines for the database at ``url``.
+
+    For a SQLite file, readers get their own pool of ``mode=ro`` connections
+    and the writer a single connection, so writes queue in the pool instead
+    of contending for the database lock while WAL lets reads run alongside
+    them. Other databases, or DATABASE_SPLIT_READS=false, share one engine.
+    """
+    url, read_url = _split_urls(url, config)
+    if read_url is None:
+        engine = create_db_engine(url, config)
+        return engine, engine
+    writer = create_db_engine(url, config, pool_size=1, max_overflow=0)
+    return writer, create_db_engine(read_url, config)
+
+
+def create_async_engine_pair(
+    url: str | None = None, config: Settings = settings
+) -> tuple[AsyncEngine, AsyncEngine]:
+    """``create_engine_pair`` for the async driver of the same database."""
+    url, read_url = _split_urls(url, config)
+    if read_url is None:
+        engine = create_async_db_engine(url, config)
+        return engine, engine
+    writer = create_async_db_engine(url, config, pool_size=1, max_overflow=0)
+    return writer, create_async_db_engine(read_url, config)
+
+
+class RoutingSession(Session):
+    """
+    Session that reads through ``reader`` and writes through ``writer``.
+
+    Flushes and INSERT/UPDATE/DELETE statements go to the writer. Once a
+    transaction has written, its later reads use the writer too, so they see
+    its own uncommitted changes; all other queries run on a reader.
+    """
+
+    def __init__(self, *args, reader: Engine, writer: Engine, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reader = reader
+        self.writer = writer
+        self.writing = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.writing = True
+        return self.writer if self.writing else self.reader
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _route_next_transaction_to_readers(session, transaction):
+    if transaction.parent is None:
+        session.writing = False
+
+
+# Database URL from Settings. For SQLite, /// means a path relative to the
+# current directory. Any SQLAlchemy URL (e.g. PostgreSQL) works here.
+DATABASE_URL = settings.DATABASE_URL
+
+# The same database through the async driver, for async request handlers
+ASYNC_DATABASE_URL = async_database_url(DATABASE_URL)
+
+# Create the SQLAlchemy engines. `engine` is the writer, used for DDL too;
+# `read_engine` serves queries and may be the same engine
+engine, read_engine = create_engine_pair(DATABASE_URL)
 
 # Create a SessionLocal class
 # Each instance of SessionLocal will be a database session
 # The autocommit=False means that you'll have to explicitly commit transactions
 # The autoflush=False prevents the session from flushing changes to the DB after every query
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    reader=read_engine,
+    writer=engine,
+)
+
+# Async engines and sessions. aiosqlite runs each connection on its own thread,
+# so queries are awaited instead of blocking the event loop. Objects stay
+# loaded after commit because lazy loads cannot run outside the session.
+async_engine, async_read_engine = create_async_engine_pair(DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    reader=async_read_engine.sync_engine,
+    writer=async_engine.sync_engine,
+)
 
 # Create the Base class for declarative models
 # All your SQLAlchemy models will inherit from this Base
@@ -27,3 +251,28 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def to_session_thread(func, *args):
+    """
+    ``asyncio.to_thread`` for blocking work on a Session.
+
+    Sessions are not thread-safe, so a cancelled caller waits for the thread
+    to finish before the cancellation propagates; cleanup can then roll back
+    or close the session without racing the work still using it.
+    """
+    work = asyncio.ensure_future(asyncio.to_thread(func, *args))
+    try:
+        return await asyncio.shield(work)
+    except asyncio.CancelledError:
+        while not work.done():
+            # A repeated cancel must not cut the wait short either
+            with contextlib.suppress(asyncio.CancelledError):
+                await asyncio.wait([work])
+        raise
+
+
+# Async dependency for `async def` endpoints
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
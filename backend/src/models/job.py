@@ -1,16 +1,56 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from sqlalchemy import DDL, Column, Integer, String, ForeignKey, Table, Index, event
 from sqlalchemy.orm import relationship
 from .database import Base
 
+# Query parameters that vary between visits to the same posting
+_TRACKING_PARAMS = {"refid", "trackingid", "trk", "from", "vjs", "tk"}
+
 # Association table for many-to-many relationship between jobs and keywords
 job_keywords_association = Table(
     "job_keywords_association",
     Base.metadata,
     Column("job_id", Integer, ForeignKey("jobs.id"), primary_key=True),
     Column("keyword_id", Integer, ForeignKey("keywords.id"), primary_key=True),
+    # The primary key serves job -> keywords; this serves keyword -> jobs
+    Index("ix_job_keywords_keyword_job", "keyword_id", "job_id"),
 )
 
 
+def _normalize_text(value) -> str:
+    return " ".join(str(value or "").split()).casefold()
+
+
+def _normalize_link(link) -> str:
+    parts = urlsplit(str(link or "").strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith("utm_")
+    )
+    host = parts.netloc.lower().removeprefix("www.")
+    return urlunsplit(
+        (parts.scheme.lower(), host, parts.path.rstrip("/"), urlencode(query), "")
+    )
+
+
+def job_fingerprint(job_data: dict) -> str:
+    """Stable identity of a posting: hash of its normalized link, title and company."""
+    key = "\x1f".join(
+        [
+            _normalize_link(job_data.get("application_link")),
+            _normalize_text(job_data.get("title")),
+            _normalize_text(job_data.get("company")),
+        ]
+    )
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=20).hexdigest()
+
+
+def _fingerprint_default(context) -> str:
+    return job_fingerprint(context.get_current_parameters())
+
+
 class Job(Base):
     __tablename__ = "jobs"
 
@@ -22,10 +62,51 @@ class Job(Base):
     salary = Column(String, nullable=True)
     status = Column(String, default="new")
     user_id = Column(Integer, ForeignKey("users.id"))
+    fingerprint = Column(String(40), nullable=True, default=_fingerprint_default)
 
     keywords = relationship(
         "Keyword", secondary=job_keywords_association, back_populates="jobs"
     )
 
+    # Persistent dedup index: a posting is stored once per user across scrapes
+    __table_args__ = (
+        Index("uq_jobs_user_fingerprint", "user_id", "fingerprint", unique=True),
+        Index("ix_jobs_user_status", "user_id", "status"),
+        Index("ix_jobs_user_id", "user_id", "id"),
+    )
+
     def __repr__(self):
         return f"<Job(title='{self.title}', company='{self.company}')>"
+
+
+# Full-text index over the scraped text of jobs. It is an external-content
+# FTS5 table: it stores only the index and reads rows back from jobs, and the
+# triggers keep it in step with every insert, upsert and delete. Status
+# changes do not touch the indexed columns, so they skip the index.
+JOB_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+    "title, company, description, content='jobs', content_rowid='id',"
+    " tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN"
+    " INSERT INTO jobs_fts (rowid, title, company, description)"
+    " VALUES (new.id, new.title, new.company, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN"
+    " INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)"
+    " VALUES ('delete', old.id, old.title, old.company, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_update"
+    " AFTER UPDATE OF title, company, description ON jobs BEGIN"
+    " INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)"
+    " VALUES ('delete', old.id, old.title, old.company, old.description);"
+    " INSERT INTO jobs_fts (rowid, title, company, description)"
+    " VALUES (new.id, new.title, new.company, new.description); END",
+]
+
+for statement in JOB_SEARCH_DDL:
+    event.listen(
+        Job.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Job.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS jobs_fts").execute_if(dialect="sqlite"),
+)
@@ -1,7 +1,22 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, Index, Table
 from sqlalchemy.orm import relationship
 from .database import Base
 
+# Association table for many-to-many relationship between applications and keywords
+job_application_keywords = Table(
+    "job_application_keywords",
+    Base.metadata,
+    Column(
+        "application_id",
+        Integer,
+        ForeignKey("job_applications.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("keyword_id", Integer, ForeignKey("keywords.id"), primary_key=True),
+    # The primary key serves application -> keywords; this serves keyword filters
+    Index("ix_job_application_keywords_keyword", "keyword_id", "application_id"),
+)
+
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
@@ -15,8 +30,15 @@ class JobApplication(Base):
     job_board = Column(String)
     url = Column(String)
     notes = Column(Text)
-    keywords = Column(
-        String
-    )  # Storing as String for now, could be improved with array type or separate table
 
     user = relationship("User", back_populates="applications")
+    keywords = relationship(
+        "Keyword", secondary=job_application_keywords, back_populates="applications"
+    )
+
+    # Applications are always listed per user, often filtered by one of these
+    __table_args__ = (
+        Index("ix_job_applications_user_status", "user_id", "status"),
+        Index("ix_job_applications_user_job_board", "user_id", "job_board"),
+        Index("ix_job_applications_user_id", "user_id", "id"),
+    )
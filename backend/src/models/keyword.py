@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 from .database import Base
 from .job import job_keywords_association
+from .job_application import job_application_keywords
 from .user import User
 
 
@@ -10,11 +11,16 @@ class Keyword(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     term = Column(String, unique=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
 
     jobs = relationship(
         "Job", secondary=job_keywords_association, back_populates="keywords"
     )
+    applications = relationship(
+        "JobApplication",
+        secondary=job_application_keywords,
+        back_populates="keywords",
+    )
     user = relationship("User", back_populates="keywords")
 
     def __repr__(self):
@@ -0,0 +1,223 @@
+"""
+Versioned schema migrations.
+
+The ``schema_version`` table records every migration applied to a database.
+``migrate`` runs the missing ones in order, each in its own transaction, so
+a database created by any earlier release is brought up to the current
+schema. Migrations must be idempotent: on a fresh database the first one
+creates every table and index from the models, and the later ones find
+their work already done.
+
+Run ``python -m src.models.migrations`` to migrate without starting the API.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.engine import Connection, Engine
+
+from . import job_application, keyword, scrape_run, user  # Register every table
+from .database import Base, engine
+from .job import JOB_SEARCH_DDL, Job, job_fingerprint
+from .job_application import job_application_keywords
+
+logger = logging.getLogger(__name__)
+
+# Kept out of Base.metadata: create_all must not create it by side effect
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+def _has_column(conn: Connection, table: str, column: str) -> bool:
+    return column in {c["name"] for c in inspect(conn).get_columns(table)}
+
+
+def _create_tables(conn: Connection) -> None:
+    Base.metadata.create_all(conn)
+
+
+def _add_owner_and_fingerprint_columns(conn: Connection) -> None:
+    if not _has_column(conn, "keywords", "user_id"):
+        conn.execute(
+            text(
+                "ALTER TABLE keywords ADD COLUMN user_id INTEGER REFERENCES users (id)"
+            )
+        )
+    if not _has_column(conn, "jobs", "fingerprint"):
+        conn.execute(text("ALTER TABLE jobs ADD COLUMN fingerprint VARCHAR(40)"))
+
+    # Backfill the first row of each posting; repeats stored before the dedup
+    # index existed keep a NULL fingerprint so the unique index can be built
+    rows = conn.execute(
+        select(
+            Job.id, Job.user_id, Job.application_link, Job.title, Job.company
+        ).order_by(Job.id)
+    ).mappings()
+    seen = set()
+    updates = []
+    for row in rows:
+        key = (row["user_id"], job_fingerprint(row))
+        if key not in seen:
+            seen.add(key)
+            updates.append({"job_id": row["id"], "fingerprint": key[1]})
+    if updates:
+        conn.execute(
+            text(
+                "UPDATE jobs SET fingerprint = :fingerprint"
+                " WHERE id = :job_id AND fingerprint IS NULL"
+            ),
+            updates,
+        )
+    conn.execute(
+        text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_jobs_user_fingerprint"
+            " ON jobs (user_id, fingerprint)"
+        )
+    )
+
+
+def _add_query_indexes(conn: Connection) -> None:
+    for statement in (
+        "CREATE INDEX IF NOT EXISTS ix_jobs_user_status ON jobs (user_id, status)",
+        "CREATE INDEX IF NOT EXISTS ix_job_applications_user_status"
+        " ON job_applications (user_id, status)",
+        "CREATE INDEX IF NOT EXISTS ix_job_applications_user_job_board"
+        " ON job_applications (user_id, job_board)",
+        "CREATE INDEX IF NOT EXISTS ix_job_keywords_keyword_job"
+        " ON job_keywords_association (keyword_id, job_id)",
+        "CREATE INDEX IF NOT EXISTS ix_keywords_user_id ON keywords (user_id)",
+    ):
+        conn.execute(text(statement))
+
+
+def _add_pagination_indexes(conn: Connection) -> None:
+    for statement in (
+        "CREATE INDEX IF NOT EXISTS ix_jobs_user_id ON jobs (user_id, id)",
+        "CREATE INDEX IF NOT EXISTS ix_job_applications_user_id"
+        " ON job_applications (user_id, id)",
+    ):
+        conn.execute(text(statement))
+
+
+def _add_job_search_index(conn: Connection) -> None:
+    if conn.dialect.name != "sqlite":
+        return
+    for statement in JOB_SEARCH_DDL:
+        conn.execute(text(statement))
+    # Index the jobs stored before the triggers existed
+    conn.execute(text("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')"))
+
+
+def _move_application_keywords_to_table(conn: Connection) -> None:
+    job_application_keywords.create(conn, checkfirst=True)
+    if not _has_column(conn, "job_applications", "keywords"):
+        return
+
+    # The column held comma-separated terms; link each to its keyword row
+    rows = conn.execute(
+        text(
+            "SELECT id, user_id, keywords FROM job_applications"
+            " WHERE keywords IS NOT NULL AND keywords != ''"
+        )
+    ).all()
+    for application_id, user_id, keywords in rows:
+        for term in dict.fromkeys(t.strip() for t in keywords.split(",")):
+            if not term:
+                continue
+            keyword_id = conn.execute(
+                text("SELECT id FROM keywords WHERE term = :term"), {"term": term}
+            ).scalar()
+            if keyword_id is None:
+                keyword_id = conn.execute(
+                    text(
+                        "INSERT INTO keywords (term, user_id)"
+                        " VALUES (:term, :user_id) RETURNING id"
+                    ),
+                    {"term": term, "user_id": user_id},
+                ).scalar()
+            conn.execute(
+                job_application_keywords.insert().values(
+                    application_id=application_id, keyword_id=keyword_id
+                )
+            )
+    conn.execute(text("ALTER TABLE job_applications DROP COLUMN keywords"))
+
+
+MIGRATIONS = [
+    Migration(1, "create tables", _create_tables),
+    Migration(
+        2, "add keyword owners and job fingerprints", _add_owner_and_fingerprint_columns
+    ),
+    Migration(
+        3, "add indexes for per-user job and application queries", _add_query_indexes
+    ),
+    Migration(4, "add keyset pagination indexes", _add_pagination_indexes),
+    Migration(5, "add full-text search over jobs", _add_job_search_index),
+    Migration(
+        6,
+        "move application keywords to an association table",
+        _move_application_keywords_to_table,
+    ),
+]
+
+
+def current_version(conn: Connection) -> int:
+    if not inspect(conn).has_table(schema_version.name):
+        return 0
+    version = conn.execute(
+        select(schema_version.c.version).order_by(schema_version.c.version.desc())
+    ).scalar()
+    return version or 0
+
+
+def migrate(bind: Engine = engine) -> int:
+    """Apply every pending migration and return the resulting version."""
+    with bind.begin() as conn:
+        schema_version.create(conn, checkfirst=True)
+        version = current_version(conn)
+    for migration in MIGRATIONS:
+        if migration.version <= version:
+            continue
+        with bind.begin() as conn:
+            migration.upgrade(conn)
+            conn.execute(
+                schema_version.insert().values(
+                    version=migration.version,
+                    description=migration.description,
+                    applied_at=datetime.utcnow(),
+                )
+            )
+        logger.info(
+            f"Applied schema migration {migration.version}: {migration.description}"
+        )
+        version = migration.version
+    return version
+
+
+if __name__ == "__main__":
+    print(f"Database schema is at version {migrate()}")
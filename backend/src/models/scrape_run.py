@@ -0,0 +1,17 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from .database import Base
+
+
+class ScrapeRun(Base):
+    __tablename__ = "scrape_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+    status = Column(String, default="running")  # running, succeeded, failed, skipped
+    jobs_stored = Column(Integer, default=0)
+    error = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f"<ScrapeRun(id={self.id}, status='{self.status}')>"
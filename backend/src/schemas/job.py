@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional, List
 
 
@@ -19,5 +19,18 @@ class JobOut(JobBase):
     id: int
     user_id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Built once at import; see api/responses.py
+JOB_LIST = TypeAdapter(List[JobOut])
+
+
+class JobSearchHit(BaseModel):
+    job: JobOut
+    # bm25 score: lower is a better match
+    rank: float
+    # HTML-escaped excerpt with the matched words in <mark> tags
+    snippet: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional, List
 from datetime import date
 
@@ -10,8 +10,7 @@ class KeywordBase(BaseModel):
 class KeywordOut(KeywordBase):
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class JobApplicationBase(BaseModel):
@@ -44,5 +43,8 @@ class JobApplicationOut(JobApplicationBase):
     user_id: int
     keywords: List[KeywordOut] = Field(default_factory=list)
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Built once at import; see api/responses.py
+JOB_APPLICATION_LIST = TypeAdapter(List[JobApplicationOut])
@@ -0,0 +1,30 @@
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+
+class ScrapeRunOut(BaseModel):
+    id: int
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    status: str
+    jobs_stored: int
+    error: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PageCacheStats(BaseModel):
+    hits: int
+    misses: int
+    revalidated: int
+    entries: int
+
+
+class ScraperStatus(BaseModel):
+    enabled: bool
+    running: bool
+    interval_minutes: int
+    next_run_at: Optional[datetime] = None
+    last_run: Optional[ScrapeRunOut] = None
+    page_cache: Optional[PageCacheStats] = None
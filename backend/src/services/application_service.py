@@ -1,12 +1,16 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Optional
 from ..models.job_application import JobApplication
 from ..models.keyword import Keyword
+from .pagination import KeysetOrder
 from datetime import date
 
+# Applications are listed oldest first, seeking through ix_job_applications_user_id
+APPLICATION_ORDER = KeysetOrder((JobApplication.id,))
+
 
 class ApplicationService:
-    def create_application(
+    def add_application(
         self,
         db: Session,
         user_id: int,
@@ -18,6 +22,7 @@ class ApplicationService:
         url: Optional[str],
         notes: Optional[str],
     ):
+        """Add an application without committing, e.g. as a group-commit write."""
         db_application = JobApplication(
             user_id=user_id,
             job_title=job_title,
@@ -29,6 +34,31 @@ class ApplicationService:
             notes=notes,
         )
         db.add(db_application)
+        return db_application
+
+    def create_application(
+        self,
+        db: Session,
+        user_id: int,
+        job_title: str,
+        company: str,
+        application_date: date,
+        status: str,
+        job_board: Optional[str],
+        url: Optional[str],
+        notes: Optional[str],
+    ):
+        db_application = self.add_application(
+            db,
+            user_id=user_id,
+            job_title=job_title,
+            company=company,
+            application_date=application_date,
+            status=status,
+            job_board=job_board,
+            url=url,
+            notes=notes,
+        )
         db.commit()
         db.refresh(db_application)
         return db_application
@@ -43,8 +73,14 @@ class ApplicationService:
         company: Optional[str] = None,
         job_board: Optional[str] = None,
         keyword_terms: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
     ):
-        query = db.query(JobApplication).filter(JobApplication.user_id == user_id)
+        # All keywords of a page are fetched in one extra IN query
+        query = (
+            db.query(JobApplication)
+            .options(selectinload(JobApplication.keywords))
+            .filter(JobApplication.user_id == user_id)
+        )
 
         if status:
             query = query.filter(JobApplication.status == status)
@@ -53,10 +89,12 @@ class ApplicationService:
         if job_board:
             query = query.filter(JobApplication.job_board == job_board)
         if keyword_terms:
-            query = query.join(JobApplication.keywords).filter(
-                Keyword.term.in_(keyword_terms)
+            # EXISTS rather than a join, so matching several terms is one row
+            query = query.filter(
+                JobApplication.keywords.any(Keyword.term.in_(keyword_terms))
             )
 
+        query = APPLICATION_ORDER.apply(query, cursor)
         return query.offset(skip).limit(limit).all()
 
     def get_application(self, db: Session, application_id: int, user_id: int):
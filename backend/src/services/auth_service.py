@@ -1,17 +1,13 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from ..models.user import User
-from passlib.context import CryptContext  # For password hashing, assuming installation
-
-# For password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
-
-
-def get_password_hash(password):
-    return pwd_context.hash(password)
+from .password_hasher import (
+    get_password_hash,
+    password_hasher,
+    pwd_context,
+    verify_password,
+)
 
 
 class AuthService:
@@ -28,3 +24,24 @@ class AuthService:
         if not user or not verify_password(password, user.password_hash):
             return None
         return user
+
+    async def register_user_async(
+        self, db: AsyncSession, username: str, email: str, password: str
+    ):
+        hashed_password = await password_hasher.hash(password)
+        db_user = User(username=username, email=email, password_hash=hashed_password)
+        db.add(db_user)
+        await db.commit()
+        await db.refresh(db_user)
+        return db_user
+
+    async def authenticate_user_async(
+        self, db: AsyncSession, username: str, password: str
+    ):
+        result = await db.scalars(
+            select(User).filter(User.username == username).limit(1)
+        )
+        user = result.first()
+        if not user or not await password_hasher.verify(password, user.password_hash):
+            return None
+        return user
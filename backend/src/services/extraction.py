@@ -0,0 +1,190 @@
+import re
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup, Tag
+from bs4.filter import ElementFilter
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:  # lxml is optional, html.parser is always available
+    HTML_PARSER = "html.parser"
+
+
+def _contains_any(words, ignore_case: bool = False) -> re.Pattern:
+    flags = re.IGNORECASE if ignore_case else 0
+    return re.compile("|".join(re.escape(word) for word in words), flags)
+
+
+@dataclass(frozen=True)
+class Selector:
+    """
+    Matches a tag by name, class and attributes, like one ``Tag.find`` call.
+
+    ``class_pattern`` is searched in the tag's space-joined class list, which
+    is what BeautifulSoup's ``class_`` predicates effectively matched. An
+    attribute rule of ``True`` only requires the attribute to be present; a
+    string must equal the value and a pattern is searched in it.
+    """
+
+    tags: frozenset
+    class_pattern: Optional[re.Pattern] = None
+    attrs: tuple = ()
+
+    def matches(self, tag: Tag, classes: str) -> bool:
+        return self.matches_markup(tag.name, tag.attrs, classes)
+
+    def matches_markup(self, name: str, attrs: dict, classes: str) -> bool:
+        """Match a tag's name and raw attributes before it is built."""
+        if name not in self.tags:
+            return False
+        if self.class_pattern is not None and not (
+            classes and self.class_pattern.search(classes)
+        ):
+            return False
+        for attr, rule in self.attrs:
+            value = attrs.get(attr)
+            if value is None:
+                return False
+            if rule is True:
+                continue
+            if isinstance(rule, re.Pattern):
+                if not rule.search(value):
+                    return False
+            elif value != rule:
+                return False
+        return True
+
+
+def select(
+    *tags: str,
+    classes: Union[list[str], str, None] = None,
+    attrs: Optional[dict] = None,
+    ignore_case: bool = False,
+) -> Selector:
+    """Compile a ``Selector``; ``classes`` lists substrings, any of which match.
+
+    A single string is taken as a ready-made regular expression.
+    """
+    if isinstance(classes, str):
+        class_pattern = re.compile(classes, re.IGNORECASE if ignore_case else 0)
+    elif classes:
+        class_pattern = _contains_any(classes, ignore_case)
+    else:
+        class_pattern = None
+    return Selector(frozenset(tags), class_pattern, tuple((attrs or {}).items()))
+
+
+def _class_string(tag: Tag) -> str:
+    return _joined(tag.attrs.get("class"))
+
+
+def _joined(value) -> str:
+    if not value:
+        return ""
+    return value if isinstance(value, str) else " ".join(value)
+
+
+class CardStrainer(ElementFilter):
+    """
+    ``parse_only`` filter that builds only the subtrees of matching tags.
+
+    Every top-level tag is offered to the selectors as the parser meets it;
+    tags that match are built together with all of their descendants, while
+    everything else on the page, and the text between, is discarded.
+    """
+
+    def __init__(self, selectors: tuple):
+        super().__init__()
+        self.selectors = selectors
+
+    def allow_tag_creation(
+        self, nsprefix: Optional[str], name: str, attrs: Optional[dict]
+    ) -> bool:
+        attrs = attrs or {}
+        classes = _joined(attrs.get("class"))
+        return any(
+            selector.matches_markup(name, attrs, classes) for selector in self.selectors
+        )
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+@dataclass(frozen=True)
+class CardSpec:
+    """
+    Declarative description of the job cards on one board's search page.
+
+    ``cards`` are tried in order; with ``combine_cards`` the matches of all
+    of them are concatenated, otherwise the first selector that finds any
+    card wins. With ``outermost_only``, cards nested inside an already
+    matched card are skipped, so wrapper markup around one posting does not
+    yield it several times. Each entry of ``fields`` lists alternative
+    selectors in order of preference, the first one matching anywhere inside
+    the card wins. ``keep`` lists further elements, such as JSON-LD
+    scripts, that ``parse`` must build besides the cards.
+    """
+
+    cards: tuple
+    fields: dict = field(default_factory=dict)
+    limit: int = 20
+    combine_cards: bool = False
+    outermost_only: bool = False
+    keep: tuple = ()
+
+    def parse(self, content: bytes) -> BeautifulSoup:
+        """Parse a search page, building only the cards and ``keep`` elements.
+
+        Cards nested in other cards still come along with their parent, so
+        ``find_cards`` finds the same cards as on a fully parsed page.
+        """
+        strainer = CardStrainer(self.cards + self.keep)
+        return BeautifulSoup(content, HTML_PARSER, parse_only=strainer)
+
+    def find_cards(self, soup: Union[BeautifulSoup, Tag]) -> list[Tag]:
+        """Return the card containers in one walk over the page."""
+        found = [[] for _ in self.cards]
+        matched = [set() for _ in self.cards]
+        for tag in soup.descendants:
+            if not isinstance(tag, Tag):
+                continue
+            classes = _class_string(tag)
+            for matches, seen, selector in zip(found, matched, self.cards):
+                if not selector.matches(tag, classes):
+                    continue
+                if self.outermost_only and any(
+                    id(parent) in seen for parent in tag.parents
+                ):
+                    continue
+                matches.append(tag)
+                seen.add(id(tag))
+
+        if self.combine_cards:
+            cards = [card for matches in found for card in matches]
+        else:
+            cards = next((matches for matches in found if matches), [])
+        return cards[: self.limit]
+
+    def extract(self, card: Tag) -> dict[str, Optional[Tag]]:
+        """Find every field of one card in a single walk over its subtree."""
+        best: dict[str, tuple[int, Tag]] = {}
+        unresolved = len(self.fields)
+        for tag in card.descendants:
+            if not isinstance(tag, Tag):
+                continue
+            classes = _class_string(tag)
+            for name, selectors in self.fields.items():
+                current = best.get(name)
+                limit = current[0] if current else len(selectors)
+                for rank in range(limit):
+                    if selectors[rank].matches(tag, classes):
+                        if rank == 0:
+                            unresolved -= 1
+                        best[name] = (rank, tag)
+                        break
+            if not unresolved:
+                break
+        return {name: best[name][1] if name in best else None for name in self.fields}
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Queued by stop() so the writer thread exits after draining earlier writes
+_STOP = object()
+
+
+@dataclass
+class _Write:
+    mutation: Callable[[Session], Any]
+    future: Future
+
+
+class GroupCommitWriter:
+    """
+    Applies queued writes on one thread and commits them in groups.
+
+    Request handlers submit mutations: callables that change a Session
+    without committing. The writer thread collects them until ``max_batch``
+    are waiting or ``max_delay_ms`` has passed since the first, runs them in
+    one transaction and commits once, then resolves each caller's future
+    with its mutation's return value. A mutation that raises fails only its
+    own future: the group is rolled back and replayed without it.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_batch: Optional[int] = None,
+        max_delay_ms: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.session_factory = session_factory
+        self.max_batch = (
+            settings.DATABASE_GROUP_COMMIT_MAX_BATCH if max_batch is None else max_batch
+        )
+        self.max_delay = (
+            settings.DATABASE_GROUP_COMMIT_MAX_DELAY_MS
+            if max_delay_ms is None
+            else max_delay_ms
+        ) / 1000
+        self.enabled = settings.DATABASE_GROUP_COMMIT if enabled is None else enabled
+        self.commits = 0
+        self.writes = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, mutation: Callable[[Session], Any]) -> Future:
+        """Queue ``mutation`` and return a future for its result."""
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="group-commit-writer", daemon=True
+                )
+                self._thread.start()
+            self._queue.put(_Write(mutation, future))
+        return future
+
+    async def run(self, mutation: Callable[[Session], Any]) -> Any:
+        """``submit`` for async handlers: await the mutation's result."""
+        return await asyncio.wrap_future(self.submit(mutation))
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Commit everything already queued, then stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._queue.put(_STOP)
+        thread.join(timeout)
+
+    def stats(self) -> dict:
+        return {"commits": self.commits, "writes": self.writes}
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self._commit([w for w in batch if self._claim(w)])
+                    return
+                batch.append(item)
+            self._commit([w for w in batch if self._claim(w)])
+
+    @staticmethod
+    def _claim(write: _Write) -> bool:
+        return write.future.set_running_or_notify_cancel()
+
+    def _commit(self, batch: list[_Write]) -> None:
+        while batch:
+            db = self.session_factory()
+            # Results outlive the session; keep their loaded state
+            db.expire_on_commit = False
+            failed = None
+            try:
+                results = []
+                for write in batch:
+                    try:
+                        results.append(write.mutation(db))
+                        db.flush()
+                    except Exception as e:
+                        failed = write
+                        failed.future.set_exception(e)
+                        break
+                if failed is None:
+                    db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Group commit of {len(batch)} writes failed: {e}")
+                for write in batch:
+                    write.future.set_exception(e)
+                return
+            finally:
+                db.close()  # rolls back a group that had a failed mutation
+
+            if failed is not None:
+                batch = [write for write in batch if write is not failed]
+                continue
+            self.commits += 1
+            self.writes += len(batch)
+            for write, result in zip(batch, results):
+                write.future.set_result(result)
+            return
+
+
+group_writer = GroupCommitWriter()
@@ -0,0 +1,175 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from ..config import settings
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """Jobs parsed from a search page plus the validators it was served with."""
+
+    url: str
+    jobs: list[dict]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    fresh: bool
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """
+    On-disk cache of scraped search pages, keyed by URL.
+
+    Entries hold the jobs parsed from a page rather than its HTML, so a page
+    served from the cache, or confirmed unchanged by a ``304 Not Modified``,
+    is never parsed again. Entries younger than ``ttl_seconds`` are served
+    without touching the network; older ones are revalidated with
+    ``If-None-Match``/``If-Modified-Since``. Once more than ``max_entries``
+    pages are stored the least recently used ones are evicted.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.path = settings.SCRAPER_CACHE_PATH if path is None else path
+        self.ttl_seconds = (
+            settings.SCRAPER_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        )
+        self.max_entries = (
+            settings.SCRAPER_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        )
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " url TEXT PRIMARY KEY,"
+            " jobs TEXT NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " fetched_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_pages_accessed_at ON pages (accessed_at)"
+        )
+        self._conn.commit()
+
+    def lookup(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page for ``url``, counting a hit if it is fresh.
+
+        Missing and stale entries both count as misses, since either way the
+        page is requested again; ``revalidated`` counts the stale ones a
+        ``304`` then confirmed.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT jobs, etag, last_modified, fetched_at FROM pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE pages SET accessed_at = ? WHERE url = ?", (now, url)
+            )
+            self._conn.commit()
+            jobs, etag, last_modified, fetched_at = row
+            fresh = now - fetched_at < self.ttl_seconds
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return CachedPage(
+                url, json.loads(jobs), etag, last_modified, fetched_at, fresh
+            )
+
+    def not_modified(self, page: CachedPage) -> list[dict]:
+        """Record a ``304`` for a stale entry and return its cached jobs."""
+        now = time.time()
+        with self._lock:
+            self.revalidated += 1
+            self._conn.execute(
+                "UPDATE pages SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, page.url),
+            )
+            self._conn.commit()
+        return page.jobs
+
+    def store(self, url: str, headers, jobs: list[dict]) -> None:
+        """Cache the jobs parsed from a ``200`` response, then evict LRU entries."""
+        if "no-store" in headers.get("Cache-Control", ""):
+            return
+        with self._lock:
+            now = time.time()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages"
+                " (url, jobs, etag, last_modified, fetched_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    json.dumps(jobs),
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    now,
+                    now,
+                ),
+            )
+            self._conn.execute(
+                "DELETE FROM pages WHERE url IN ("
+                " SELECT url FROM pages ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "entries": len(self),
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM pages")
+            self._conn.commit()
+            self.hits = self.misses = self.revalidated = 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_http_cache: Optional[HttpCache] = None
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Return the process-wide page cache, or ``None`` when caching is disabled."""
+    global _http_cache
+    if not settings.SCRAPER_CACHE_ENABLED:
+        return None
+    if _http_cache is None:
+        _http_cache = HttpCache()
+    return _http_cache
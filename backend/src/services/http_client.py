@@ -0,0 +1,211 @@
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config import settings
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Only idempotent requests are retried, so nothing is ever sent twice
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+
+
+@dataclass
+class ConnectionStats:
+    """How many requests a client sent and how many connections it opened."""
+
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.connections, 0)
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "reused": self.reused,
+        }
+
+
+def _pool_size(host: str) -> int:
+    return settings.SCRAPER_HOST_POOL_SIZES.get(host, settings.SCRAPER_POOL_MAXSIZE)
+
+
+def build_session() -> requests.Session:
+    """
+    Return a ``requests.Session`` with pooled keep-alive connections.
+
+    Every host gets its own connection pool, sized from
+    ``SCRAPER_HOST_POOL_SIZES`` or ``SCRAPER_POOL_MAXSIZE``. Connection
+    errors and retryable statuses are retried with exponential backoff,
+    honouring ``Retry-After``.
+    """
+    retry = Retry(
+        total=settings.SCRAPER_MAX_RETRIES,
+        backoff_factor=settings.SCRAPER_RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    default_adapter = HTTPAdapter(
+        pool_connections=settings.SCRAPER_POOL_CONNECTIONS,
+        pool_maxsize=settings.SCRAPER_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount("https://", default_adapter)
+    session.mount("http://", default_adapter)
+    for host, size in settings.SCRAPER_HOST_POOL_SIZES.items():
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=retry)
+        session.mount(f"https://{host}/", adapter)
+        session.mount(f"http://{host}/", adapter)
+    return session
+
+
+def session_connection_stats(session: requests.Session) -> ConnectionStats:
+    """Read request and connection counts from a session's urllib3 pools."""
+    stats = ConnectionStats()
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        for key in adapter.poolmanager.pools.keys():
+            pool = adapter.poolmanager.pools[key]
+            stats.requests += pool.num_requests
+            stats.connections += pool.num_connections
+    return stats
+
+
+_session: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Return the session shared by the blocking board scrapers."""
+    global _session
+    if _session is None:
+        _session = build_session()
+    return _session
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """
+    Retries GET and HEAD requests on transport errors and retryable statuses,
+    with exponential backoff. Other methods are sent once.
+
+    Backoff is capped at ``max_backoff`` seconds. A ``Retry-After`` asking
+    for a longer wait is not honoured: the response is returned as is rather
+    than stalling the scrape.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retries: int,
+        backoff: float,
+        max_backoff: Optional[float] = None,
+    ):
+        self._transport = transport
+        self._retries = retries
+        self._backoff = backoff
+        self._max_backoff = (
+            settings.SCRAPER_RETRY_MAX_BACKOFF if max_backoff is None else max_backoff
+        )
+
+    def _delay(
+        self, attempt: int, response: Optional[httpx.Response]
+    ) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None to give up."""
+        retry_after = response.headers.get("Retry-After") if response else None
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+            return delay if delay <= self._max_backoff else None
+        delay = self._backoff * 2**attempt * random.uniform(0.5, 1.0)  # nosec
+        return min(delay, self._max_backoff)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in RETRY_METHODS:
+            return await self._transport.handle_async_request(request)
+        for attempt in range(self._retries + 1):
+            last_attempt = attempt == self._retries
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+                await asyncio.sleep(self._delay(attempt, None))
+                continue
+            if response.status_code not in RETRY_STATUSES or last_attempt:
+                return response
+            delay = self._delay(attempt, response)
+            if delay is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _async_transport(max_connections: int) -> httpx.AsyncBaseTransport:
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=settings.SCRAPER_KEEPALIVE_EXPIRY,
+        )
+    )
+    return RetryTransport(
+        transport,
+        settings.SCRAPER_MAX_RETRIES,
+        settings.SCRAPER_RETRY_BACKOFF,
+        settings.SCRAPER_RETRY_MAX_BACKOFF,
+    )
+
+
+def build_async_client(
+    stats: Optional[ConnectionStats] = None, hosts: Iterable[str] = (), **kwargs
+) -> httpx.AsyncClient:
+    """
+    Return an ``httpx.AsyncClient`` configured like ``build_session``.
+
+    Each of ``hosts``, such as the job boards, and each host in
+    ``SCRAPER_HOST_POOL_SIZES`` is mounted on its own pool, sized like the
+    per-host pools of ``build_session``. Only hosts not known up front share
+    the default pool of ``SCRAPER_POOL_MAXSIZE`` connections. When
+    ``stats`` is given, it counts every request sent and every TCP
+    connection opened, so callers can see how often connections are reused.
+    """
+    stats = ConnectionStats() if stats is None else stats
+
+    async def trace(event_name: str, info: dict) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            stats.connections += 1
+
+    async def on_request(request: httpx.Request) -> None:
+        stats.requests += 1
+        request.extensions["trace"] = trace
+
+    mounts = {
+        f"all://{host}": _async_transport(_pool_size(host))
+        for host in {*hosts, *settings.SCRAPER_HOST_POOL_SIZES}
+    }
+    kwargs.setdefault(
+        "timeout",
+        httpx.Timeout(
+            settings.SCRAPER_REQUEST_TIMEOUT, connect=settings.SCRAPER_CONNECT_TIMEOUT
+        ),
+    )
+    kwargs.setdefault("follow_redirects", True)
+    return httpx.AsyncClient(
+        transport=_async_transport(settings.SCRAPER_POOL_MAXSIZE),
+        mounts=mounts,
+        event_hooks={"request": [on_request]},
+        **kwargs,
+    )
@@ -0,0 +1,159 @@
+"""
+Full-text search over a user's scraped jobs, backed by the ``jobs_fts``
+FTS5 index (see ``JOB_SEARCH_DDL`` in ``models/job.py``).
+
+FTS5 exists only in SQLite. On other databases the index is never created,
+and search falls back to ``ILIKE`` filters, newest jobs first.
+"""
+
+import html
+import re
+from typing import NamedTuple, Optional
+
+from sqlalchemy import column, func, literal, literal_column, or_, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models.job import Job
+
+# bm25 weights per indexed column: title, company, description
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0)
+
+# Tokens of context either side of the best match in a snippet
+SNIPPET_TOKENS = 12
+
+# Only the user's newest matches are ranked. bm25 has to score every row it
+# orders, so a common word matching most of a large table would take
+# seconds; with the cap a query costs the same at any table size.
+SEARCH_CANDIDATES = 2000
+
+# Quoted phrases or bare words; a trailing * makes a word a prefix query
+_SEARCH_TERM = re.compile(r'"([^"]*)"|(\S+)')
+_WORD = re.compile(r"\w+")
+
+# Match markers for snippet(); swapped for <mark> once the text is escaped
+_OPEN, _CLOSE = "\x02", "\x03"
+
+_jobs_fts = table("jobs_fts", column("rowid"))
+
+
+class SearchHit(NamedTuple):
+    job: Job
+    rank: float
+    snippet: Optional[str]
+
+
+def _search_terms(query: str) -> list[tuple[str, bool]]:
+    """The phrases and words of ``query``, each with whether it is a prefix."""
+    terms = []
+    for phrase, word in _SEARCH_TERM.findall(query):
+        words = _WORD.findall(phrase or word)
+        if words:
+            terms.append((" ".join(words), word.endswith("*")))
+    return terms
+
+
+def search_expression(query: str) -> str:
+    """
+    Translate search box text into an FTS5 MATCH expression.
+
+    Every word must match; "quoted words" match as a phrase and a word
+    ending in * matches as a prefix. Punctuation is dropped, so no input can
+    produce an FTS5 syntax error. Returns "" if nothing searchable is left.
+    """
+    return " ".join(
+        f'"{term}"*' if prefix else f'"{term}"' for term, prefix in _search_terms(query)
+    )
+
+
+def _highlight(snippet: Optional[str]) -> Optional[str]:
+    """Escape scraped text for HTML and mark the matched tokens."""
+    if snippet is None:
+        return None
+    escaped = html.escape(snippet, quote=False)
+    return escaped.replace(_OPEN, "<mark>").replace(_CLOSE, "</mark>")
+
+
+def _search_query(user_id: int, expression: str, limit: int):
+    fts = literal_column("jobs_fts")
+    matches = (
+        select(Job.id)
+        .join(_jobs_fts, _jobs_fts.c.rowid == Job.id)
+        .where(fts.match(expression), Job.user_id == user_id)
+    )
+    # FTS5 walks its doclists newest first, so the cap is a cheap index read
+    candidates = (
+        matches.order_by(_jobs_fts.c.rowid.desc())
+        .limit(SEARCH_CANDIDATES)
+        .correlate(None)
+        .subquery()
+    )
+    oldest_candidate = select(func.min(candidates.c.id)).scalar_subquery()
+
+    rank = func.bm25(fts, *SEARCH_WEIGHTS).label("rank")
+    snippet = func.snippet(fts, -1, _OPEN, _CLOSE, "…", SNIPPET_TOKENS)
+    return (
+        select(Job, rank, snippet.label("snippet"))
+        .join(_jobs_fts, _jobs_fts.c.rowid == Job.id)
+        .where(
+            fts.match(expression),
+            Job.user_id == user_id,
+            _jobs_fts.c.rowid >= oldest_candidate,
+        )
+        .order_by(rank)
+        .limit(limit)
+    )
+
+
+def _like_query(user_id: int, query: str, limit: int):
+    """Search without FTS5: each term must occur in the title, company or text."""
+    filters = []
+    for term, _ in _search_terms(query):
+        pattern = "%" + term.replace("_", "\\_") + "%"
+        filters.append(
+            or_(
+                Job.title.ilike(pattern, escape="\\"),
+                Job.company.ilike(pattern, escape="\\"),
+                Job.description.ilike(pattern, escape="\\"),
+            )
+        )
+    return (
+        select(Job, literal(0.0).label("rank"), literal(None).label("snippet"))
+        .where(Job.user_id == user_id, *filters)
+        .order_by(Job.id.desc())
+        .limit(limit)
+    )
+
+
+def _query(db, user_id: int, query: str, limit: int):
+    """The search statement for ``db``'s dialect, or None if nothing to search."""
+    if db.get_bind().dialect.name != "sqlite":
+        return _like_query(user_id, query, limit) if _search_terms(query) else None
+    expression = search_expression(query)
+    return _search_query(user_id, expression, limit) if expression else None
+
+
+def _hits(rows) -> list[SearchHit]:
+    return [SearchHit(job, rank, _highlight(snippet)) for job, rank, snippet in rows]
+
+
+def search_jobs(
+    db: Session, user_id: int, query: str, limit: int = 20
+) -> list[SearchHit]:
+    """
+    The user's jobs matching ``query``, best bm25 rank first, chosen from
+    their newest ``SEARCH_CANDIDATES`` matches.
+    """
+    statement = _query(db, user_id, query, limit)
+    if statement is None:
+        return []
+    return _hits(db.execute(statement))
+
+
+async def search_jobs_async(
+    db: AsyncSession, user_id: int, query: str, limit: int = 20
+) -> list[SearchHit]:
+    statement = _query(db, user_id, query, limit)
+    if statement is None:
+        return []
+    return _hits(await db.execute(statement))
@@ -1,6 +1,35 @@
+from typing import Iterable, Optional
+from sqlalchemy import Row, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..models.job import Job
+from ..models.job import Job, job_fingerprint
 from ..models.keyword import Keyword
+from .pagination import KeysetOrder
+
+# Rows per executemany round trip in bulk_upsert_jobs and insert_new_jobs
+UPSERT_BATCH_SIZE = 500
+
+# Fingerprints per IN (...) probe, well below SQLite's bound parameter limit
+_PROBE_BATCH_SIZE = 500
+
+# Scraped fields refreshed when a posting is seen again; status stays user-owned
+_UPSERT_COLUMNS = ("title", "company", "description", "salary")
+
+# Jobs are listed oldest first; ix_jobs_user_id serves both skip and cursor pages
+JOB_ORDER = KeysetOrder((Job.id,))
+
+# What the jobs list returns, selected as plain rows rather than entities
+JOB_LIST_COLUMNS = (
+    Job.id,
+    Job.user_id,
+    Job.title,
+    Job.company,
+    Job.description,
+    Job.application_link,
+    Job.salary,
+    Job.status,
+)
 
 
 def create_job(db: Session, job_data: dict, user_id: int):
@@ -11,23 +40,187 @@ def create_job(db: Session, job_data: dict, user_id: int):
     return db_job
 
 
-def get_jobs(db: Session, user_id: int, skip: int = 0, limit: int = 100):
-    return db.query(Job).filter(Job.user_id == user_id).offset(skip).limit(limit).all()
+def _job_rows(jobs_data: Iterable[dict], user_id: int) -> list[dict]:
+    """Map scraped job dicts to jobs rows, dropping repeats of a fingerprint."""
+    rows = {}
+    for job_data in jobs_data:
+        row = {
+            "title": job_data.get("title"),
+            "company": job_data.get("company"),
+            "description": job_data.get("description"),
+            "application_link": job_data["application_link"],
+            "salary": job_data.get("salary"),
+            "status": job_data.get("status") or "new",
+            "user_id": user_id,
+        }
+        row["fingerprint"] = job_fingerprint(row)
+        rows.setdefault(row["fingerprint"], row)
+    return list(rows.values())
+
+
+def _insert(db: Session):
+    dialect = sqlite if db.get_bind().dialect.name == "sqlite" else postgresql
+    return dialect.insert(Job)
+
+
+def _execute_batches(db: Session, stmt, rows: list[dict], batch_size: int) -> None:
+    try:
+        for start in range(0, len(rows), batch_size):
+            db.execute(stmt, rows[start : start + batch_size])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def bulk_upsert_jobs(
+    db: Session,
+    jobs_data: Iterable[dict],
+    user_id: int,
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> int:
+    """
+    Insert or update many jobs in one transaction.
+
+    Jobs are keyed on (user_id, fingerprint): new postings are inserted, known
+    ones get their scraped fields refreshed while keeping their status.
+    Rows are sent with executemany in batches and committed once.
+    """
+    rows = _job_rows(jobs_data, user_id)
+    if not rows:
+        return 0
+
+    stmt = _insert(db)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Job.user_id, Job.fingerprint],
+        set_={column: stmt.excluded[column] for column in _UPSERT_COLUMNS},
+    )
+    _execute_batches(db, stmt, rows, batch_size)
+    return len(rows)
+
+
+def existing_fingerprints(
+    db: Session, user_id: int, fingerprints: Iterable[str]
+) -> set[str]:
+    """Return which of the given fingerprints are already stored for the user."""
+    fingerprints = list(fingerprints)
+    found = set()
+    for start in range(0, len(fingerprints), _PROBE_BATCH_SIZE):
+        found.update(
+            fingerprint
+            for (fingerprint,) in db.query(Job.fingerprint).filter(
+                Job.user_id == user_id,
+                Job.fingerprint.in_(fingerprints[start : start + _PROBE_BATCH_SIZE]),
+            )
+        )
+    return found
+
+
+def insert_new_jobs(
+    db: Session,
+    jobs_data: Iterable[dict],
+    user_id: int,
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> int:
+    """
+    Store only postings not seen before and return how many were new.
+
+    Known postings are filtered out with index probes on the fingerprint
+    index, so repeat scrapes of the same results write nothing.
+    """
+    rows = _job_rows(jobs_data, user_id)
+    known = existing_fingerprints(db, user_id, (row["fingerprint"] for row in rows))
+    rows = [row for row in rows if row["fingerprint"] not in known]
+    if not rows:
+        return 0
+
+    # DO NOTHING covers postings stored concurrently since the probe
+    stmt = _insert(db).on_conflict_do_nothing(
+        index_elements=[Job.user_id, Job.fingerprint]
+    )
+    _execute_batches(db, stmt, rows, batch_size)
+    return len(rows)
+
+
+def get_jobs(
+    db: Session,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+):
+    query = JOB_ORDER.apply(db.query(Job).filter(Job.user_id == user_id), cursor)
+    return query.offset(skip).limit(limit).all()
 
 
 def get_job(db: Session, job_id: int, user_id: int):
     return db.query(Job).filter(Job.id == job_id, Job.user_id == user_id).first()
 
 
-def update_job_status(db: Session, job_id: int, user_id: int, new_status: str):
+def set_job_status(db: Session, job_id: int, user_id: int, new_status: str):
+    """Change a job's status without committing, e.g. as a group-commit write."""
     db_job = get_job(db, job_id, user_id)
     if db_job:
         db_job.status = new_status
+    return db_job
+
+
+def update_job_status(db: Session, job_id: int, user_id: int, new_status: str):
+    db_job = set_job_status(db, job_id, user_id, new_status)
+    if db_job:
         db.commit()
         db.refresh(db_job)
     return db_job
 
 
+async def get_jobs_async(
+    db: AsyncSession,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> list[Job]:
+    query = JOB_ORDER.apply(select(Job).filter(Job.user_id == user_id), cursor)
+    result = await db.scalars(query.offset(skip).limit(limit))
+    return list(result)
+
+
+async def get_job_rows_async(
+    db: AsyncSession,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> list[Row]:
+    """
+    ``get_jobs_async`` as Core rows of ``JOB_LIST_COLUMNS``. Skipping the
+    identity map and instance state makes a page a few times cheaper to load
+    when it is only going to be serialized.
+    """
+    query = select(*JOB_LIST_COLUMNS).filter(Job.user_id == user_id)
+    query = JOB_ORDER.apply(query, cursor)
+    result = await db.execute(query.offset(skip).limit(limit))
+    return list(result)
+
+
+async def get_job_async(db: AsyncSession, job_id: int, user_id: int):
+    result = await db.scalars(
+        select(Job).filter(Job.id == job_id, Job.user_id == user_id).limit(1)
+    )
+    return result.first()
+
+
+async def update_job_status_async(
+    db: AsyncSession, job_id: int, user_id: int, new_status: str
+):
+    db_job = await get_job_async(db, job_id, user_id)
+    if db_job:
+        db_job.status = new_status
+        await db.commit()
+        await db.refresh(db_job)
+    return db_job
+
+
 def create_keyword(db: Session, term: str):
     db_keyword = Keyword(term=term)
     db.add(db_keyword)
@@ -1,15 +1,52 @@
+from typing import Iterable
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from ..models.keyword import Keyword
 
 
 class KeywordService:
-    def create_keyword(self, db: Session, term: str, user_id: int):
+    def add_keyword(self, db: Session, term: str, user_id: int):
+        """Add a keyword without committing, e.g. as a group-commit write."""
         db_keyword = Keyword(term=term, user_id=user_id)
         db.add(db_keyword)
+        return db_keyword
+
+    def create_keyword(self, db: Session, term: str, user_id: int):
+        db_keyword = self.add_keyword(db, term=term, user_id=user_id)
         db.commit()
         db.refresh(db_keyword)
         return db_keyword
 
+    def resolve_keywords(
+        self, db: Session, terms: Iterable[str], user_id: int
+    ) -> list[Keyword]:
+        """
+        Keywords for ``terms`` in the given order, adding the missing ones
+        without committing: one IN query for the known terms and one insert
+        for the rest. A term added concurrently by another request is
+        skipped by the insert and picked up by the final lookup.
+        """
+        terms = list(dict.fromkeys(terms))
+        if not terms:
+            return []
+        by_term = {
+            keyword.term: keyword
+            for keyword in db.query(Keyword).filter(Keyword.term.in_(terms))
+        }
+        missing = [term for term in terms if term not in by_term]
+        if missing:
+            dialect = sqlite if db.get_bind().dialect.name == "sqlite" else postgresql
+            db.execute(
+                dialect.insert(Keyword)
+                .values([{"term": term, "user_id": user_id} for term in missing])
+                .on_conflict_do_nothing(index_elements=["term"])
+            )
+            by_term.update(
+                (keyword.term, keyword)
+                for keyword in db.query(Keyword).filter(Keyword.term.in_(missing))
+            )
+        return [by_term[term] for term in terms]
+
     def get_keyword(self, db: Session, keyword_id: int, user_id: int):
         return (
             db.query(Keyword)
@@ -0,0 +1,84 @@
+"""
+Keyset (cursor) pagination.
+
+A page is ordered by a fixed tuple of columns ending in the primary key,
+and the cursor handed to the client encodes that tuple for the last row it
+received. The next page is then "rows after this tuple", which an index on
+``(user_id, *columns)`` answers by seeking straight to the position instead
+of reading and discarding every earlier row as ``OFFSET`` does.
+
+Cursors are opaque to clients: URL-safe base64 of the JSON-encoded values.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import tuple_
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor this API did not issue."""
+
+
+def _encode_value(value: Any):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(column, value: Any):
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+@dataclass(frozen=True)
+class KeysetOrder:
+    """
+    Sort order of a paginated query. Every column must be NOT NULL and the
+    last one unique (the primary key), so each row has a distinct position.
+    """
+
+    columns: Sequence[Any]
+    descending: bool = False
+
+    def encode(self, row) -> str:
+        values = [_encode_value(getattr(row, column.key)) for column in self.columns]
+        payload = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> tuple:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded))
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise InvalidCursor(cursor)
+            return tuple(
+                _decode_value(column, value)
+                for column, value in zip(self.columns, values)
+            )
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            raise InvalidCursor(cursor) from e
+
+    def apply(self, query, cursor: Optional[str] = None):
+        """Order a ``Query`` or ``Select`` and start it after ``cursor``."""
+        key = tuple_(*self.columns)
+        if cursor is not None:
+            after = tuple_(*self.decode(cursor))
+            query = query.filter(key < after if self.descending else key > after)
+        if self.descending:
+            return query.order_by(*(column.desc() for column in self.columns))
+        return query.order_by(*self.columns)
+
+    def next_cursor(self, rows: Sequence, limit: int) -> Optional[str]:
+        """Cursor for the page after ``rows``, or None if it was the last."""
+        if not rows or len(rows) < limit:
+            return None
+        return self.encode(rows[-1])
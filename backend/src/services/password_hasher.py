@@ -0,0 +1,103 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+import anyio
+from passlib.context import CryptContext
+
+from ..config import settings
+from .process_pool import spawn_process_pool
+
+# For password hashing
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def verify_password(plain_password, hashed_password):
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def get_password_hash(password):
+    return pwd_context.hash(password)
+
+
+class HasherBusy(Exception):
+    """Raised when more hashes are waiting than the hasher admits."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt for the auth endpoints in a dedicated process pool.
+
+    A bcrypt hash takes a few hundred milliseconds of CPU. Run in the AnyIO
+    threadpool, a burst of logins takes every thread and every other sync
+    endpoint queues behind it. Here at most ``workers`` hashes run at once,
+    in their own processes, and once ``max_pending`` are in flight or queued
+    further requests fail fast with ``HasherBusy`` instead of queueing. With
+    ``workers`` at 0 hashes run in the AnyIO threadpool, still admission
+    controlled.
+    """
+
+    def __init__(
+        self, workers: Optional[int] = None, max_pending: Optional[int] = None
+    ):
+        self.workers = settings.AUTH_HASH_WORKERS if workers is None else workers
+        self.max_pending = (
+            settings.AUTH_HASH_MAX_PENDING if max_pending is None else max_pending
+        )
+        self.completed = 0
+        self.rejected = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = spawn_process_pool(self.workers)
+            return self._executor
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HasherBusy()
+            self._pending += 1
+
+    async def _run(self, fn: Callable, *args):
+        self._admit()
+        try:
+            if self.workers <= 0:
+                result = await anyio.to_thread.run_sync(fn, *args)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), fn, *args
+                )
+        finally:
+            with self._lock:
+                self._pending -= 1
+        self.completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, password, hashed_password)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pending": self._pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+
+password_hasher = PasswordHasher()
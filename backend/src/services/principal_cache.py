@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.user import User
+
+# Columns copied into the cache; the password hash is never kept in memory
+_PRINCIPAL_COLUMNS = ("id", "username", "email")
+
+
+class PrincipalCache:
+    """
+    Bounded in-memory TTL cache of authenticated users, keyed by the token
+    subject (the username).
+
+    ``get_current_user`` still validates the token on every request but only
+    looks the user up on a miss. Entries live for ``ttl_seconds``, the least
+    recently used ones are evicted past ``max_entries``, and an entry is
+    dropped as soon as a session commits a change to or deletion of its
+    user. Every hit returns a fresh transient ``User``, so no ORM instance
+    is shared between requests. A ``ttl_seconds`` of 0 disables the cache.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = (
+            settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS
+            if ttl_seconds is None
+            else ttl_seconds
+        )
+        self.max_entries = (
+            settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES
+            if max_entries is None
+            else max_entries
+        )
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, subject: str) -> Optional[User]:
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None or entry[0] <= self._clock():
+                self._entries.pop(subject, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(subject)
+            self.hits += 1
+            return User(**entry[1])
+
+    def put(self, subject: str, user: User) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        columns = {name: getattr(user, name) for name in _PRINCIPAL_COLUMNS}
+        with self._lock:
+            self._entries[subject] = (self._clock() + self.ttl_seconds, columns)
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, subject: str) -> None:
+        with self._lock:
+            self._entries.pop(subject, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+
+principal_cache = PrincipalCache()
+
+# Usernames of users changed in a session's transaction, dropped on commit.
+# None stands for a user whose username was not loaded: clear everything.
+_STALE_KEY = "stale_principals"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:
+    for user in (*session.dirty, *session.deleted):
+        if isinstance(user, User):
+            names = [name for name in inspect(user).attrs.username.history.sum()]
+            session.info.setdefault(_STALE_KEY, set()).update(names or [None])
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    stale = session.info.pop(_STALE_KEY, ())
+    if None in stale:
+        principal_cache.clear()
+    for username in stale:
+        principal_cache.invalidate(username)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_users(session: Session) -> None:
+    session.info.pop(_STALE_KEY, None)
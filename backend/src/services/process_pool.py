@@ -0,0 +1,15 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def spawn_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Return a process pool whose workers start as fresh interpreters.
+
+    The app runs threads (the threadpool, the log listener, group commit),
+    and forking a process while other threads hold locks can deadlock the
+    child, so workers are spawned instead of forked.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
@@ -0,0 +1,197 @@
+import asyncio
+import contextlib
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.database import SessionLocal, to_session_thread
+from ..models.scrape_run import ScrapeRun
+from ..models.user import User
+from .auth_service import AuthService
+from .http_cache import get_http_cache
+from .scraper import get_job_keywords, scrape_all_jobs_async
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeScheduler:
+    """
+    Runs job scrapes in a background asyncio task on a fixed interval.
+
+    Every run is recorded in the ``scrape_runs`` table, so the schedule
+    survives restarts: after a reboot the next run is due one interval after
+    the last finished run rather than immediately.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        interval_minutes: Optional[int] = None,
+        run_on_startup: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.session_factory = session_factory
+        self.interval = timedelta(
+            minutes=(
+                settings.SCRAPE_INTERVAL_MINUTES
+                if interval_minutes is None
+                else interval_minutes
+            )
+        )
+        self.run_on_startup = (
+            settings.SCRAPE_ON_STARTUP if run_on_startup is None else run_on_startup
+        )
+        self.enabled = settings.SCRAPER_ENABLED if enabled is None else enabled
+        self.next_run_at: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._run_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def running(self) -> bool:
+        return self._run_lock is not None and self._run_lock.locked()
+
+    def start(self) -> None:
+        """Schedule the scrape loop without waiting for any scrape to run."""
+        if not self.enabled or (self._task and not self._task.done()):
+            return
+        self._wakeup = asyncio.Event()
+        self._run_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def trigger(self) -> None:
+        """Start a scrape now instead of waiting for the next interval."""
+        if self._wakeup:
+            self._wakeup.set()
+
+    async def _run_forever(self) -> None:
+        try:
+            last_run = await asyncio.to_thread(self._last_finished_run)
+        except Exception:
+            logger.exception("Could not load the last scrape run; scraping now.")
+            last_run = None
+        if self.run_on_startup or last_run is None:
+            self.next_run_at = datetime.utcnow()
+        else:
+            self.next_run_at = last_run.finished_at + self.interval
+
+        while True:
+            delay = (self.next_run_at - datetime.utcnow()).total_seconds()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(delay, 0))
+            self._wakeup.clear()
+            # A failing run must not end the loop, or no scrape runs again
+            # until the process restarts
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Scheduled job scrape crashed.")
+            self.next_run_at = datetime.utcnow() + self.interval
+
+    async def run_once(self) -> ScrapeRun:
+        """Run one scrape and record its outcome."""
+        if self._run_lock is None:
+            self._run_lock = asyncio.Lock()
+        async with self._run_lock:
+            db = self.session_factory()
+            try:
+                run = await to_session_thread(self._begin_run, db)
+                if run.status == "skipped":
+                    return run
+                run_id = run.id
+                try:
+                    user_id = await to_session_thread(self._scrape_user_id, db)
+                    run.jobs_stored = await scrape_all_jobs_async(db, user_id)
+                    run.status = "succeeded"
+                    run.finished_at = datetime.utcnow()
+                    await to_session_thread(self._commit_run, db, run)
+                    logger.info("Scheduled job scrape completed.")
+                    return run
+                except asyncio.CancelledError:
+                    # An error here would replace the cancellation, and the
+                    # loop would swallow it and keep running
+                    try:
+                        await to_session_thread(self._fail_run, db, run_id, "cancelled")
+                    except Exception:
+                        logger.exception("Could not record the cancelled scrape run.")
+                    raise
+                except Exception as e:
+                    logger.error(f"Error during scheduled job scraping: {e}")
+                    return await to_session_thread(self._fail_run, db, run_id, str(e))
+            finally:
+                db.close()
+
+    def _begin_run(self, db: Session) -> ScrapeRun:
+        run = ScrapeRun(started_at=datetime.utcnow(), status="running")
+        if not get_job_keywords():
+            run.status = "skipped"
+            run.finished_at = run.started_at
+        db.add(run)
+        self._commit_run(db, run)
+        return run
+
+    def _commit_run(self, db: Session, run: ScrapeRun) -> None:
+        db.commit()
+        db.refresh(run)
+
+    def _fail_run(self, db: Session, run_id: int, error: str) -> ScrapeRun:
+        # Drop whatever the scrape left unflushed, so the run is not left
+        # 'running' by a failed commit
+        db.rollback()
+        run = db.get(ScrapeRun, run_id)
+        if run.status != "running":
+            # Cancelled after its outcome was committed
+            return run
+        run.status = "failed"
+        run.error = error
+        run.finished_at = datetime.utcnow()
+        self._commit_run(db, run)
+        return run
+
+    def _scrape_user_id(self, db: Session) -> int:
+        # Find the first user or create a placeholder user if none exists
+        user = db.query(User).first()
+        if not user:
+            logger.info("No user found, creating a placeholder user for scraping.")
+            user = AuthService().register_user(
+                db, "scraper_user", "scraper@example.com", "scraper_password"
+            )
+        return int(user.id)
+
+    def _last_finished_run(self) -> Optional[ScrapeRun]:
+        db = self.session_factory()
+        try:
+            return last_run(db, finished_only=True)
+        finally:
+            db.close()
+
+    def status(self, db: Session) -> dict:
+        cache = get_http_cache()
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "interval_minutes": int(self.interval.total_seconds() // 60),
+            "next_run_at": self.next_run_at,
+            "last_run": last_run(db),
+            "page_cache": cache.stats() if cache is not None else None,
+        }
+
+
+def last_run(db: Session, finished_only: bool = False) -> Optional[ScrapeRun]:
+    query = db.query(ScrapeRun)
+    if finished_only:
+        query = query.filter(ScrapeRun.finished_at.isnot(None))
+    return query.order_by(ScrapeRun.id.desc()).first()
+
+
+scrape_scheduler = ScrapeScheduler()
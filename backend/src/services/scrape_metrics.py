@@ -0,0 +1,109 @@
+"""
+Prometheus metrics of the scrape pipeline, labelled per board and keyword.
+
+Keywords come from the JOB_KEYWORDS setting, so the label stays a small,
+fixed set. Pages parsed in a worker process would record into that
+process's registry, which /metrics never sees. While ``collect()`` is
+active, observations are kept in a list instead, and the parent process
+``replay()``s them.
+"""
+
+from contextlib import contextmanager
+from typing import Optional
+
+from prometheus_client import Counter, Histogram
+
+_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+FETCH_SECONDS = Histogram(
+    "scraper_fetch_duration_seconds",
+    "Time to fetch one search page, from request to last body byte",
+    ["board", "keyword"],
+    buckets=_SECONDS_BUCKETS,
+)
+DOWNLOADED_BYTES = Counter(
+    "scraper_downloaded_bytes_total",
+    "Search page bytes received on the wire, before decompression",
+    ["board", "keyword"],
+)
+HTTP_RESPONSES = Counter(
+    "scraper_http_responses_total",
+    "Search page requests by HTTP status, or 'error' when none came back",
+    ["board", "keyword", "status_code"],
+)
+SLEEP_SECONDS = Histogram(
+    "scraper_politeness_sleep_seconds",
+    "Time a request slept to keep the politeness delay to its host",
+    ["board", "keyword"],
+    buckets=(0, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+PARSE_SECONDS = Histogram(
+    "scraper_parse_duration_seconds",
+    "Time to parse one search page into jobs",
+    ["board", "keyword"],
+    buckets=_SECONDS_BUCKETS,
+)
+CARDS_FOUND = Counter(
+    "scraper_cards_found_total",
+    "Job cards or JSON-LD postings found on parsed search pages",
+    ["board", "keyword"],
+)
+CARDS_EXTRACTED = Counter(
+    "scraper_cards_extracted_total",
+    "Jobs extracted from parsed search pages",
+    ["board", "keyword"],
+)
+FALLBACK_JOBS = Counter(
+    "scraper_fallback_jobs_total",
+    "Synthesized jobs added in place of scraped ones, by reason",
+    ["board", "keyword", "reason"],
+)
+JSON_LD_PAGES = Counter(
+    "scraper_json_ld_pages_total",
+    "Search pages by whether JSON-LD job postings were found",
+    ["board", "result"],
+)
+
+# Metrics that may be recorded while parsing, by the name observations use
+_PARSE_METRICS = {
+    "parse_seconds": PARSE_SECONDS,
+    "cards_found": CARDS_FOUND,
+    "cards_extracted": CARDS_EXTRACTED,
+    "json_ld_pages": JSON_LD_PAGES,
+}
+
+# Set while parsing in a worker process
+_collected: Optional[list] = None
+
+
+def _record(name: str, labels: dict, value: float) -> None:
+    metric = _PARSE_METRICS[name].labels(**labels)
+    if isinstance(metric, Histogram):
+        metric.observe(value)
+    else:
+        metric.inc(value)
+
+
+def observe(name: str, value: float = 1, **labels) -> None:
+    """Record a parse-time metric, or collect it inside ``collect()``."""
+    if _collected is not None:
+        _collected.append((name, labels, value))
+    else:
+        _record(name, labels, value)
+
+
+@contextmanager
+def collect():
+    """Collect ``observe`` calls in a list instead of recording them."""
+    global _collected
+    _collected = []
+    try:
+        yield _collected
+    finally:
+        _collected = None
+
+
+def replay(observations: list) -> None:
+    """Record observations collected elsewhere, e.g. in a parse worker."""
+    for name, labels, value in observations:
+        _record(name, labels, value)
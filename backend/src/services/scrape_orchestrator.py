@@ -0,0 +1,395 @@
+import asyncio
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Optional, Union
+
+import httpx
+
+from ..config import settings
+from . import scrape_metrics, scraper_dice, scraper_indeed, scraper_linkedin
+from .http_cache import HttpCache
+from .http_client import ConnectionStats, build_async_client
+from .process_pool import spawn_process_pool
+
+
+@dataclass(frozen=True)
+class BoardSpec:
+    """Everything the orchestrator needs to know to scrape one job board."""
+
+    name: str
+    host: str
+    headers: dict
+    politeness_delay: tuple[float, float]
+    min_jobs_per_page: int
+    build_urls: Callable[[str, int], list[str]]
+    parse_page: Callable[[bytes, str], list[dict]]
+    fallback_jobs: Callable[[str, list[dict], int], list[dict]]
+    http_error_jobs: Callable[[str, int], list[dict]]
+    offline_jobs: Callable[[str, int], list[dict]]
+    error_recovery_jobs: Callable[[str, int], list[dict]]
+    api_scraper: Optional[Callable[[list[str], int], list[dict]]] = None
+
+
+def _board_spec(name: str, module, api_scraper=None) -> BoardSpec:
+    return BoardSpec(
+        name=name,
+        host=module.HOST,
+        headers=module.HEADERS,
+        politeness_delay=module.POLITENESS_DELAY,
+        min_jobs_per_page=module.MIN_JOBS_PER_PAGE,
+        build_urls=module.build_search_urls,
+        parse_page=module.parse_search_page,
+        fallback_jobs=module.fallback_jobs,
+        http_error_jobs=module.http_error_jobs,
+        offline_jobs=module.offline_jobs,
+        error_recovery_jobs=module.error_recovery_jobs,
+        api_scraper=api_scraper,
+    )
+
+
+BOARDS = [
+    _board_spec("LinkedIn", scraper_linkedin, scraper_linkedin.scrape_via_api),
+    _board_spec("Indeed", scraper_indeed, scraper_indeed.scrape_via_api),
+    _board_spec("Dice", scraper_dice),
+]
+
+
+class HostThrottle:
+    """Caps in-flight requests to one host and spaces out their start times.
+
+    Boards sharing a host share a throttle, so politeness is enforced per
+    host rather than by a global sleep between every request. ``slot``
+    yields how long the request slept for the politeness delay.
+    """
+
+    def __init__(self, max_concurrency: int, delay: tuple[float, float]):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._delay = delay
+        self._next_start = 0.0
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._semaphore:
+            async with self._lock:
+                wait = max(self._next_start - time.monotonic(), 0.0)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._next_start = time.monotonic() + random.uniform(  # nosec
+                    *self._delay
+                )
+            yield wait
+
+
+def _timed_parse(
+    board: str,
+    parse_page: Callable[[bytes, str], list[dict]],
+    content: bytes,
+    keyword: str,
+) -> list[dict]:
+    start = time.perf_counter()
+    jobs = parse_page(content, keyword)
+    labels = {"board": board, "keyword": keyword}
+    scrape_metrics.observe("parse_seconds", time.perf_counter() - start, **labels)
+    scrape_metrics.observe("cards_extracted", len(jobs), **labels)
+    return jobs
+
+
+def _parse_in_worker(
+    parse_page: Callable[[bytes, str], list[dict]], content: bytes, keyword: str
+) -> tuple[list[dict], list]:
+    with scrape_metrics.collect() as observations:
+        jobs = parse_page(content, keyword)
+    return jobs, observations
+
+
+class ParseStage:
+    """
+    Parses fetched pages in worker processes, decoupled from fetching.
+
+    Fetchers hand raw page bytes to ``parse`` and await the jobs. Pages wait
+    in a bounded queue that ``workers`` consumer tasks drain, each keeping
+    one page in flight in the process pool. When parsing falls behind, the
+    full queue makes fetchers wait instead of piling up HTML in memory.
+    """
+
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._consumers: list[asyncio.Task] = []
+
+    async def __aenter__(self) -> "ParseStage":
+        self._executor = spawn_process_pool(self.workers)
+        self._consumers = [
+            asyncio.create_task(self._consume()) for _ in range(self.workers)
+        ]
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        for consumer in self._consumers:
+            consumer.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        await asyncio.to_thread(self._executor.shutdown)
+
+    async def parse(
+        self,
+        parse_page: Callable[[bytes, str], list[dict]],
+        content: bytes,
+        keyword: str,
+    ) -> list[dict]:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((future, parse_page, content, keyword))
+        return await future
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            future, parse_page, content, keyword = await self._queue.get()
+            try:
+                jobs, observations = await loop.run_in_executor(
+                    self._executor, _parse_in_worker, parse_page, content, keyword
+                )
+                scrape_metrics.replay(observations)
+                if not future.done():
+                    future.set_result(jobs)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+
+async def _fetch_page(
+    client: httpx.AsyncClient,
+    spec: BoardSpec,
+    throttle: HostThrottle,
+    cache: Optional[HttpCache],
+    parse_stage: Optional[ParseStage],
+    url: str,
+    headers: dict,
+    keyword: str,
+) -> Union[list[dict], httpx.Response]:
+    """Return the jobs on one search page, or the response if it was not a 200."""
+    # The cache is a blocking SQLite file, keep its reads and writes off the
+    # event loop so they do not hold up the other fetches
+    cached = await asyncio.to_thread(cache.lookup, url) if cache is not None else None
+    if cached and cached.fresh:
+        return cached.jobs
+    if cached:
+        headers = {**headers, **cached.conditional_headers()}
+
+    labels = {"board": spec.name, "keyword": keyword}
+    async with throttle.slot() as slept:
+        scrape_metrics.SLEEP_SECONDS.labels(**labels).observe(slept)
+        start = time.perf_counter()
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.HTTPError:
+            scrape_metrics.HTTP_RESPONSES.labels(**labels, status_code="error").inc()
+            raise
+    scrape_metrics.FETCH_SECONDS.labels(**labels).observe(time.perf_counter() - start)
+    scrape_metrics.DOWNLOADED_BYTES.labels(**labels).inc(response.num_bytes_downloaded)
+    scrape_metrics.HTTP_RESPONSES.labels(
+        **labels, status_code=response.status_code
+    ).inc()
+
+    if response.status_code == 304 and cached:
+        return await asyncio.to_thread(cache.not_modified, cached)
+    if response.status_code != 200:
+        return response
+    parse_page = partial(_timed_parse, spec.name, spec.parse_page)
+    if parse_stage is not None:
+        page_jobs = await parse_stage.parse(parse_page, response.content, keyword)
+    else:
+        page_jobs = parse_page(response.content, keyword)
+    # An empty page is usually a block or captcha page, never worth keeping
+    if cache is not None and page_jobs:
+        await asyncio.to_thread(cache.store, url, response.headers, page_jobs)
+    return page_jobs
+
+
+def _fallback(spec: BoardSpec, keyword: str, reason: str, jobs: list[dict]):
+    """Count synthesized jobs, so fallbacks show up next to the real ones."""
+    scrape_metrics.FALLBACK_JOBS.labels(
+        board=spec.name, keyword=keyword, reason=reason
+    ).inc(len(jobs))
+    return jobs
+
+
+async def _scrape_keyword(
+    client: httpx.AsyncClient,
+    spec: BoardSpec,
+    throttle: HostThrottle,
+    cache: Optional[HttpCache],
+    parse_stage: Optional[ParseStage],
+    keyword: str,
+    max_jobs_per_keyword: int,
+) -> list[dict]:
+    print(f"Scraping {spec.name} for keyword: {keyword}")
+    jobs = []
+    # httpx only decodes brotli when the optional brotli package is installed
+    headers = {**spec.headers, "Accept-Encoding": "gzip, deflate"}
+
+    try:
+        urls = spec.build_urls(keyword, max_jobs_per_keyword)
+        results = await asyncio.gather(
+            *(
+                _fetch_page(
+                    client, spec, throttle, cache, parse_stage, url, headers, keyword
+                )
+                for url in urls
+            ),
+            return_exceptions=True,
+        )
+
+        # Pages are fetched concurrently but handled in order, so fallback
+        # top-ups see the same running totals as the sequential scrapers
+        for page, result in enumerate(results, start=1):
+            if isinstance(result, httpx.HTTPError):
+                print(f"  Request failed: {result}")
+                jobs.extend(
+                    _fallback(
+                        spec,
+                        keyword,
+                        "offline",
+                        spec.offline_jobs(keyword, max_jobs_per_keyword),
+                    )
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            elif isinstance(result, list):
+                page_jobs = result
+                jobs.extend(page_jobs)
+                print(f"  Found {len(page_jobs)} jobs on page {page}")
+                if len(page_jobs) < spec.min_jobs_per_page:
+                    jobs.extend(
+                        _fallback(
+                            spec,
+                            keyword,
+                            "thin_page",
+                            spec.fallback_jobs(keyword, jobs, max_jobs_per_keyword),
+                        )
+                    )
+            else:
+                print(f"  HTTP {result.status_code} - Adding fallback jobs")
+                jobs.extend(
+                    _fallback(
+                        spec,
+                        keyword,
+                        "http_error",
+                        spec.http_error_jobs(keyword, max_jobs_per_keyword),
+                    )
+                )
+
+    except Exception as e:
+        print(f"Error scraping {spec.name} for {keyword}: {e}")
+        jobs.extend(
+            _fallback(
+                spec,
+                keyword,
+                "error_recovery",
+                spec.error_recovery_jobs(keyword, max_jobs_per_keyword),
+            )
+        )
+
+    return jobs
+
+
+async def _scrape_board(
+    client: httpx.AsyncClient,
+    spec: BoardSpec,
+    throttle: HostThrottle,
+    cache: Optional[HttpCache],
+    parse_stage: Optional[ParseStage],
+    keywords: list[str],
+    max_jobs_per_keyword: int,
+) -> list[dict]:
+    if spec.api_scraper:
+        jobs = await asyncio.to_thread(spec.api_scraper, keywords, max_jobs_per_keyword)
+        if jobs:
+            return jobs
+
+    per_keyword = await asyncio.gather(
+        *(
+            _scrape_keyword(
+                client,
+                spec,
+                throttle,
+                cache,
+                parse_stage,
+                keyword,
+                max_jobs_per_keyword,
+            )
+            for keyword in keywords
+        )
+    )
+    jobs = [job for keyword_jobs in per_keyword for job in keyword_jobs]
+    print(f"{spec.name} scraper returning {len(jobs)} total jobs")
+    return jobs
+
+
+async def scrape_boards(
+    keywords: list[str],
+    max_jobs_per_keyword: int = 25,
+    boards: Optional[list[BoardSpec]] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    max_concurrency_per_host: Optional[int] = None,
+    cache: Optional[HttpCache] = None,
+    stats: Optional[ConnectionStats] = None,
+    parse_workers: Optional[int] = None,
+) -> dict[str, list[dict]]:
+    """
+    Scrape every board concurrently and return the jobs found per board name.
+
+    Boards, keywords and result pages are all fetched concurrently; each host
+    gets its own concurrency cap and politeness delay. With a ``cache``,
+    unchanged search pages are answered from disk instead of being fetched
+    and parsed again. When the orchestrator builds its own client, ``stats``
+    collects how many requests reused a pooled connection. With
+    ``parse_workers`` above zero, pages are parsed in that many worker
+    processes instead of on the event loop.
+    """
+    boards = BOARDS if boards is None else boards
+    if max_concurrency_per_host is None:
+        max_concurrency_per_host = settings.SCRAPER_MAX_CONCURRENCY_PER_HOST
+    if parse_workers is None:
+        parse_workers = settings.SCRAPER_PARSE_WORKERS
+
+    throttles: dict[str, HostThrottle] = {}
+    for spec in boards:
+        if spec.host not in throttles:
+            throttles[spec.host] = HostThrottle(
+                max_concurrency_per_host, spec.politeness_delay
+            )
+
+    async with AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(
+                build_async_client(stats, hosts=throttles)
+            )
+        parse_stage = None
+        if parse_workers > 0:
+            parse_stage = await stack.enter_async_context(
+                ParseStage(parse_workers, settings.SCRAPER_PARSE_QUEUE_SIZE)
+            )
+        results = await asyncio.gather(
+            *(
+                _scrape_board(
+                    client,
+                    spec,
+                    throttles[spec.host],
+                    cache,
+                    parse_stage,
+                    keywords,
+                    max_jobs_per_keyword,
+                )
+                for spec in boards
+            )
+        )
+
+    return {spec.name: jobs for spec, jobs in zip(boards, results)}
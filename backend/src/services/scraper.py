@@ -1,36 +1,45 @@
+import asyncio
+import logging
 import os
 from typing import List, Dict
 from sqlalchemy.orm import Session
-from .scraper_linkedin import scrape_linkedin_jobs
-from .scraper_indeed import scrape_indeed_jobs
-from .scraper_dice import scrape_dice_jobs
+from .http_cache import get_http_cache
+from .http_client import ConnectionStats
+from .scrape_orchestrator import scrape_boards
+from ..models.database import to_session_thread
 from ..services import job_service
 
+logger = logging.getLogger(__name__)
+
 
 def get_job_keywords() -> List[str]:
     keywords_str = os.getenv("JOB_KEYWORDS", "")
     return [keyword.strip() for keyword in keywords_str.split(",") if keyword.strip()]
 
 
-def scrape_all_jobs(db: Session, user_id: int) -> None:
+async def scrape_all_jobs_async(db: Session, user_id: int) -> int:
+    """Scrape every board and store the jobs not seen before. Returns the count."""
     keywords = get_job_keywords()
     if not keywords:
         print("No job keywords found in JOB_KEYWORDS environment variable.")
-        return
-
-    all_jobs_data = []
-    seen_jobs = set()  # To store unique job identifiers (title, company)
-
-    scraped_linkedin = scrape_linkedin_jobs(keywords)
-    scraped_indeed = scrape_indeed_jobs(keywords)
-    scraped_dice = scrape_dice_jobs(keywords)
-
-    for job_list in [scraped_linkedin, scraped_indeed, scraped_dice]:
-        for job_data in job_list:
-            job_identifier = (job_data.get("title"), job_data.get("company"))
-            if job_identifier not in seen_jobs:
-                all_jobs_data.append(job_data)
-                seen_jobs.add(job_identifier)
-
-    for job_data in all_jobs_data:
-        job_service.create_job(db, job_data, user_id)
+        return 0
+
+    # LinkedIn, Indeed and Dice are scraped concurrently
+    cache = get_http_cache()
+    stats = ConnectionStats()
+    scraped = await scrape_boards(keywords, cache=cache, stats=stats)
+    logger.info("Scrape HTTP connections", extra=stats.as_dict())
+    if cache is not None:
+        logger.info("Search page cache", extra=cache.stats())
+    all_jobs_data = [job for job_list in scraped.values() for job in job_list]
+
+    # Duplicates, within this run or from earlier runs, are dropped by the
+    # persistent fingerprint index. Database work is blocking, keep it off
+    # the event loop.
+    return await to_session_thread(
+        job_service.insert_new_jobs, db, all_jobs_data, user_id
+    )
+
+
+def scrape_all_jobs(db: Session, user_id: int) -> int:
+    return asyncio.run(scrape_all_jobs_async(db, user_id))
@@ -1,10 +1,77 @@
 import requests
-from bs4 import BeautifulSoup
 import time
 import random
 from urllib.parse import urlencode
-import json
+import re
 from typing import List, Dict
+from ..config import settings
+from .extraction import CardSpec, select
+from . import scrape_metrics
+from .http_client import get_session
+from .structured_data import extract_job_postings, posting_fields
+from .synthetic_jobs import synthetic_random
+
+HOST = "www.dice.com"
+SEARCH_URL = "https://www.dice.com/jobs"
+
+# Seconds to wait between two requests to Dice - be more respectful
+POLITENESS_DELAY = (3, 6)
+
+# Pages yielding fewer parsed cards than this get topped up with fallback jobs
+MIN_JOBS_PER_PAGE = 2
+
+# Selectors for the current Dice structure (2024). Cards are found both by
+# class and by data attributes, so both lists are searched.
+CARD_SPEC = CardSpec(
+    cards=(
+        select(
+            "div",
+            classes=r"(?=.*card)(?=.*job)|search-card|job-tile|result-card",
+            ignore_case=True,
+        ),
+        select("div", "article", attrs={"data-cy": re.compile("job", re.IGNORECASE)}),
+    ),
+    fields={
+        "title": (
+            select(
+                "h5", "h4", "h3", classes=["job-title", "card-title"], ignore_case=True
+            ),
+            select("a", classes=["job-title"], ignore_case=True),
+            select("h5", "h4", "h3"),
+        ),
+        "company": (
+            select(
+                "span", "div", "p", classes=["company", "employer"], ignore_case=True
+            ),
+            select("span", attrs={"data-cy": "company-name"}),
+        ),
+        "location": (
+            select("span", "div", classes=["location", "city"], ignore_case=True),
+        ),
+        "salary": (
+            select("span", "div", classes=["salary", "rate", "pay"], ignore_case=True),
+        ),
+    },
+    limit=12,
+    combine_cards=True,
+)
+
+# Updated headers for 2024 - mimicking modern browser
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "max-age=0",
+    "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+}
 
 
 def scrape_dice_jobs(keywords: list[str], max_jobs_per_keyword: int = 25) -> list[dict]:
@@ -15,412 +82,274 @@ def scrape_dice_jobs(keywords: list[str], max_jobs_per_keyword: int = 25) -> lis
     """
     jobs = []
 
-    # Updated headers for 2024 - mimicking modern browser
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Cache-Control": "max-age=0",
-        "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-        "sec-ch-ua-mobile": "?0",
-        "sec-ch-ua-platform": '"Windows"',
-    }
-
     for keyword in keywords:
         print(f"Scraping Dice for keyword: {keyword}")
 
         try:
-            # Updated Dice job search URL structure (2024)
-            params = {
-                "q": keyword,
-                "countryCode": "US",
-                "radius": "30",
-                "radiusUnit": "mi",
-                "page": "1",
-                "pageSize": "20",
-                "filters.postedDate": "ONE",  # Last day
-                "filters.employmentType": "CONTRACTS|FULL_TIME",
-                "language": "en",
-            }
-
             # Try to scrape multiple pages
-            for page in range(1, min(3, max_jobs_per_keyword // 8 + 1)):
-                params["page"] = str(page)
-                url = f"https://www.dice.com/jobs?{urlencode(params)}"
-
+            urls = build_search_urls(keyword, max_jobs_per_keyword)
+            for page, url in enumerate(urls, start=1):
                 try:
-                    response = requests.get(url, headers=headers, timeout=15)
+                    response = get_session().get(
+                        url, headers=HEADERS, timeout=settings.SCRAPER_REQUEST_TIMEOUT
+                    )
 
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, "html.parser")
-
-                        # Try multiple approaches to find job cards
-                        job_cards = []
-
-                        # Method 1: Look for modern Dice job card structure
-                        job_cards.extend(
-                            soup.find_all(
-                                ["div"],
-                                class_=lambda x: (
-                                    x
-                                    and any(
-                                        [
-                                            "card" in x.lower() and "job" in x.lower(),
-                                            "search-card" in x.lower(),
-                                            "job-tile" in x.lower(),
-                                            "result-card" in x.lower(),
-                                        ]
-                                    )
-                                    if x
-                                    else False
-                                ),
-                            )
-                        )
-
-                        # Method 2: Look for job containers with data attributes
-                        job_cards.extend(
-                            soup.find_all(
-                                ["div", "article"],
-                                attrs={
-                                    "data-cy": lambda x: (
-                                        x and "job" in x.lower() if x else False
-                                    )
-                                },
-                            )
-                        )
-
-                        # Method 3: Search for JSON-LD structured data (modern approach)
-                        json_scripts = soup.find_all(
-                            "script", type="application/ld+json"
-                        )
-                        for script in json_scripts:
-                            try:
-                                data = json.loads(script.string)
-                                if (
-                                    isinstance(data, dict)
-                                    and data.get("@type") == "JobPosting"
-                                ):
-                                    jobs.append(
-                                        _extract_job_from_json_ld(data, keyword)
-                                    )
-                                elif isinstance(data, list):
-                                    for item in data:
-                                        if (
-                                            isinstance(item, dict)
-                                            and item.get("@type") == "JobPosting"
-                                        ):
-                                            jobs.append(
-                                                _extract_job_from_json_ld(item, keyword)
-                                            )
-                            except (json.JSONDecodeError, KeyError):
-                                continue
-
-                        page_jobs = 0
-                        for card in job_cards[:12]:  # Limit per page
-                            try:
-                                # Updated selectors for 2024 Dice structure
-                                title_elem = (
-                                    card.find(
-                                        ["h5", "h4", "h3"],
-                                        class_=lambda x: (
-                                            x
-                                            and any(
-                                                [
-                                                    "job-title" in x.lower(),
-                                                    "card-title" in x.lower(),
-                                                ]
-                                            )
-                                            if x
-                                            else False
-                                        ),
-                                    )
-                                    or card.find(
-                                        ["a"],
-                                        class_=lambda x: (
-                                            x and "job-title" in x.lower()
-                                            if x
-                                            else False
-                                        ),
-                                    )
-                                    or card.find(["h5", "h4", "h3"])
-                                )
-
-                                company_elem = card.find(
-                                    ["span", "div", "p"],
-                                    class_=lambda x: (
-                                        x
-                                        and any(
-                                            [
-                                                "company" in x.lower(),
-                                                "employer" in x.lower(),
-                                            ]
-                                        )
-                                        if x
-                                        else False
-                                    ),
-                                ) or card.find(
-                                    ["span"], attrs={"data-cy": "company-name"}
-                                )
-
-                                location_elem = card.find(
-                                    ["span", "div"],
-                                    class_=lambda x: (
-                                        x
-                                        and any(
-                                            [
-                                                "location" in x.lower(),
-                                                "city" in x.lower(),
-                                            ]
-                                        )
-                                        if x
-                                        else False
-                                    ),
-                                )
-
-                                salary_elem = card.find(
-                                    ["span", "div"],
-                                    class_=lambda x: (
-                                        x
-                                        and any(
-                                            [
-                                                "salary" in x.lower(),
-                                                "rate" in x.lower(),
-                                                "pay" in x.lower(),
-                                            ]
-                                        )
-                                        if x
-                                        else False
-                                    ),
-                                )
-
-                                if title_elem and title_elem.get_text(strip=True):
-                                    title = title_elem.get_text(strip=True)
-                                    company = (
-                                        company_elem.get_text(strip=True)
-                                        if company_elem
-                                        else f"Tech Firm {random.randint(100, 999)}"  # nosec
-                                    )
-                                    location = (
-                                        location_elem.get_text(strip=True)
-                                        if location_elem
-                                        else "Multiple Locations"
-                                    )
-
-                                    # Extract salary if available
-                                    salary = (
-                                        salary_elem.get_text(strip=True)
-                                        if salary_elem
-                                        else None
-                                    )
-
-                                    # Clean up extracted data
-                                    title = title.replace("\n", " ").strip()
-                                    company = company.replace("\n", " ").strip()
-
-                                    # Generate job levels and specializations for tech roles
-                                    job_levels = [
-                                        "Senior",
-                                        "Junior",
-                                        "Lead",
-                                        "Principal",
-                                        "Staff",
-                                        "Mid-Level",
-                                    ]
-                                    tech_roles = [
-                                        "DevOps Engineer",
-                                        "Cloud Engineer",
-                                        "Site Reliability Engineer",
-                                        "Platform Engineer",
-                                        "Infrastructure Engineer",
-                                        "Systems Engineer",
-                                    ]
-
-                                    jobs.append(
-                                        {
-                                            "title": f"{random.choice(job_levels)} {title} - {keyword}",  # nosec
-                                            "company": company,
-                                            "description": f"Seeking an experienced {keyword} professional in {location}. Work with cutting-edge technology and modern infrastructure in a collaborative environment.",
-                                            "application_link": f"https://www.dice.com/jobs/detail/{random.randint(10000000, 99999999)}",  # nosec
-                                            "salary": (
-                                                _format_salary(salary)
-                                                if salary
-                                                else f"${random.randint(90, 200)},000 - ${random.randint(130, 250)},000"  # nosec
-                                            ),
-                                            "status": "new",
-                                        }
-                                    )
-                                    page_jobs += 1
-
-                            except Exception as e:  # nosec
-                                continue
-
-                        print(f"  Found {page_jobs} jobs on page {page}")
+                        page_jobs = parse_search_page(response.content, keyword)
+                        jobs.extend(page_jobs)
+                        print(f"  Found {len(page_jobs)} jobs on page {page}")
 
                         # Generate fallback jobs if parsing didn't work well
-                        if page_jobs < 2:
-                            fallback_count = min(
-                                10,
-                                max_jobs_per_keyword
-                                - len([j for j in jobs if keyword in j["title"]]),
+                        if len(page_jobs) < MIN_JOBS_PER_PAGE:
+                            jobs.extend(
+                                fallback_jobs(keyword, jobs, max_jobs_per_keyword)
                             )
-                            for i in range(fallback_count):
-                                engineering_roles = [
-                                    "DevOps Engineer",
-                                    "Cloud Architect",
-                                    "Platform Engineer",
-                                    "Site Reliability Engineer",
-                                    "Infrastructure Engineer",
-                                    "Systems Administrator",
-                                    "Kubernetes Engineer",
-                                    "CI/CD Engineer",
-                                    "Automation Engineer",
-                                    "Security Engineer",
-                                    "Network Engineer",
-                                    "Database Administrator",
-                                ]
-                                tech_companies = [
-                                    "CloudTech Solutions",
-                                    "DevOps Dynamics",
-                                    "Infrastructure Pro",
-                                    "Platform Systems Inc",
-                                    "CloudFirst Technologies",
-                                    "AutomationLab",
-                                    "ScaleUp Engineering",
-                                    "DevSecOps Corp",
-                                    "Container Solutions",
-                                    "TechStack Innovations",
-                                    "SystemsFlow Inc",
-                                    "CloudBridge Technologies",
-                                ]
-
-                                jobs.append(
-                                    {
-                                        "title": f"{random.choice(engineering_roles)} - {keyword}",  # nosec
-                                        "company": f"{random.choice(tech_companies)}",  # nosec
-                                        "description": f"Exciting {keyword} role in a fast-paced environment. Work with modern tools and technologies while building scalable, reliable systems.",
-                                        "application_link": f"https://www.dice.com/jobs/detail/{random.randint(10000000, 99999999)}",  # nosec
-                                        "salary": f"${random.randint(95, 185)},000 - ${random.randint(125, 225)},000",  # nosec
-                                        "status": "new",
-                                    }
-                                )
 
                     else:
                         print(f"  HTTP {response.status_code} - Adding fallback jobs")
-                        # Fallback jobs when request fails
-                        for i in range(min(7, max_jobs_per_keyword)):
-                            jobs.append(
-                                {
-                                    "title": f"DevOps Engineer - {keyword} (Fallback {i+1})",
-                                    "company": f"Dice Partner {random.randint(1, 100)}",  # nosec
-                                    "description": f"Excellent {keyword} opportunity with competitive compensation and modern tech stack.",
-                                    "application_link": f"https://www.dice.com/jobs/detail/{random.randint(10000000, 99999999)}",  # nosec
-                                    "salary": f"${random.randint(100, 170)},000 - ${random.randint(130, 200)},000",  # nosec
-                                    "status": "new",
-                                }
-                            )
+                        jobs.extend(http_error_jobs(keyword, max_jobs_per_keyword))
 
                 except requests.RequestException as e:
                     print(f"  Request failed: {e}")
-                    # Generate offline fallback jobs
-                    for i in range(min(5, max_jobs_per_keyword)):
-                        jobs.append(
-                            {
-                                "title": f"DevOps Engineer - {keyword} (Offline {i+1})",
-                                "company": f"Engineering Firm {random.randint(1, 500)}",  # nosec
-                                "description": f"Great opportunity to work with {keyword} in enterprise environments with cutting-edge tools.",
-                                "application_link": f"https://www.dice.com/jobs/detail/{random.randint(10000000, 99999999)}",  # nosec
-                                "salary": f"${random.randint(85, 175)},000 - ${random.randint(115, 205)},000",  # nosec
-                                "status": "new",
-                            }
-                        )
+                    jobs.extend(offline_jobs(keyword, max_jobs_per_keyword))
 
                 # Rate limiting - be more respectful
-                time.sleep(random.uniform(3, 6))  # nosec
+                time.sleep(random.uniform(*POLITENESS_DELAY))  # nosec
 
         except Exception as e:
             print(f"Error scraping Dice for {keyword}: {e}")
-            # Ensure we always return some jobs
-            for i in range(min(6, max_jobs_per_keyword)):
+            jobs.extend(error_recovery_jobs(keyword, max_jobs_per_keyword))
+
+    print(f"Dice scraper returning {len(jobs)} total jobs")
+    return jobs
+
+
+def build_search_urls(
+    keyword: str, max_jobs_per_keyword: int, base_url: str = SEARCH_URL
+) -> list[str]:
+    """Return the search result page URLs to fetch for one keyword."""
+    # Updated Dice job search URL structure (2024)
+    params = {
+        "q": keyword,
+        "countryCode": "US",
+        "radius": "30",
+        "radiusUnit": "mi",
+        "page": "1",
+        "pageSize": "20",
+        "filters.postedDate": "ONE",  # Last day
+        "filters.employmentType": "CONTRACTS|FULL_TIME",
+        "language": "en",
+    }
+
+    urls = []
+    for page in range(1, min(3, max_jobs_per_keyword // 8 + 1)):
+        params["page"] = str(page)
+        urls.append(f"{base_url}?{urlencode(params)}")
+    return urls
+
+
+def parse_search_page(content: bytes, keyword: str) -> list[dict]:
+    """Extract the job postings of one Dice search result page.
+
+    Dice embeds JSON-LD postings (modern approach), which are used when
+    present; the job cards are only parsed when the page has none.
+    """
+    postings = extract_job_postings(content, "Dice")
+    if postings:
+        scrape_metrics.observe(
+            "cards_found", len(postings), board="Dice", keyword=keyword
+        )
+        return [_extract_job_from_json_ld(posting, keyword) for posting in postings]
+
+    jobs = []
+    soup = CARD_SPEC.parse(content)
+    cards = CARD_SPEC.find_cards(soup)
+    scrape_metrics.observe("cards_found", len(cards), board="Dice", keyword=keyword)
+
+    for card in cards:
+        try:
+            fields = CARD_SPEC.extract(card)
+            rng = synthetic_random("Dice", keyword, card.get_text(" ", strip=True))
+            title_elem = fields["title"]
+            company_elem = fields["company"]
+            location_elem = fields["location"]
+            salary_elem = fields["salary"]
+
+            if title_elem and title_elem.get_text(strip=True):
+                title = title_elem.get_text(strip=True)
+                company = (
+                    company_elem.get_text(strip=True)
+                    if company_elem
+                    else f"Tech Firm {rng.randint(100, 999)}"  # nosec
+                )
+                location = (
+                    location_elem.get_text(strip=True)
+                    if location_elem
+                    else "Multiple Locations"
+                )
+
+                # Extract salary if available
+                salary = salary_elem.get_text(strip=True) if salary_elem else None
+
+                # Clean up extracted data
+                title = title.replace("\n", " ").strip()
+                company = company.replace("\n", " ").strip()
+
+                # Generate job levels for tech roles
+                job_levels = [
+                    "Senior",
+                    "Junior",
+                    "Lead",
+                    "Principal",
+                    "Staff",
+                    "Mid-Level",
+                ]
+
                 jobs.append(
                     {
-                        "title": f"DevOps Engineer - {keyword} (Error Recovery {i+1})",
-                        "company": f"Dice Backup {random.randint(1, 200)}",  # nosec
-                        "description": f"DevOps role focusing on {keyword} technologies and automation in modern cloud environments.",
-                        "application_link": f"https://www.dice.com/jobs/detail/{random.randint(10000000, 99999999)}",  # nosec
-                        "salary": f"${random.randint(95, 165)},000 - ${random.randint(125, 195)},000",  # nosec
+                        "title": f"{rng.choice(job_levels)} {title} - {keyword}",  # nosec
+                        "company": company,
+                        "description": f"Seeking an experienced {keyword} professional in {location}. Work with cutting-edge technology and modern infrastructure in a collaborative environment.",
+                        "application_link": f"https://www.dice.com/jobs/detail/{rng.randint(10000000, 99999999)}",  # nosec
+                        "salary": (
+                            _format_salary(salary, rng)
+                            if salary
+                            else f"${rng.randint(90, 200)},000 - ${rng.randint(130, 250)},000"  # nosec
+                        ),
                         "status": "new",
                     }
                 )
 
-    print(f"Dice scraper returning {len(jobs)} total jobs")
+        except Exception as e:  # nosec
+            continue
+
     return jobs
 
 
-def _extract_job_from_json_ld(data: dict, keyword: str) -> dict:
-    """Extract job information from JSON-LD structured data."""
-    try:
-        hiring_org = data.get("hiringOrganization", {})
-        company = hiring_org.get(
-            "name", f"Tech Company {random.randint(100, 999)}"  # nosec
-        )  # nosec
-
-        job_location = data.get("jobLocation", {})
-        location = "Remote"
-        if isinstance(job_location, dict):
-            address = job_location.get("address", {})
-            if isinstance(address, dict):
-                location = f"{address.get('addressLocality', 'Remote')}, {address.get('addressRegion', 'US')}"
-
-        salary_info = data.get("baseSalary", {})
-        salary = (
-            f"${random.randint(90, 180)},000 - ${random.randint(120, 220)},000"  # nosec
+def fallback_jobs(
+    keyword: str, jobs: list[dict], max_jobs_per_keyword: int
+) -> list[dict]:
+    """Top up a keyword whose page yielded too few parsed cards."""
+    rng = synthetic_random("Dice", keyword, "fallback")
+    fallback = []
+    fallback_count = min(
+        10,
+        max_jobs_per_keyword - len([j for j in jobs if keyword in j["title"]]),
+    )
+    for i in range(fallback_count):
+        engineering_roles = [
+            "DevOps Engineer",
+            "Cloud Architect",
+            "Platform Engineer",
+            "Site Reliability Engineer",
+            "Infrastructure Engineer",
+            "Systems Administrator",
+            "Kubernetes Engineer",
+            "CI/CD Engineer",
+            "Automation Engineer",
+            "Security Engineer",
+            "Network Engineer",
+            "Database Administrator",
+        ]
+        tech_companies = [
+            "CloudTech Solutions",
+            "DevOps Dynamics",
+            "Infrastructure Pro",
+            "Platform Systems Inc",
+            "CloudFirst Technologies",
+            "AutomationLab",
+            "ScaleUp Engineering",
+            "DevSecOps Corp",
+            "Container Solutions",
+            "TechStack Innovations",
+            "SystemsFlow Inc",
+            "CloudBridge Technologies",
+        ]
+
+        fallback.append(
+            {
+                "title": f"{rng.choice(engineering_roles)} - {keyword}",  # nosec
+                "company": f"{rng.choice(tech_companies)}",  # nosec
+                "description": f"Exciting {keyword} role in a fast-paced environment. Work with modern tools and technologies while building scalable, reliable systems.",
+                "application_link": f"https://www.dice.com/jobs/detail/{rng.randint(10000000, 99999999)}",  # nosec
+                "salary": f"${rng.randint(95, 185)},000 - ${rng.randint(125, 225)},000",  # nosec
+                "status": "new",
+            }
         )
-        if isinstance(salary_info, dict):
-            value = salary_info.get("value", {})
-            if isinstance(value, dict):
-                min_val = value.get("minValue")
-                max_val = value.get("maxValue")
-                if min_val and max_val:
-                    salary = f"${int(min_val):,} - ${int(max_val):,}"
-
-        return {
-            "title": f"{data.get('title', f'Engineer - {keyword}')} - {keyword}",
-            "company": company,
-            "description": data.get(
-                "description", f"Great {keyword} opportunity in {location}"
-            )[:200]
-            + "...",
-            "application_link": data.get(
-                "url",
-                f"https://www.dice.com/jobs/detail/{random.randint(10000000, 99999999)}",  # nosec
-            ),
-            "salary": salary,
+    return fallback
+
+
+def http_error_jobs(keyword: str, max_jobs_per_keyword: int) -> list[dict]:
+    """Fallback jobs when Dice answers with a non-200 status."""
+    rng = synthetic_random("Dice", keyword, "http_error")
+    return [
+        {
+            "title": f"DevOps Engineer - {keyword} (Fallback {i+1})",
+            "company": f"Dice Partner {rng.randint(1, 100)}",  # nosec
+            "description": f"Excellent {keyword} opportunity with competitive compensation and modern tech stack.",
+            "application_link": f"https://www.dice.com/jobs/detail/{rng.randint(10000000, 99999999)}",  # nosec
+            "salary": f"${rng.randint(100, 170)},000 - ${rng.randint(130, 200)},000",  # nosec
             "status": "new",
         }
-    except Exception:
-        # Fallback job if JSON parsing fails
-        return {
-            "title": f"Engineer - {keyword} (JSON Parsed)",
-            "company": f"Tech Company {random.randint(100, 999)}",  # nosec
-            "description": f"Excellent {keyword} opportunity with modern technology stack.",
-            "application_link": f"https://www.dice.com/jobs/detail/{random.randint(10000000, 99999999)}",  # nosec
-            "salary": f"${random.randint(90, 180)},000 - ${random.randint(120, 220)},000",  # nosec
+        for i in range(min(7, max_jobs_per_keyword))
+    ]
+
+
+def offline_jobs(keyword: str, max_jobs_per_keyword: int) -> list[dict]:
+    """Generate offline fallback jobs when the request to Dice fails."""
+    rng = synthetic_random("Dice", keyword, "offline")
+    return [
+        {
+            "title": f"DevOps Engineer - {keyword} (Offline {i+1})",
+            "company": f"Engineering Firm {rng.randint(1, 500)}",  # nosec
+            "description": f"Great opportunity to work with {keyword} in enterprise environments with cutting-edge tools.",
+            "application_link": f"https://www.dice.com/jobs/detail/{rng.randint(10000000, 99999999)}",  # nosec
+            "salary": f"${rng.randint(85, 175)},000 - ${rng.randint(115, 205)},000",  # nosec
             "status": "new",
         }
+        for i in range(min(5, max_jobs_per_keyword))
+    ]
+
+
+def error_recovery_jobs(keyword: str, max_jobs_per_keyword: int) -> list[dict]:
+    """Ensure we always return some jobs when a keyword errors out."""
+    rng = synthetic_random("Dice", keyword, "error_recovery")
+    return [
+        {
+            "title": f"DevOps Engineer - {keyword} (Error Recovery {i+1})",
+            "company": f"Dice Backup {rng.randint(1, 200)}",  # nosec
+            "description": f"DevOps role focusing on {keyword} technologies and automation in modern cloud environments.",
+            "application_link": f"https://www.dice.com/jobs/detail/{rng.randint(10000000, 99999999)}",  # nosec
+            "salary": f"${rng.randint(95, 165)},000 - ${rng.randint(125, 195)},000",  # nosec
+            "status": "new",
+        }
+        for i in range(min(6, max_jobs_per_keyword))
+    ]
 
 
-def _format_salary(salary_text: str) -> str:
+def _extract_job_from_json_ld(data: dict, keyword: str) -> dict:
+    """Extract job information from JSON-LD structured data."""
+    fields = posting_fields(data)
+    rng = synthetic_random("Dice", keyword, fields["title"], fields["company"])
+    location = fields["location"] or "Remote"
+    description = fields["description"] or f"Great {keyword} opportunity in {location}"
+    return {
+        "title": f"{fields['title'] or f'Engineer - {keyword}'} - {keyword}",
+        "company": fields["company"]
+        or f"Tech Company {rng.randint(100, 999)}",  # nosec
+        "description": description[:200] + "...",
+        "application_link": fields["url"]
+        or f"https://www.dice.com/jobs/detail/{rng.randint(10000000, 99999999)}",  # nosec
+        "salary": fields["salary"]
+        or f"${rng.randint(90, 180)},000 - ${rng.randint(120, 220)},000",  # nosec
+        "status": "new",
+    }
+
+
+def _format_salary(salary_text: str, rng: random.Random) -> str:
     """Format salary text into a consistent format."""
     if not salary_text or not isinstance(salary_text, str):
-        return (
-            f"${random.randint(90, 180)},000 - ${random.randint(120, 220)},000"  # nosec
-        )
+        return f"${rng.randint(90, 180)},000 - ${rng.randint(120, 220)},000"  # nosec
 
     # Clean up the salary text
     salary_text = salary_text.strip().replace(",", "")
@@ -438,7 +367,7 @@ def _format_salary(salary_text: str) -> str:
         return f"${base:,} - ${int(base * 1.3):,}"
 
     # Fallback
-    return f"${random.randint(90, 180)},000 - ${random.randint(120, 220)},000"  # nosec
+    return f"${rng.randint(90, 180)},000 - ${rng.randint(120, 220)},000"  # nosec
 
 
 if __name__ == "__main__":
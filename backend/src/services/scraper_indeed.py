@@ -1,10 +1,68 @@
 import requests
-from bs4 import BeautifulSoup
 import time
 import random
 from urllib.parse import urlencode
 import os
 from typing import List, Dict
+from ..config import settings
+from .extraction import CardSpec, select
+from . import scrape_metrics
+from .http_client import get_session
+from .structured_data import extract_job_postings, posting_fields
+from .synthetic_jobs import synthetic_random
+
+HOST = "www.indeed.com"
+SEARCH_URL = "https://www.indeed.com/jobs"
+
+# Seconds to wait between two requests to Indeed
+POLITENESS_DELAY = (2, 5)
+
+# Pages yielding fewer parsed cards than this get topped up with fallback jobs
+MIN_JOBS_PER_PAGE = 3
+
+# Selectors for the current Indeed structure (2024)
+CARD_SPEC = CardSpec(
+    cards=(
+        select(
+            "div",
+            "td",
+            "li",
+            classes=r"jobsearch-SerpJobCard|job_seen_beacon|slider_container"
+            r"|(?i:(?<!no)result)",
+        ),
+        select("div", attrs={"data-jk": True}),
+    ),
+    fields={
+        "title": (
+            select("h2", "a", attrs={"data-jk": True}),
+            select("h2", "span", classes=["jobTitle"]),
+            select("a", classes=["jobTitle"]),
+        ),
+        "company": (
+            select("span", "a", classes=["companyName"]),
+            select("span", attrs={"data-testid": "company-name"}),
+            select("div", classes=["company"], ignore_case=True),
+        ),
+        "salary": (select("span", "div", classes=["salary"], ignore_case=True),),
+        "location": (select("div", "span", attrs={"data-testid": "job-location"}),),
+    },
+    limit=20,
+    outermost_only=True,
+)
+
+# Updated headers for 2024
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "max-age=0",
+}
 
 
 def scrape_indeed_jobs(
@@ -14,25 +72,32 @@ def scrape_indeed_jobs(
     Scrape Indeed jobs using official Indeed API when available, fallback to web scraping.
     Returns multiple jobs per keyword to address the "handful vs countless" issue.
     """
-    jobs = []
-
     # Try Indeed Publisher API first if credentials are available
-    indeed_publisher_id = os.getenv("INDEED_PUBLISHER_ID")
-    if indeed_publisher_id:
-        try:
-            jobs = _scrape_via_indeed_api(
-                keywords, max_jobs_per_keyword, indeed_publisher_id
-            )
-            if jobs:
-                print(f"Indeed API scraper returning {len(jobs)} total jobs")
-                return jobs
-        except Exception as e:
-            print(f"Indeed API failed, falling back to web scraping: {e}")
+    jobs = scrape_via_api(keywords, max_jobs_per_keyword)
+    if jobs:
+        return jobs
 
     # Fallback to web scraping with updated selectors
     return _scrape_via_web_scraping(keywords, max_jobs_per_keyword)
 
 
+def scrape_via_api(keywords: list[str], max_jobs_per_keyword: int) -> list[dict]:
+    """Return Indeed API results, or an empty list when the API is unavailable."""
+    indeed_publisher_id = os.getenv("INDEED_PUBLISHER_ID")
+    if not indeed_publisher_id:
+        return []
+    try:
+        jobs = _scrape_via_indeed_api(
+            keywords, max_jobs_per_keyword, indeed_publisher_id
+        )
+        if jobs:
+            print(f"Indeed API scraper returning {len(jobs)} total jobs")
+        return jobs
+    except Exception as e:
+        print(f"Indeed API failed, falling back to web scraping: {e}")
+        return []
+
+
 def _scrape_via_indeed_api(
     keywords: list[str], max_jobs_per_keyword: int, publisher_id: str
 ) -> list[dict]:
@@ -68,7 +133,7 @@ def _scrape_via_indeed_api(
                 "format": "json",
             }
 
-            response = requests.get(
+            response = get_session().get(
                 "https://api.indeed.com/ads/apisearch", params=params, timeout=10
             )
 
@@ -77,6 +142,12 @@ def _scrape_via_indeed_api(
                 results = data.get("results", [])
 
                 for job_data in results:
+                    rng = synthetic_random(
+                        "Indeed",
+                        keyword,
+                        job_data.get("jobtitle"),
+                        job_data.get("company"),
+                    )
                     jobs.append(
                         {
                             "title": f"{job_data.get('jobtitle', f'Job - {keyword}')} - {keyword}",
@@ -87,9 +158,9 @@ def _scrape_via_indeed_api(
                             ),
                             "application_link": job_data.get(
                                 "url",
-                                f"https://www.indeed.com/viewjob?jk={random.randint(1000000000, 9999999999)}",  # nosec
+                                f"https://www.indeed.com/viewjob?jk={rng.randint(1000000000, 9999999999)}",  # nosec
                             ),
-                            "salary": _extract_salary_from_api(job_data, keyword),
+                            "salary": _extract_salary_from_api(job_data, keyword, rng),
                             "status": "new",
                         }
                     )
@@ -112,287 +183,264 @@ def _scrape_via_web_scraping(
     """
     jobs = []
 
-    # Updated headers for 2024
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Cache-Control": "max-age=0",
-    }
-
     for keyword in keywords:
         print(f"Scraping Indeed via web for keyword: {keyword}")
 
         try:
-            # Updated Indeed job search URL structure (2024)
-            params = {
-                "q": keyword,
-                "l": "",  # No location filter
-                "sort": "date",
-                "fromage": "1",  # Last 1 day
-                "limit": "50",
-                "start": "0",
-                "radius": "50",
-            }
-
             # Try to scrape multiple pages
-            for page in range(0, min(2, max_jobs_per_keyword // 15)):
-                params["start"] = str(page * 50)
-                url = f"https://www.indeed.com/jobs?{urlencode(params)}"
-
+            urls = build_search_urls(keyword, max_jobs_per_keyword)
+            for page, url in enumerate(urls, start=1):
                 try:
-                    response = requests.get(url, headers=headers, timeout=15)
+                    response = get_session().get(
+                        url, headers=HEADERS, timeout=settings.SCRAPER_REQUEST_TIMEOUT
+                    )
 
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, "html.parser")
-
-                        # Updated selectors for current Indeed structure (2024)
-                        job_cards = soup.find_all(
-                            ["div", "td", "li"],
-                            class_=lambda x: (
-                                x
-                                and any(
-                                    [
-                                        "jobsearch-SerpJobCard" in x,
-                                        "job_seen_beacon" in x,
-                                        "slider_container" in x,
-                                        "jobsearch-NoResult" not in x,
-                                        "result" in x.lower(),
-                                    ]
-                                )
-                                if x
-                                else False
-                            ),
-                        ) or soup.find_all("div", attrs={"data-jk": True})
-
-                        page_jobs = 0
-                        for card in job_cards[:20]:  # Limit per page
-                            try:
-                                # Updated selectors for 2024 Indeed structure
-                                title_elem = (
-                                    card.find(["h2", "a"], attrs={"data-jk": True})
-                                    or card.find(
-                                        ["h2", "span"],
-                                        class_=lambda x: (
-                                            x and "jobTitle" in x if x else False
-                                        ),
-                                    )
-                                    or card.find(
-                                        ["a"],
-                                        class_=lambda x: (
-                                            x
-                                            and any(
-                                                [
-                                                    "jobTitle" in x,
-                                                    "jobTitle-color-purple" in x,
-                                                ]
-                                            )
-                                            if x
-                                            else False
-                                        ),
-                                    )
-                                )
-
-                                company_elem = (
-                                    card.find(
-                                        ["span", "a"],
-                                        class_=lambda x: (
-                                            x and "companyName" in x if x else False
-                                        ),
-                                    )
-                                    or card.find(
-                                        ["span"], attrs={"data-testid": "company-name"}
-                                    )
-                                    or card.find(
-                                        ["div"],
-                                        class_=lambda x: (
-                                            x and "company" in x.lower() if x else False
-                                        ),
-                                    )
-                                )
-
-                                salary_elem = card.find(
-                                    ["span", "div"],
-                                    class_=lambda x: (
-                                        x
-                                        and any(
-                                            [
-                                                "salary" in x.lower(),
-                                                "estimated-salary" in x,
-                                            ]
-                                        )
-                                        if x
-                                        else False
-                                    ),
-                                )
-
-                                location_elem = card.find(
-                                    ["div", "span"],
-                                    attrs={"data-testid": "job-location"},
-                                )
-
-                                if title_elem and title_elem.get_text(strip=True):
-                                    title = title_elem.get_text(strip=True)
-                                    company = (
-                                        company_elem.get_text(strip=True)
-                                        if company_elem
-                                        else f"Hiring Company {random.randint(100, 999)}"  # nosec
-                                    )
-                                    location = (
-                                        location_elem.get_text(strip=True)
-                                        if location_elem
-                                        else "Multiple Locations"
-                                    )
-
-                                    # Extract salary if available
-                                    salary = (
-                                        salary_elem.get_text(strip=True)
-                                        if salary_elem
-                                        else f"${random.randint(70, 190)},000 - ${random.randint(110, 230)},000"  # nosec
-                                    )
-
-                                    # Clean up extracted data
-                                    title = title.replace("\n", " ").strip()
-                                    company = company.replace("\n", " ").strip()
-
-                                    # Generate job types and details
-                                    job_levels = [
-                                        "Senior",
-                                        "Junior",
-                                        "Mid-Level",
-                                        "Lead",
-                                        "Principal",
-                                    ]
-                                    specializations = [
-                                        "Analyst",
-                                        "Specialist",
-                                        "Engineer",
-                                        "Developer",
-                                        "Manager",
-                                    ]
-
-                                    jobs.append(
-                                        {
-                                            "title": f"{random.choice(job_levels)} {title} - {keyword}",  # nosec
-                                            "company": company,
-                                            "description": f"Join our team in {location} as a {keyword} professional. We offer excellent benefits and opportunities for career advancement.",
-                                            "application_link": f"https://www.indeed.com/viewjob?jk={random.randint(1000000000, 9999999999)}",  # nosec
-                                            "salary": (
-                                                salary
-                                                if "$" in salary
-                                                else f"${random.randint(75, 190)},000 - ${random.randint(110, 230)},000"  # nosec
-                                            ),
-                                            "status": "new",
-                                        }
-                                    )
-                                    page_jobs += 1
-
-                            except Exception as e:  # nosec
-                                continue
-
-                        print(f"  Found {page_jobs} jobs on page {page + 1}")
+                        page_jobs = parse_search_page(response.content, keyword)
+                        jobs.extend(page_jobs)
+                        print(f"  Found {len(page_jobs)} jobs on page {page}")
 
                         # Generate fallback jobs if parsing didn't work well
-                        if page_jobs < 3:
-                            fallback_count = min(
-                                12,
-                                max_jobs_per_keyword
-                                - len([j for j in jobs if keyword in j["title"]]),
+                        if len(page_jobs) < MIN_JOBS_PER_PAGE:
+                            jobs.extend(
+                                fallback_jobs(keyword, jobs, max_jobs_per_keyword)
                             )
-                            for i in range(fallback_count):
-                                job_roles = [
-                                    "Data Scientist",
-                                    "Business Analyst",
-                                    "Research Analyst",
-                                    "Data Engineer",
-                                    "Analytics Manager",
-                                    "Quantitative Analyst",
-                                    "Machine Learning Engineer",
-                                    "Data Architect",
-                                    "BI Developer",
-                                ]
-                                companies = [
-                                    "DataCorp Solutions",
-                                    "Analytics Plus",
-                                    "Insight Technologies",
-                                    "Business Intelligence Inc",
-                                    "Data Dynamics",
-                                    "Analytics First",
-                                    "Information Systems LLC",
-                                    "Data Solutions Group",
-                                    "TechFlow Inc",
-                                ]
-
-                                jobs.append(
-                                    {
-                                        "title": f"{random.choice(job_roles)} - {keyword}",  # nosec
-                                        "company": f"{random.choice(companies)}",  # nosec
-                                        "description": f"Exciting opportunity to work with {keyword} data and analytics. Join our growing team and make a real impact with data-driven insights.",
-                                        "application_link": f"https://www.indeed.com/viewjob?jk={random.randint(1000000000, 9999999999)}",  # nosec
-                                        "salary": f"${random.randint(80, 170)},000 - ${random.randint(110, 210)},000",  # nosec
-                                        "status": "new",
-                                    }
-                                )
 
                     else:
                         print(f"  HTTP {response.status_code} - Adding fallback jobs")
-                        # Fallback jobs when request fails
-                        for i in range(min(8, max_jobs_per_keyword)):
-                            jobs.append(
-                                {
-                                    "title": f"Data Analyst - {keyword} (Fallback {i+1})",
-                                    "company": f"Indeed Employer {random.randint(1, 100)}",  # nosec
-                                    "description": f"Great {keyword} position with excellent growth opportunities and competitive benefits.",
-                                    "application_link": f"https://www.indeed.com/viewjob?jk={random.randint(1000000000, 9999999999)}",  # nosec
-                                    "salary": f"${random.randint(90, 150)},000 - ${random.randint(120, 180)},000",  # nosec
-                                    "status": "new",
-                                }
-                            )
+                        jobs.extend(http_error_jobs(keyword, max_jobs_per_keyword))
 
                 except requests.RequestException as e:
                     print(f"  Request failed: {e}")
-                    # Generate offline fallback jobs
-                    for i in range(min(6, max_jobs_per_keyword)):
-                        jobs.append(
-                            {
-                                "title": f"Data Scientist - {keyword} (Offline {i+1})",
-                                "company": f"Data Company {random.randint(1, 500)}",  # nosec
-                                "description": f"Opportunity to leverage {keyword} skills in data science and analytics.",
-                                "application_link": f"https://www.indeed.com/viewjob?jk={random.randint(1000000000, 9999999999)}",  # nosec
-                                "salary": f"${random.randint(85, 165)},000 - ${random.randint(115, 195)},000",  # nosec
-                                "status": "new",
-                            }
-                        )
+                    jobs.extend(offline_jobs(keyword, max_jobs_per_keyword))
 
                 # Rate limiting
-                time.sleep(random.uniform(2, 5))  # nosec
+                time.sleep(random.uniform(*POLITENESS_DELAY))  # nosec
 
         except Exception as e:
             print(f"Error scraping Indeed for {keyword}: {e}")
-            # Ensure we always return some jobs
-            for i in range(min(8, max_jobs_per_keyword)):
+            jobs.extend(error_recovery_jobs(keyword, max_jobs_per_keyword))
+
+    print(f"Indeed web scraper returning {len(jobs)} total jobs")
+    return jobs
+
+
+def build_search_urls(
+    keyword: str, max_jobs_per_keyword: int, base_url: str = SEARCH_URL
+) -> list[str]:
+    """Return the search result page URLs to fetch for one keyword."""
+    # Updated Indeed job search URL structure (2024)
+    params = {
+        "q": keyword,
+        "l": "",  # No location filter
+        "sort": "date",
+        "fromage": "1",  # Last 1 day
+        "limit": "50",
+        "start": "0",
+        "radius": "50",
+    }
+
+    urls = []
+    for page in range(0, min(2, max_jobs_per_keyword // 15)):
+        params["start"] = str(page * 50)
+        urls.append(f"{base_url}?{urlencode(params)}")
+    return urls
+
+
+def parse_search_page(content: bytes, keyword: str) -> list[dict]:
+    """Extract the job postings of one Indeed search result page.
+
+    Embedded JSON-LD postings are used when present; the job cards are only
+    parsed when the page has none.
+    """
+    postings = extract_job_postings(content, "Indeed")
+    if postings:
+        scrape_metrics.observe(
+            "cards_found", len(postings), board="Indeed", keyword=keyword
+        )
+        return [_job_from_posting(posting, keyword) for posting in postings]
+
+    jobs = []
+    soup = CARD_SPEC.parse(content)
+    cards = CARD_SPEC.find_cards(soup)
+    scrape_metrics.observe("cards_found", len(cards), board="Indeed", keyword=keyword)
+
+    for card in cards:
+        try:
+            fields = CARD_SPEC.extract(card)
+            rng = synthetic_random("Indeed", keyword, card.get_text(" ", strip=True))
+            title_elem = fields["title"]
+            company_elem = fields["company"]
+            salary_elem = fields["salary"]
+            location_elem = fields["location"]
+
+            if title_elem and title_elem.get_text(strip=True):
+                title = title_elem.get_text(strip=True)
+                company = (
+                    company_elem.get_text(strip=True)
+                    if company_elem
+                    else f"Hiring Company {rng.randint(100, 999)}"  # nosec
+                )
+                location = (
+                    location_elem.get_text(strip=True)
+                    if location_elem
+                    else "Multiple Locations"
+                )
+
+                # Extract salary if available
+                salary = (
+                    salary_elem.get_text(strip=True)
+                    if salary_elem
+                    else f"${rng.randint(70, 190)},000 - ${rng.randint(110, 230)},000"  # nosec
+                )
+
+                # Clean up extracted data
+                title = title.replace("\n", " ").strip()
+                company = company.replace("\n", " ").strip()
+
+                # Generate job types and details
+                job_levels = [
+                    "Senior",
+                    "Junior",
+                    "Mid-Level",
+                    "Lead",
+                    "Principal",
+                ]
+
                 jobs.append(
                     {
-                        "title": f"Data Scientist - {keyword} (Error Recovery {i+1})",
-                        "company": f"Indeed Backup {random.randint(1, 200)}",  # nosec
-                        "description": f"Data science role focusing on {keyword} analysis and insights.",
-                        "application_link": f"https://www.indeed.com/viewjob?jk={random.randint(1000000000, 9999999999)}",  # nosec
-                        "salary": f"${random.randint(95, 155)},000 - ${random.randint(125, 185)},000",  # nosec
+                        "title": f"{rng.choice(job_levels)} {title} - {keyword}",  # nosec
+                        "company": company,
+                        "description": f"Join our team in {location} as a {keyword} professional. We offer excellent benefits and opportunities for career advancement.",
+                        "application_link": f"https://www.indeed.com/viewjob?jk={rng.randint(1000000000, 9999999999)}",  # nosec
+                        "salary": (
+                            salary
+                            if "$" in salary
+                            else f"${rng.randint(75, 190)},000 - ${rng.randint(110, 230)},000"  # nosec
+                        ),
                         "status": "new",
                     }
                 )
 
-    print(f"Indeed web scraper returning {len(jobs)} total jobs")
+        except Exception as e:  # nosec
+            continue
+
     return jobs
 
 
-def _extract_salary_from_api(job_data: dict, keyword: str) -> str:
+def fallback_jobs(
+    keyword: str, jobs: list[dict], max_jobs_per_keyword: int
+) -> list[dict]:
+    """Top up a keyword whose page yielded too few parsed cards."""
+    rng = synthetic_random("Indeed", keyword, "fallback")
+    fallback = []
+    fallback_count = min(
+        12,
+        max_jobs_per_keyword - len([j for j in jobs if keyword in j["title"]]),
+    )
+    for i in range(fallback_count):
+        job_roles = [
+            "Data Scientist",
+            "Business Analyst",
+            "Research Analyst",
+            "Data Engineer",
+            "Analytics Manager",
+            "Quantitative Analyst",
+            "Machine Learning Engineer",
+            "Data Architect",
+            "BI Developer",
+        ]
+        companies = [
+            "DataCorp Solutions",
+            "Analytics Plus",
+            "Insight Technologies",
+            "Business Intelligence Inc",
+            "Data Dynamics",
+            "Analytics First",
+            "Information Systems LLC",
+            "Data Solutions Group",
+            "TechFlow Inc",
+        ]
+
+        fallback.append(
+            {
+                "title": f"{rng.choice(job_roles)} - {keyword}",  # nosec
+                "company": f"{rng.choice(companies)}",  # nosec
+                "description": f"Exciting opportunity to work with {keyword} data and analytics. Join our growing team and make a real impact with data-driven insights.",
+                "application_link": f"https://www.indeed.com/viewjob?jk={rng.randint(1000000000, 9999999999)}",  # nosec
+                "salary": f"${rng.randint(80, 170)},000 - ${rng.randint(110, 210)},000",  # nosec
+                "status": "new",
+            }
+        )
+    return fallback
+
+
+def http_error_jobs(keyword: str, max_jobs_per_keyword: int) -> list[dict]:
+    """Fallback jobs when Indeed answers with a non-200 status."""
+    rng = synthetic_random("Indeed", keyword, "http_error")
+    return [
+        {
+            "title": f"Data Analyst - {keyword} (Fallback {i+1})",
+            "company": f"Indeed Employer {rng.randint(1, 100)}",  # nosec
+            "description": f"Great {keyword} position with excellent growth opportunities and competitive benefits.",
+            "application_link": f"https://www.indeed.com/viewjob?jk={rng.randint(1000000000, 9999999999)}",  # nosec
+            "salary": f"${rng.randint(90, 150)},000 - ${rng.randint(120, 180)},000",  # nosec
+            "status": "new",
+        }
+        for i in range(min(8, max_jobs_per_keyword))
+    ]
+
+
+def offline_jobs(keyword: str, max_jobs_per_keyword: int) -> list[dict]:
+    """Fallback jobs when the request to Indeed fails outright."""
+    rng = synthetic_random("Indeed", keyword, "offline")
+    return [
+        {
+            "title": f"Data Scientist - {keyword} (Offline {i+1})",
+            "company": f"Data Company {rng.randint(1, 500)}",  # nosec
+            "description": f"Opportunity to leverage {keyword} skills in data science and analytics.",
+            "application_link": f"https://www.indeed.com/viewjob?jk={rng.randint(1000000000, 9999999999)}",  # nosec
+            "salary": f"${rng.randint(85, 165)},000 - ${rng.randint(115, 195)},000",  # nosec
+            "status": "new",
+        }
+        for i in range(min(6, max_jobs_per_keyword))
+    ]
+
+
+def error_recovery_jobs(keyword: str, max_jobs_per_keyword: int) -> list[dict]:
+    """Ensure we always return some jobs when a keyword errors out."""
+    rng = synthetic_random("Indeed", keyword, "error_recovery")
+    return [
+        {
+            "title": f"Data Scientist - {keyword} (Error Recovery {i+1})",
+            "company": f"Indeed Backup {rng.randint(1, 200)}",  # nosec
+            "description": f"Data science role focusing on {keyword} analysis and insights.",
+            "application_link": f"https://www.indeed.com/viewjob?jk={rng.randint(1000000000, 9999999999)}",  # nosec
+            "salary": f"${rng.randint(95, 155)},000 - ${rng.randint(125, 185)},000",  # nosec
+            "status": "new",
+        }
+        for i in range(min(8, max_jobs_per_keyword))
+    ]
+
+
+def _job_from_posting(data: dict, keyword: str) -> dict:
+    """Map a JSON-LD JobPosting to an Indeed job."""
+    fields = posting_fields(data)
+    rng = synthetic_random("Indeed", keyword, fields["title"], fields["company"])
+    location = fields["location"] or "Multiple Locations"
+    return {
+        "title": f"{fields['title'] or f'Job - {keyword}'} - {keyword}",
+        "company": fields["company"] or "Indeed Partner",
+        "description": fields["description"]
+        or f"Join our team in {location} as a {keyword} professional.",
+        "application_link": fields["url"]
+        or f"https://www.indeed.com/viewjob?jk={rng.randint(1000000000, 9999999999)}",  # nosec
+        "salary": fields["salary"] or _extract_salary_from_api({}, keyword, rng),
+        "status": "new",
+    }
+
+
+def _extract_salary_from_api(job_data: dict, keyword: str, rng: random.Random) -> str:
     """Extract salary information from Indeed API response."""
     try:
         # Indeed API provides salary in different formats
@@ -411,13 +459,9 @@ def _extract_salary_from_api(job_data: dict, keyword: str) -> str:
     # Fallback to realistic ranges based on keyword
     tech_keywords = ["python", "javascript", "react", "aws", "docker", "kubernetes"]
     if any(tech in keyword.lower() for tech in tech_keywords):
-        return (
-            f"${random.randint(85, 180)},000 - ${random.randint(120, 220)},000"  # nosec
-        )
+        return f"${rng.randint(85, 180)},000 - ${rng.randint(120, 220)},000"  # nosec
     else:
-        return (
-            f"${random.randint(70, 150)},000 - ${random.randint(100, 190)},000"  # nosec
-        )
+        return f"${rng.randint(70, 150)},000 - ${rng.randint(100, 190)},000"  # nosec
 
 
 if __name__ == "__main__":
@@ -1,10 +1,81 @@
 import requests
-from bs4 import BeautifulSoup
 import time
 import random
 from urllib.parse import urlencode
 import os
 from typing import List, Dict
+from ..config import settings
+from .extraction import CardSpec, select
+from . import scrape_metrics
+from .http_client import get_session
+from .structured_data import extract_job_postings, posting_fields
+from .synthetic_jobs import synthetic_random
+
+HOST = "www.linkedin.com"
+SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+
+# Seconds to wait between two requests to LinkedIn
+POLITENESS_DELAY = (2, 4)
+
+# Pages yielding fewer parsed cards than this get topped up with fallback jobs
+MIN_JOBS_PER_PAGE = 3
+
+# Selectors for the current LinkedIn structure (2024)
+CARD_SPEC = CardSpec(
+    cards=(
+        select(
+            "div",
+            classes=[
+                "base-card",
+                "job-search-card",
+                "result-card",
+                "jobs-search__results-list",
+            ],
+            ignore_case=True,
+        ),
+    ),
+    fields={
+        "title": (
+            select(
+                "h3",
+                "h4",
+                classes=[
+                    "base-search-card__title",
+                    "job-title",
+                    "result-card__title",
+                ],
+            ),
+            select("a", attrs={"data-tracking-will-navigate": True}),
+        ),
+        "company": (
+            select(
+                "h4",
+                "span",
+                classes=[
+                    "base-search-card__subtitle",
+                    "job-search-card__subtitle",
+                    "result-card__subtitle",
+                ],
+            ),
+        ),
+        "location": (select("span", classes=["job-search-card__location"]),),
+    },
+    limit=15,
+)
+
+# Updated headers to match modern browsers
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "max-age=0",
+}
 
 
 def scrape_linkedin_jobs(
@@ -14,25 +85,32 @@ def scrape_linkedin_jobs(
     Scrape LinkedIn jobs using official LinkedIn API when available, fallback to web scraping.
     Returns multiple jobs per keyword to address the "handful vs countless" issue.
     """
-    jobs = []
-
     # Try LinkedIn API first if credentials are available
-    linkedin_api_key = os.getenv("LINKEDIN_API_KEY")
-    if linkedin_api_key:
-        try:
-            jobs = _scrape_via_linkedin_api(
-                keywords, max_jobs_per_keyword, linkedin_api_key
-            )
-            if jobs:
-                print(f"LinkedIn API scraper returning {len(jobs)} total jobs")
-                return jobs
-        except Exception as e:
-            print(f"LinkedIn API failed, falling back to web scraping: {e}")
+    jobs = scrape_via_api(keywords, max_jobs_per_keyword)
+    if jobs:
+        return jobs
 
     # Fallback to web scraping with updated selectors
     return _scrape_via_web_scraping(keywords, max_jobs_per_keyword)
 
 
+def scrape_via_api(keywords: list[str], max_jobs_per_keyword: int) -> list[dict]:
+    """Return LinkedIn API results, or an empty list when the API is unavailable."""
+    linkedin_api_key = os.getenv("LINKEDIN_API_KEY")
+    if not linkedin_api_key:
+        return []
+    try:
+        jobs = _scrape_via_linkedin_api(
+            keywords, max_jobs_per_keyword, linkedin_api_key
+        )
+        if jobs:
+            print(f"LinkedIn API scraper returning {len(jobs)} total jobs")
+        return jobs
+    except Exception as e:
+        print(f"LinkedIn API failed, falling back to web scraping: {e}")
+        return []
+
+
 def _scrape_via_linkedin_api(
     keywords: list[str], max_jobs_per_keyword: int, api_key: str
 ) -> list[dict]:
@@ -63,7 +141,7 @@ def _scrape_via_linkedin_api(
                 "sortBy": "DD",  # Date descending
             }
 
-            response = requests.get(
+            response = get_session().get(
                 "https://api.linkedin.com/v2/jobSearch",
                 headers=headers,
                 params=params,
@@ -75,6 +153,7 @@ def _scrape_via_linkedin_api(
                 elements = data.get("elements", [])
 
                 for job_data in elements:
+                    rng = synthetic_random("LinkedIn", keyword, job_data.get("id"))
                     jobs.append(
                         {
                             "title": job_data.get("title", f"Job - {keyword}"),
@@ -88,7 +167,7 @@ def _scrape_via_linkedin_api(
                                 "applyUrl",
                                 f"https://www.linkedin.com/jobs/view/{job_data.get('id', '')}",
                             ),
-                            "salary": _extract_salary_from_api(job_data),
+                            "salary": _extract_salary_from_api(job_data, rng),
                             "status": "new",
                         }
                     )
@@ -111,250 +190,255 @@ def _scrape_via_web_scraping(
     """
     jobs = []
 
-    # Updated headers to match modern browsers
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Cache-Control": "max-age=0",
-    }
-
     for keyword in keywords:
         print(f"Scraping LinkedIn via web for keyword: {keyword}")
 
         try:
-            # Updated LinkedIn job search URL structure (2024)
-            params = {
-                "keywords": keyword,
-                "location": "",  # Worldwide
-                "geoId": "92000000",  # Worldwide geoId
-                "f_TPR": "r86400",  # Last 24 hours
-                "f_JT": "F%2CP",  # Full-time and Part-time
-                "position": "1",
-                "pageNum": "0",
-            }
-
             # Try to scrape multiple pages
-            for page in range(0, min(2, max_jobs_per_keyword // 10)):
-                params["start"] = str(page * 25)
-                url = f"https://www.linkedin.com/jobs/search/?{urlencode(params)}"
-
+            urls = build_search_urls(keyword, max_jobs_per_keyword)
+            for page, url in enumerate(urls, start=1):
                 try:
-                    response = requests.get(url, headers=headers, timeout=15)
+                    response = get_session().get(
+                        url, headers=HEADERS, timeout=settings.SCRAPER_REQUEST_TIMEOUT
+                    )
 
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, "html.parser")
-
-                        # Updated selectors for current LinkedIn structure (2024)
-                        job_cards = soup.find_all(
-                            ["div"],
-                            class_=lambda x: (
-                                x
-                                and any(
-                                    [
-                                        "base-card" in x.lower(),
-                                        "job-search-card" in x.lower(),
-                                        "result-card" in x.lower(),
-                                        "jobs-search__results-list" in x.lower(),
-                                    ]
-                                )
-                                if x
-                                else False
-                            ),
-                        )
-
-                        page_jobs = 0
-                        for card in job_cards[:15]:  # Limit per page
-                            try:
-                                # Updated selectors for 2024 LinkedIn structure
-                                title_elem = card.find(
-                                    ["h3", "h4"],
-                                    class_=lambda x: (
-                                        x
-                                        and any(
-                                            [
-                                                "base-search-card__title" in x,
-                                                "job-title" in x,
-                                                "result-card__title" in x,
-                                            ]
-                                        )
-                                        if x
-                                        else False
-                                    ),
-                                ) or card.find(
-                                    ["a"], attrs={"data-tracking-will-navigate": True}
-                                )
-
-                                company_elem = card.find(
-                                    ["h4", "span"],
-                                    class_=lambda x: (
-                                        x
-                                        and any(
-                                            [
-                                                "base-search-card__subtitle" in x,
-                                                "job-search-card__subtitle" in x,
-                                                "result-card__subtitle" in x,
-                                            ]
-                                        )
-                                        if x
-                                        else False
-                                    ),
-                                )
-
-                                location_elem = card.find(
-                                    ["span"],
-                                    class_=lambda x: (
-                                        x and "job-search-card__location" in x
-                                        if x
-                                        else False
-                                    ),
-                                )
-
-                                if title_elem and title_elem.get_text(strip=True):
-                                    title = title_elem.get_text(strip=True)
-                                    company = (
-                                        company_elem.get_text(strip=True)
-                                        if company_elem
-                                        else f"Company {random.randint(100, 999)}"  # nosec
-                                    )
-                                    location = (
-                                        location_elem.get_text(strip=True)
-                                        if location_elem
-                                        else "Remote/Global"
-                                    )
-
-                                    # Clean up extracted data
-                                    title = title.replace("\n", " ").strip()
-                                    company = company.replace("\n", " ").strip()
-
-                                    # Generate realistic job data
-                                    job_levels = [
-                                        "Senior",
-                                        "Junior",
-                                        "Lead",
-                                        "Principal",
-                                        "Staff",
-                                        "Mid-Level",
-                                    ]
-
-                                    jobs.append(
-                                        {
-                                            "title": f"{random.choice(job_levels)} {title} - {keyword}",  # nosec
-                                            "company": company,
-                                            "description": f"Exciting {keyword} opportunity at {company} in {location}. Looking for experienced professionals with strong {keyword} skills.",
-                                            "application_link": f"https://www.linkedin.com/jobs/view/{random.randint(3000000000, 3999999999)}",  # nosec
-                                            "salary": f"${random.randint(80, 200)},000 - ${random.randint(120, 280)},000",  # nosec
-                                            "status": "new",
-                                        }
-                                    )
-                                    page_jobs += 1
-
-                            except Exception as e:  # nosec
-                                continue
-
-                        print(f"  Found {page_jobs} jobs on page {page + 1}")
+                        page_jobs = parse_search_page(response.content, keyword)
+                        jobs.extend(page_jobs)
+                        print(f"  Found {len(page_jobs)} jobs on page {page}")
 
                         # Generate fallback jobs if parsing didn't work well
-                        if page_jobs < 3:
-                            fallback_count = min(
-                                8,
-                                max_jobs_per_keyword
-                                - len([j for j in jobs if keyword in j["title"]]),
+                        if len(page_jobs) < MIN_JOBS_PER_PAGE:
+                            jobs.extend(
+                                fallback_jobs(keyword, jobs, max_jobs_per_keyword)
                             )
-                            for i in range(fallback_count):
-                                job_titles = [
-                                    "Software Engineer",
-                                    "Full Stack Developer",
-                                    "Backend Developer",
-                                    "Frontend Developer",
-                                    "DevOps Engineer",
-                                    "Data Scientist",
-                                    "Product Manager",
-                                    "Engineering Manager",
-                                    "Technical Lead",
-                                ]
-                                companies = [
-                                    "Tech Innovations Inc",
-                                    "Digital Solutions Corp",
-                                    "Cloud Systems Ltd",
-                                    "DataFlow Technologies",
-                                    "NextGen Software",
-                                    "Progressive Tech",
-                                    "Advanced Systems",
-                                    "Global Tech Solutions",
-                                    "Innovation Labs",
-                                ]
-
-                                jobs.append(
-                                    {
-                                        "title": f"{random.choice(job_titles)} - {keyword}",  # nosec
-                                        "company": f"{random.choice(companies)}",  # nosec
-                                        "description": f"Join our dynamic team working with {keyword}. We're looking for passionate developers who want to make an impact.",
-                                        "application_link": f"https://www.linkedin.com/jobs/view/{random.randint(3000000000, 3999999999)}",  # nosec
-                                        "salary": f"${random.randint(90, 180)},000 - ${random.randint(130, 220)},000",  # nosec
-                                        "status": "new",
-                                    }
-                                )
 
                     else:
                         print(f"  HTTP {response.status_code} - Adding fallback jobs")
-                        # Fallback jobs when request fails
-                        for i in range(min(6, max_jobs_per_keyword)):
-                            jobs.append(
-                                {
-                                    "title": f"Software Engineer - {keyword} (Fallback {i+1})",
-                                    "company": f"LinkedIn Partner {random.randint(1, 100)}",  # nosec
-                                    "description": f"Excellent {keyword} opportunity with growth potential.",
-                                    "application_link": f"https://www.linkedin.com/jobs/view/{random.randint(3000000000, 3999999999)}",  # nosec
-                                    "salary": f"${random.randint(100, 170)},000 - ${random.randint(140, 210)},000",  # nosec
-                                    "status": "new",
-                                }
-                            )
+                        jobs.extend(http_error_jobs(keyword, max_jobs_per_keyword))
 
                 except requests.RequestException as e:
                     print(f"  Request failed: {e}")
-                    # Generate offline fallback jobs
-                    for i in range(min(4, max_jobs_per_keyword)):
-                        jobs.append(
-                            {
-                                "title": f"Software Engineer - {keyword} (Offline {i+1})",
-                                "company": f"Tech Company {random.randint(1, 500)}",  # nosec
-                                "description": f"Great opportunity to work with {keyword} in a collaborative environment.",
-                                "application_link": f"https://www.linkedin.com/jobs/view/{random.randint(3000000000, 3999999999)}",  # nosec
-                                "salary": f"${random.randint(85, 175)},000 - ${random.randint(115, 210)},000",  # nosec
-                                "status": "new",
-                            }
-                        )
+                    jobs.extend(offline_jobs(keyword, max_jobs_per_keyword))
 
                 # Rate limiting
-                time.sleep(random.uniform(2, 4))  # nosec
+                time.sleep(random.uniform(*POLITENESS_DELAY))  # nosec
 
         except Exception as e:
             print(f"Error scraping LinkedIn for {keyword}: {e}")
-            # Ensure we always return some jobs
-            for i in range(min(5, max_jobs_per_keyword)):
+            jobs.extend(error_recovery_jobs(keyword, max_jobs_per_keyword))
+
+    print(f"LinkedIn web scraper returning {len(jobs)} total jobs")
+    return jobs
+
+
+def build_search_urls(
+    keyword: str, max_jobs_per_keyword: int, base_url: str = SEARCH_URL
+) -> list[str]:
+    """Return the search result page URLs to fetch for one keyword."""
+    # Updated LinkedIn job search URL structure (2024)
+    params = {
+        "keywords": keyword,
+        "location": "",  # Worldwide
+        "geoId": "92000000",  # Worldwide geoId
+        "f_TPR": "r86400",  # Last 24 hours
+        "f_JT": "F%2CP",  # Full-time and Part-time
+        "position": "1",
+        "pageNum": "0",
+    }
+
+    urls = []
+    for page in range(0, min(2, max_jobs_per_keyword // 10)):
+        params["start"] = str(page * 25)
+        urls.append(f"{base_url}?{urlencode(params)}")
+    return urls
+
+
+def parse_search_page(content: bytes, keyword: str) -> list[dict]:
+    """Extract the job postings of one LinkedIn search result page.
+
+    Embedded JSON-LD postings are used when present; the job cards are only
+    parsed when the page has none.
+    """
+    postings = extract_job_postings(content, "LinkedIn")
+    if postings:
+        scrape_metrics.observe(
+            "cards_found", len(postings), board="LinkedIn", keyword=keyword
+        )
+        return [_job_from_posting(posting, keyword) for posting in postings]
+
+    jobs = []
+    soup = CARD_SPEC.parse(content)
+    cards = CARD_SPEC.find_cards(soup)
+    scrape_metrics.observe("cards_found", len(cards), board="LinkedIn", keyword=keyword)
+
+    for card in cards:
+        try:
+            fields = CARD_SPEC.extract(card)
+            rng = synthetic_random("LinkedIn", keyword, card.get_text(" ", strip=True))
+            title_elem = fields["title"]
+            company_elem = fields["company"]
+            location_elem = fields["location"]
+
+            if title_elem and title_elem.get_text(strip=True):
+                title = title_elem.get_text(strip=True)
+                company = (
+                    company_elem.get_text(strip=True)
+                    if company_elem
+                    else f"Company {rng.randint(100, 999)}"  # nosec
+                )
+                location = (
+                    location_elem.get_text(strip=True)
+                    if location_elem
+                    else "Remote/Global"
+                )
+
+                # Clean up extracted data
+                title = title.replace("\n", " ").strip()
+                company = company.replace("\n", " ").strip()
+
+                # Generate realistic job data
+                job_levels = [
+                    "Senior",
+                    "Junior",
+                    "Lead",
+                    "Principal",
+                    "Staff",
+                    "Mid-Level",
+                ]
+
                 jobs.append(
                     {
-                        "title": f"Software Engineer - {keyword} (Error Recovery {i+1})",
-                        "company": f"LinkedIn Backup {random.randint(1, 200)}",  # nosec
-                        "description": f"Opportunity to work with {keyword} technologies.",
-                        "application_link": f"https://www.linkedin.com/jobs/view/{random.randint(3000000000, 3999999999)}",  # nosec
-                        "salary": f"${random.randint(95, 165)},000 - ${random.randint(125, 195)},000",  # nosec
+                        "title": f"{rng.choice(job_levels)} {title} - {keyword}",  # nosec
+                        "company": company,
+                        "description": f"Exciting {keyword} opportunity at {company} in {location}. Looking for experienced professionals with strong {keyword} skills.",
+                        "application_link": f"https://www.linkedin.com/jobs/view/{rng.randint(3000000000, 3999999999)}",  # nosec
+                        "salary": f"${rng.randint(80, 200)},000 - ${rng.randint(120, 280)},000",  # nosec
                         "status": "new",
                     }
                 )
 
-    print(f"LinkedIn web scraper returning {len(jobs)} total jobs")
+        except Exception as e:  # nosec
+            continue
+
     return jobs
 
 
-def _extract_salary_from_api(job_data: dict) -> str:
+def fallback_jobs(
+    keyword: str, jobs: list[dict], max_jobs_per_keyword: int
+) -> list[dict]:
+    """Top up a keyword whose page yielded too few parsed cards."""
+    rng = synthetic_random("LinkedIn", keyword, "fallback")
+    fallback = []
+    fallback_count = min(
+        8,
+        max_jobs_per_keyword - len([j for j in jobs if keyword in j["title"]]),
+    )
+    for i in range(fallback_count):
+        job_titles = [
+            "Software Engineer",
+            "Full Stack Developer",
+            "Backend Developer",
+            "Frontend Developer",
+            "DevOps Engineer",
+            "Data Scientist",
+            "Product Manager",
+            "Engineering Manager",
+            "Technical Lead",
+        ]
+        companies = [
+            "Tech Innovations Inc",
+            "Digital Solutions Corp",
+            "Cloud Systems Ltd",
+            "DataFlow Technologies",
+            "NextGen Software",
+            "Progressive Tech",
+            "Advanced Systems",
+            "Global Tech Solutions",
+            "Innovation Labs",
+        ]
+
+        fallback.append(
+            {
+                "title": f"{rng.choice(job_titles)} - {keyword}",  # nosec
+                "company": f"{rng.choice(companies)}",  # nosec
+                "description": f"Join our dynamic team working with {keyword}. We're looking for passionate developers who want to make an impact.",
+                "application_link": f"https://www.linkedin.com/jobs/view/{rng.randint(3000000000, 3999999999)}",  # nosec
+                "salary": f"${rng.randint(90, 180)},000 - ${rng.randint(130, 220)},000",  # nosec
+                "status": "new",
+            }
+        )
+    return fallback
+
+
+def http_error_jobs(keyword: str, max_jobs_per_keyword: int) -> list[dict]:
+    """Fallback jobs when LinkedIn answers with a non-200 status."""
+    rng = synthetic_random("LinkedIn", keyword, "http_error")
+    return [
+        {
+            "title": f"Software Engineer - {keyword} (Fallback {i+1})",
+            "company": f"LinkedIn Partner {rng.randint(1, 100)}",  # nosec
+            "description": f"Excellent {keyword} opportunity with growth potential.",
+            "application_link": f"https://www.linkedin.com/jobs/view/{rng.randint(3000000000, 3999999999)}",  # nosec
+            "salary": f"${rng.randint(100, 170)},000 - ${rng.randint(140, 210)},000",  # nosec
+            "status": "new",
+        }
+        for i in range(min(6, max_jobs_per_keyword))
+    ]
+
+
+def offline_jobs(keyword: str, max_jobs_per_keyword: int) -> list[dict]:
+    """Fallback jobs when the request to LinkedIn fails outright."""
+    rng = synthetic_random("LinkedIn", keyword, "offline")
+    return [
+        {
+            "title": f"Software Engineer - {keyword} (Offline {i+1})",
+            "company": f"Tech Company {rng.randint(1, 500)}",  # nosec
+            "description": f"Great opportunity to work with {keyword} in a collaborative environment.",
+            "application_link": f"https://www.linkedin.com/jobs/view/{rng.randint(3000000000, 3999999999)}",  # nosec
+            "salary": f"${rng.randint(85, 175)},000 - ${rng.randint(115, 210)},000",  # nosec
+            "status": "new",
+        }
+        for i in range(min(4, max_jobs_per_keyword))
+    ]
+
+
+def error_recovery_jobs(keyword: str, max_jobs_per_keyword: int) -> list[dict]:
+    """Ensure we always return some jobs when a keyword errors out."""
+    rng = synthetic_random("LinkedIn", keyword, "error_recovery")
+    return [
+        {
+            "title": f"Software Engineer - {keyword} (Error Recovery {i+1})",
+            "company": f"LinkedIn Backup {rng.randint(1, 200)}",  # nosec
+            "description": f"Opportunity to work with {keyword} technologies.",
+            "application_link": f"https://www.linkedin.com/jobs/view/{rng.randint(3000000000, 3999999999)}",  # nosec
+            "salary": f"${rng.randint(95, 165)},000 - ${rng.randint(125, 195)},000",  # nosec
+            "status": "new",
+        }
+        for i in range(min(5, max_jobs_per_keyword))
+    ]
+
+
+def _job_from_posting(data: dict, keyword: str) -> dict:
+    """Map a JSON-LD JobPosting to a LinkedIn job."""
+    fields = posting_fields(data)
+    rng = synthetic_random("LinkedIn", keyword, fields["title"], fields["company"])
+    company = fields["company"] or "LinkedIn Partner"
+    location = fields["location"] or "Remote/Global"
+    return {
+        "title": f"{fields['title'] or f'Job - {keyword}'} - {keyword}",
+        "company": company,
+        "description": fields["description"]
+        or f"Exciting {keyword} opportunity at {company} in {location}.",
+        "application_link": fields["url"]
+        or f"https://www.linkedin.com/jobs/view/{rng.randint(3000000000, 3999999999)}",  # nosec
+        "salary": fields["salary"]
+        or f"${rng.randint(80, 200)},000 - ${rng.randint(120, 250)},000",  # nosec
+        "status": "new",
+    }
+
+
+def _extract_salary_from_api(job_data: dict, rng: random.Random) -> str:
     """Extract salary information from LinkedIn API response."""
     try:
         compensation = job_data.get("compensation", {})
@@ -366,7 +450,7 @@ def _extract_salary_from_api(job_data: dict) -> str:
         pass
 
     # Fallback to realistic ranges
-    return f"${random.randint(80, 200)},000 - ${random.randint(120, 250)},000"  # nosec
+    return f"${rng.randint(80, 200)},000 - ${rng.randint(120, 250)},000"  # nosec
 
 
 if __name__ == "__main__":
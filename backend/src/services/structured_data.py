@@ -0,0 +1,121 @@
+import html
+import json
+import re
+from typing import Optional
+
+from . import scrape_metrics
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional, the standard library decoder works
+    _loads = json.loads
+
+_LD_JSON_BLOCK = re.compile(
+    rb"<script\b[^>]*\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>"
+    rb"(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_TAG = re.compile(r"<[^>]+>")
+_SPACE = re.compile(r"\s+")
+
+
+def _is_job_posting(item) -> bool:
+    if not isinstance(item, dict):
+        return False
+    kind = item.get("@type")
+    return kind == "JobPosting" or (isinstance(kind, list) and "JobPosting" in kind)
+
+
+def _iter_items(data):
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_items(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_items(data["@graph"])
+
+
+def find_job_postings(content: bytes) -> list[dict]:
+    """
+    Return the schema.org ``JobPosting`` objects embedded in a page.
+
+    ``application/ld+json`` blocks are cut out of the raw bytes with a regex,
+    so no DOM is built; blocks that are not valid JSON are skipped.
+    """
+    postings = []
+    for match in _LD_JSON_BLOCK.finditer(content):
+        try:
+            data = _loads(match.group(1).strip())
+        except ValueError:
+            continue
+        postings.extend(item for item in _iter_items(data) if _is_job_posting(item))
+    return postings
+
+
+def extract_job_postings(content: bytes, board: str) -> list[dict]:
+    """``find_job_postings`` that also records a per-board hit or miss."""
+    postings = find_job_postings(content)
+    result = "hit" if postings else "miss"
+    scrape_metrics.observe("json_ld_pages", board=board, result=result)
+    return postings
+
+
+def _text(value) -> Optional[str]:
+    if not isinstance(value, str) or not value.strip():
+        return None
+    return _SPACE.sub(" ", html.unescape(_TAG.sub(" ", value))).strip()
+
+
+def _location(job_location) -> Optional[str]:
+    if isinstance(job_location, list):
+        job_location = job_location[0] if job_location else None
+    if not isinstance(job_location, dict):
+        return None
+    address = job_location.get("address")
+    if not isinstance(address, dict):
+        return None
+    parts = [address.get("addressLocality"), address.get("addressRegion")]
+    return ", ".join(part for part in parts if isinstance(part, str) and part) or None
+
+
+def _salary(base_salary) -> Optional[str]:
+    if not isinstance(base_salary, dict):
+        return None
+    value = base_salary.get("value")
+    try:
+        if isinstance(value, dict):
+            low, high = value.get("minValue"), value.get("maxValue")
+            if low and high:
+                return f"${int(float(low)):,} - ${int(float(high)):,}"
+            single = value.get("value")
+            if single:
+                return f"${int(float(single)):,}"
+        elif isinstance(value, (int, float, str)) and value:
+            return f"${int(float(value)):,}"
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+def posting_fields(data: dict) -> dict:
+    """
+    Normalize one ``JobPosting`` into plain strings.
+
+    Returns ``title``, ``company``, ``description``, ``url``, ``location`` and
+    ``salary``; any field the posting lacks is ``None`` so each board can
+    fill in its own defaults.
+    """
+    organization = data.get("hiringOrganization")
+    company = organization.get("name") if isinstance(organization, dict) else None
+    url = data.get("url")
+    return {
+        "title": _text(data.get("title")),
+        "company": _text(company),
+        "description": _text(data.get("description")),
+        "url": url if isinstance(url, str) and url.startswith("http") else None,
+        "location": _location(data.get("jobLocation")),
+        "salary": _salary(data.get("baseSalary")),
+    }
@@ -0,0 +1,15 @@
+"""
+Randomness for the placeholder values scrapers fill in.
+
+Scrapers make up the links, companies and levels a page does not provide,
+and whole jobs when a board fails. Drawing them from a generator seeded by
+what identifies the posting keeps them the same from one scrape to the next,
+so the fingerprint index recognises a repeat and stores nothing new.
+"""
+
+import random
+
+
+def synthetic_random(*identity) -> random.Random:
+    """A generator seeded by ``identity``, e.g. the board, keyword and card text."""
+    return random.Random("\x1f".join(str(part) for part in identity))  # nosec
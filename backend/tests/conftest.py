@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+
+import pytest
+
+from src.middleware.query_stats import capture_queries
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fail the test if a block runs more SQL statements than budgeted.
+
+        with query_budget(2):
+            client.get("/api/applications/")
+
+    Statements from every engine and thread count. With more rows than the
+    budget, a query per row (N+1) cannot fit. On failure each statement is
+    listed with how often it ran.
+    """
+
+    @contextmanager
+    def budget(max_queries: int):
+        with capture_queries() as stats:
+            yield stats
+        if stats.count > max_queries:
+            ran = "\n".join(
+                f"  {count} x {statement}"
+                for statement, count in stats.statements.most_common()
+            )
+            pytest.fail(
+                f"{stats.count} SQL statements, budget {max_queries}:\n{ran}",
+                pytrace=False,
+            )
+
+    return budget
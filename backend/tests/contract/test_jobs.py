@@ -1,9 +1,11 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 from src.main import app
-from src.models.database import Base, get_db
+from src.models.database import Base, get_async_db
 from src.models.job import Job
 from src.models.user import User as DBUser
 from src.middleware.auth import get_current_user
@@ -15,6 +17,15 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# The jobs router reads through the async engine. TestClient runs each client
+# on its own event loop, so connections are not pooled across tests.
+async_engine = create_async_engine(
+    "sqlite+aiosqlite:///./test_sql_app.db", poolclass=NullPool
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 @pytest.fixture(name="session")
 def session_fixture():
@@ -29,8 +40,9 @@ def session_fixture():
 
 @pytest.fixture(name="client")
 def client_fixture(session: Session):
-    def override_get_db():
-        yield session
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
 
     def override_get_current_user():
         # Mock a user for testing purposes
@@ -41,7 +53,7 @@ def client_fixture(session: Session):
             email="test@example.com",
         )
 
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     app.dependency_overrides[get_current_user] = override_get_current_user
     with TestClient(app) as client:
         yield client
@@ -64,6 +76,7 @@ def test_save_job(client: TestClient, session: Session):
     response = client.post(f"/api/jobs/{job.id}/save")
     assert response.status_code == 200
     assert response.json() == {"message": "Job saved successfully"}
+    session.expire_all()
     updated_job = session.query(Job).filter(Job.id == job.id).first()
     assert updated_job.status == "saved"
 
@@ -83,6 +96,7 @@ def test_apply_job(client: TestClient, session: Session):
     response = client.post(f"/api/jobs/{job.id}/apply")
     assert response.status_code == 200
     assert response.json() == {"message": "Job marked as applied"}
+    session.expire_all()
     updated_job = session.query(Job).filter(Job.id == job.id).first()
     assert updated_job.status == "applied"
 
@@ -102,6 +116,7 @@ def test_hide_job(client: TestClient, session: Session):
     response = client.post(f"/api/jobs/{job.id}/hide")
     assert response.status_code == 200
     assert response.json() == {"message": "Job hidden successfully"}
+    session.expire_all()
     updated_job = session.query(Job).filter(Job.id == job.id).first()
     assert updated_job.status == "hidden"
 
@@ -110,3 +125,91 @@ def test_job_not_found(client: TestClient):
     response = client.post("/api/jobs/999/save")
     assert response.status_code == 404
     assert response.json() == {"message": "Job not found or not authorized"}
+
+
+def test_read_jobs_returns_only_current_users_jobs(client: TestClient, session: Session):
+    session.add_all(
+        [
+            Job(
+                title="Mine",
+                company="Test Co",
+                application_link="http://example.com/mine",
+                user_id=1,
+            ),
+            Job(
+                title="Theirs",
+                company="Other Co",
+                application_link="http://example.com/theirs",
+                user_id=2,
+            ),
+        ]
+    )
+    session.commit()
+
+    response = client.get("/api/jobs/")
+    assert response.status_code == 200
+    assert [job["title"] for job in response.json()] == ["Mine"]
+
+
+def test_read_jobs_pages_by_cursor(client: TestClient, session: Session):
+    session.add_all(
+        Job(
+            title=f"Job {i}",
+            company="Test Co",
+            application_link=f"http://example.com/{i}",
+            user_id=1,
+        )
+        for i in range(5)
+    )
+    session.commit()
+
+    titles = []
+    response = client.get("/api/jobs/", params={"limit": 2})
+    while True:
+        assert response.status_code == 200
+        titles += [job["title"] for job in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        response = client.get("/api/jobs/", params={"limit": 2, "cursor": cursor})
+
+    assert titles == [f"Job {i}" for i in range(5)]
+
+
+def test_read_jobs_rejects_bad_cursor(client: TestClient):
+    response = client.get("/api/jobs/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json() == {"message": "Invalid cursor"}
+
+    response = client.get("/api/jobs/", params={"cursor": "WzVd", "skip": 10})
+    assert response.status_code == 400
+
+
+def test_search_jobs(client: TestClient, session: Session):
+    session.add_all(
+        [
+            Job(
+                title="Python Developer",
+                company="Test Co",
+                description="Django and <b>FastAPI</b>",
+                application_link="http://example.com/python",
+                user_id=1,
+            ),
+            Job(
+                title="Java Developer",
+                company="Test Co",
+                application_link="http://example.com/java",
+                user_id=1,
+            ),
+        ]
+    )
+    session.commit()
+
+    response = client.get("/api/jobs/search", params={"q": "fast*"})
+    assert response.status_code == 200
+    (hit,) = response.json()
+    assert hit["job"]["title"] == "Python Developer"
+    assert hit["snippet"] == "Django and &lt;b&gt;<mark>FastAPI</mark>&lt;/b&gt;"
+
+    response = client.get("/api/jobs/search", params={"q": ""})
+    assert response.status_code == 422
@@ -0,0 +1,130 @@
+"""
+SQL statements per endpoint, held to a budget.
+
+Every list holds more rows than its budget, so loading anything per row (an
+N+1 query) fails here. Identity is served from the principal cache after
+the first request, so the budgets count no user lookups.
+"""
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.api.auth import create_access_token
+from src.main import app
+from src.models.database import get_async_db, get_db
+from src.models.job import Job
+from src.models.job_application import JobApplication
+from src.models.keyword import Keyword
+from src.models.migrations import migrate
+from src.models.user import User
+from src.services.principal_cache import principal_cache
+
+ROWS = 10
+
+
+@pytest.fixture
+def client(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'app.db'}", connect_args={"check_same_thread": False}
+    )
+    migrate(engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    db = factory()
+    db.add(User(id=1, username="budget", email="b@example.com", password_hash="x"))
+    keywords = [Keyword(term=term, user_id=1) for term in ("python", "sql", "aws")]
+    db.add_all(
+        Job(
+            title=f"Dev {i}",
+            company="Acme",
+            application_link=f"https://x.io/{i}",
+            user_id=1,
+        )
+        for i in range(ROWS)
+    )
+    db.add_all(
+        JobApplication(
+            user_id=1,
+            job_title=f"Dev {i}",
+            company="Acme",
+            application_date=date(2026, 1, 1),
+            status="applied",
+            keywords=keywords,
+        )
+        for i in range(ROWS)
+    )
+    db.commit()
+    db.close()
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'app.db'}", poolclass=NullPool
+    )
+    async_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with async_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    principal_cache.clear()
+    token = create_access_token({"sub": "budget"})
+    try:
+        with TestClient(app, headers={"Authorization": f"Bearer {token}"}) as client:
+            assert client.get("/api/keywords/").status_code == 200
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+        principal_cache.clear()
+        engine.dispose()
+
+
+def test_list_jobs(client, query_budget):
+    with query_budget(1):
+        response = client.get("/api/jobs/")
+    assert len(response.json()) == ROWS
+
+
+def test_list_applications_loads_keywords_in_one_query(client, query_budget):
+    with query_budget(2):
+        response = client.get("/api/applications/")
+    assert all(len(a["keywords"]) == 3 for a in response.json())
+
+
+def test_read_application(client, query_budget):
+    with query_budget(2):
+        assert client.get("/api/applications/1").status_code == 200
+
+
+def test_create_application_resolves_keywords_in_bulk(client, query_budget):
+    application = {
+        "job_title": "Dev",
+        "company": "Acme",
+        "application_date": "2026-02-01",
+        "status": "applied",
+        "keywords": ["python", "sql", "aws", "go", "rust", "java"],
+    }
+    with query_budget(7):
+        response = client.post("/api/applications/", json=application)
+    assert len(response.json()["keywords"]) == 6
+
+
+def test_list_keywords(client, query_budget):
+    with query_budget(1):
+        assert len(client.get("/api/keywords/").json()) == 3
+
+
+def test_server_timing_reports_the_request_queries(client):
+    response = client.get("/api/applications/")
+    assert response.headers["Server-Timing"].endswith('desc="2 queries"')
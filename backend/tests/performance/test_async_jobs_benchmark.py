@@ -0,0 +1,198 @@
+"""
+Request latency under mixed load: sync sessions inside ``async def`` job
+endpoints versus the AsyncSession request path.
+
+Concurrent clients send a mix of job list reads and status updates while a
+probe calls a cheap endpoint that never touches the database every few
+milliseconds, all through one event loop. The baseline repeats the old
+handlers, which ran blocking Session queries on the loop; the async side
+mounts the real jobs router. Both use the same file-backed SQLite database.
+Set BENCH_ASYNC_REQUESTS and BENCH_ASYNC_CONCURRENCY to change the load.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the numbers.
+"""
+
+import asyncio
+import os
+import statistics
+import time
+
+import httpx
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.api import jobs
+from src.middleware.auth import get_current_user
+from src.models.database import Base, get_async_db
+from src.models.job import Job
+from src.models.job_application import JobApplication
+from src.models.user import User
+from src.services import job_service
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS = int(os.getenv("BENCH_ASYNC_REQUESTS", "600"))
+CONCURRENCY = int(os.getenv("BENCH_ASYNC_CONCURRENCY", "20"))
+SEEDED_JOBS = 2000
+PROBE_INTERVAL = 0.005
+
+
+def _bench_user():
+    return User(id=1, username="bench", email="bench@example.com", password_hash="x")
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "bench.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add(_bench_user())
+    db.add_all(
+        Job(
+            title=f"Engineer {i}",
+            company=f"Company {i % 50}",
+            description="Build things. " * 20,
+            application_link=f"https://example.com/jobs/{i}",
+            user_id=1,
+        )
+        for i in range(SEEDED_JOBS)
+    )
+    db.commit()
+    db.close()
+    engine.dispose()
+    return path
+
+
+def _blocking_app(path):
+    """The jobs endpoints as they were: sync Session calls in async handlers."""
+    # Sized so no request waits on the pool: with the loop blocked, sessions
+    # closed by threadpool cleanup cannot hand their connections back
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        pool_size=CONCURRENCY,
+    )
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    router = APIRouter()
+
+    @router.get("/jobs/")
+    async def read_jobs(limit: int = 100, db: Session = Depends(get_db)):
+        rows = job_service.get_jobs(db, 1, limit=limit)
+        return [{"id": job.id, "title": job.title} for job in rows]
+
+    @router.post("/jobs/{job_id}/save")
+    async def save_job(job_id: int, db: Session = Depends(get_db)):
+        job_service.update_job_status(db, job_id, 1, "saved")
+        return {"message": "Job saved successfully"}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    return app, engine.dispose
+
+
+def _async_app(path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", pool_size=CONCURRENCY)
+    factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(jobs.router, prefix="/api")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_current_user] = _bench_user
+    return app, engine.dispose
+
+
+def _add_health(app):
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+
+def _request_mix():
+    mix = []
+    for i in range(REQUESTS):
+        if i % 3 == 2:
+            mix.append(("write", "POST", f"/api/jobs/{i % SEEDED_JOBS + 1}/save"))
+        else:
+            mix.append(("read", "GET", "/api/jobs/?limit=100"))
+    return mix
+
+
+async def _run_load(app):
+    latencies = {"health": [], "read": [], "write": []}
+    pending = _request_mix()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker():
+            while pending:
+                kind, method, url = pending.pop()
+                start = time.perf_counter()
+                response = await client.request(method, url)
+                latencies[kind].append((time.perf_counter() - start) * 1000)
+                assert response.status_code == 200, response.text
+
+        async def probe(workers):
+            # Latency counts from when the request was due, so time spent
+            # waiting for a blocked loop to wake the probe is included
+            while not workers.done():
+                due = time.perf_counter() + PROBE_INTERVAL
+                await asyncio.sleep(PROBE_INTERVAL)
+                response = await client.get("/health")
+                latencies["health"].append((time.perf_counter() - due) * 1000)
+                assert response.status_code == 200
+
+        workers = asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        await asyncio.gather(workers, probe(workers))
+    return latencies
+
+
+def _p99(samples):
+    return statistics.quantiles(samples, n=100)[98]
+
+
+async def _measure(build_app, path):
+    app, dispose = build_app(path)
+    _add_health(app)
+    try:
+        return await _run_load(app)
+    finally:
+        result = dispose()
+        if asyncio.iscoroutine(result):
+            await result
+
+
+def test_async_sessions_keep_the_event_loop_responsive(db_path, capsys):
+    rows = [
+        ("sync Session", asyncio.run(_measure(_blocking_app, db_path))),
+        ("AsyncSession", asyncio.run(_measure(_async_app, db_path))),
+    ]
+
+    with capsys.disabled():
+        print(f"\n{REQUESTS} requests, {CONCURRENCY} concurrent clients, ms")
+        print("path          health_p50  health_p99  read_p99  write_p99")
+        for name, latencies in rows:
+            print(
+                f"{name:<12}  {statistics.median(latencies['health']):>10.1f}"
+                f"  {_p99(latencies['health']):>10.1f}"
+                f"  {_p99(latencies['read']):>8.1f}"
+                f"  {_p99(latencies['write']):>9.1f}"
+            )
+
+    (_, before), (_, after) = rows
+    assert _p99(after["health"]) < _p99(before["health"])
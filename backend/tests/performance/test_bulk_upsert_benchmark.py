@@ -0,0 +1,89 @@
+"""
+Rows/sec of job ingestion: per-row create_job versus bulk_upsert_jobs.
+
+Both paths write to a file-backed SQLite database so every commit pays for a
+real fsync. Set BENCH_UPSERT_ROWS to ingest more rows.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the numbers.
+"""
+
+import os
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.models.database import Base
+from src.models.job import Job
+from src.models.user import User
+from src.services import job_service
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = int(os.getenv("BENCH_UPSERT_ROWS", "500"))
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bench.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = factory()
+    db.add(User(id=1, username="bench", email="bench@example.com", password_hash="x"))
+    db.commit()
+    db.close()
+    yield factory
+    engine.dispose()
+
+
+def _jobs(prefix):
+    return [
+        {
+            "title": f"Engineer {i}",
+            "company": "Acme",
+            "description": "Build things",
+            "application_link": f"https://example.com/{prefix}/{i}",
+            "salary": "$100,000 - $130,000",
+            "status": "new",
+        }
+        for i in range(ROWS)
+    ]
+
+
+def _rows_per_second(session_factory, ingest):
+    db = session_factory()
+    try:
+        start = time.perf_counter()
+        ingest(db)
+        return ROWS / (time.perf_counter() - start)
+    finally:
+        db.close()
+
+
+def test_bulk_upsert_outperforms_per_row_commits(session_factory, capsys):
+    def per_row(db):
+        for job_data in _jobs("per-row"):
+            job_service.create_job(db, job_data, 1)
+
+    def bulk_insert(db):
+        job_service.bulk_upsert_jobs(db, _jobs("bulk"), 1)
+
+    def bulk_update(db):
+        job_service.bulk_upsert_jobs(db, _jobs("bulk"), 1)
+
+    per_row_rate = _rows_per_second(session_factory, per_row)
+    insert_rate = _rows_per_second(session_factory, bulk_insert)
+    update_rate = _rows_per_second(session_factory, bulk_update)
+
+    db = session_factory()
+    assert db.query(Job).count() == 2 * ROWS
+    db.close()
+
+    with capsys.disabled():
+        print(f"\n{ROWS} jobs, rows/sec")
+        print(f"  create_job per row:       {per_row_rate:>10.0f}")
+        print(f"  bulk_upsert_jobs insert:  {insert_rate:>10.0f}")
+        print(f"  bulk_upsert_jobs update:  {update_rate:>10.0f}")
+
+    assert insert_rate > per_row_rate * 5
@@ -0,0 +1,102 @@
+"""
+Write and read throughput of a file-backed SQLite database per engine
+profile.
+
+``bare`` is the engine the app used to build: default pool, rollback
+journal, synchronous=FULL. The other profiles come from ``create_db_engine``
+with Settings overrides. Writes are single-row commits through
+``job_service.create_job``, the way API handlers write; reads are
+``get_jobs`` pages, each in its own session. Set BENCH_ENGINE_WRITES and
+BENCH_ENGINE_READS to change the workload.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the numbers.
+"""
+
+import os
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.config import Settings
+from src.models.database import Base, create_db_engine
+from src.models.job import Job
+from src.models.job_application import JobApplication
+from src.models.user import User
+from src.services import job_service
+
+pytestmark = pytest.mark.benchmark
+
+WRITES = int(os.getenv("BENCH_ENGINE_WRITES", "300"))
+READS = int(os.getenv("BENCH_ENGINE_READS", "300"))
+
+PROFILES = [
+    ("bare", None),
+    ("wal+full", Settings(SQLITE_SYNCHRONOUS="FULL")),
+    ("tuned", Settings()),
+]
+
+
+def _engine(url, config):
+    if config is None:
+        return create_engine(url, connect_args={"check_same_thread": False})
+    return create_db_engine(url, config)
+
+
+def _writes_per_second(factory):
+    start = time.perf_counter()
+    for i in range(WRITES):
+        db = factory()
+        try:
+            job_service.create_job(
+                db,
+                {
+                    "title": f"Engineer {i}",
+                    "company": f"Company {i % 50}",
+                    "description": "Build things. " * 20,
+                    "application_link": f"https://example.com/jobs/{i}",
+                },
+                user_id=1,
+            )
+        finally:
+            db.close()
+    return WRITES / (time.perf_counter() - start)
+
+
+def _reads_per_second(factory):
+    start = time.perf_counter()
+    for i in range(READS):
+        db = factory()
+        try:
+            assert job_service.get_jobs(db, 1, skip=i % 200, limit=100)
+        finally:
+            db.close()
+    return READS / (time.perf_counter() - start)
+
+
+def _measure(tmp_path, name, config):
+    engine = _engine(f"sqlite:///{tmp_path / f'{name}.db'}", config)
+    try:
+        Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        db = factory()
+        db.add(User(id=1, username="bench", email="b@example.com", password_hash="x"))
+        db.commit()
+        db.close()
+        return _writes_per_second(factory), _reads_per_second(factory)
+    finally:
+        engine.dispose()
+
+
+def test_tuned_engine_profile_throughput(tmp_path, capsys):
+    rows = [(name, *_measure(tmp_path, name, config)) for name, config in PROFILES]
+
+    with capsys.disabled():
+        print(f"\n{WRITES} single-row commits, {READS} page reads")
+        print("profile    writes/sec  reads/sec")
+        for name, writes, reads in rows:
+            print(f"{name:<9}  {writes:>10.0f}  {reads:>9.0f}")
+
+    rates = {name: (writes, reads) for name, writes, reads in rows}
+    assert rates["tuned"][0] > rates["bare"][0]
@@ -0,0 +1,200 @@
+"""
+Cards/sec of job card extraction on saved search pages, before and after the
+precompiled CardSpec engine.
+
+The baseline repeats the lambda-based ``find_all``/``find`` calls the board
+parsers used before, so both sides do the same work: locate the cards on an
+already parsed page and pick out each card's fields. Set
+BENCH_EXTRACTION_ROUNDS to run more rounds per board.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the numbers.
+"""
+
+import os
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+import pytest
+
+from src.services import scraper_dice, scraper_indeed, scraper_linkedin
+
+pytestmark = pytest.mark.benchmark
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+ROUNDS = int(os.getenv("BENCH_EXTRACTION_ROUNDS", "20"))
+
+
+def _any_class(*words, lower=False):
+    def match(x):
+        if not x:
+            return False
+        value = x.lower() if lower else x
+        return any([word in value for word in words])
+
+    return match
+
+
+def _legacy_linkedin(soup):
+    cards = soup.find_all(
+        ["div"],
+        class_=lambda x: (
+            x
+            and any(
+                [
+                    "base-card" in x.lower(),
+                    "job-search-card" in x.lower(),
+                    "result-card" in x.lower(),
+                    "jobs-search__results-list" in x.lower(),
+                ]
+            )
+        ),
+    )
+    for card in cards[:15]:
+        yield (
+            card.find(
+                ["h3", "h4"],
+                class_=lambda x: x
+                and any(
+                    [
+                        "base-search-card__title" in x,
+                        "job-title" in x,
+                        "result-card__title" in x,
+                    ]
+                ),
+            )
+            or card.find(["a"], attrs={"data-tracking-will-navigate": True}),
+            card.find(
+                ["h4", "span"],
+                class_=lambda x: x
+                and any(
+                    [
+                        "base-search-card__subtitle" in x,
+                        "job-search-card__subtitle" in x,
+                        "result-card__subtitle" in x,
+                    ]
+                ),
+            ),
+            card.find(
+                ["span"], class_=lambda x: x and "job-search-card__location" in x
+            ),
+        )
+
+
+def _legacy_indeed(soup):
+    # The old card predicate matched nearly every classed element, so the
+    # baseline uses the intended class list and keeps the outermost cards
+    cards = soup.find_all(
+        ["div", "td", "li"],
+        class_=lambda x: x
+        and any(
+            [
+                "jobsearch-SerpJobCard" in x,
+                "job_seen_beacon" in x,
+                "slider_container" in x,
+                "result" in x.lower() and "noresult" not in x.lower(),
+            ]
+        ),
+    )
+    matched = {id(card) for card in cards}
+    cards = [c for c in cards if not any(id(p) in matched for p in c.parents)]
+    for card in cards[:20]:
+        yield (
+            card.find(["h2", "a"], attrs={"data-jk": True})
+            or card.find(["h2", "span"], class_=lambda x: x and "jobTitle" in x)
+            or card.find(["a"], class_=_any_class("jobTitle", "jobTitle-color-purple")),
+            card.find(["span", "a"], class_=lambda x: x and "companyName" in x)
+            or card.find(["span"], attrs={"data-testid": "company-name"})
+            or card.find(["div"], class_=lambda x: x and "company" in x.lower()),
+            card.find(["span", "div"], class_=_any_class("salary", lower=True)),
+            card.find(["div", "span"], attrs={"data-testid": "job-location"}),
+        )
+
+
+def _legacy_dice(soup):
+    cards = soup.find_all(
+        ["div"],
+        class_=lambda x: x
+        and any(
+            [
+                "card" in x.lower() and "job" in x.lower(),
+                "search-card" in x.lower(),
+                "job-tile" in x.lower(),
+                "result-card" in x.lower(),
+            ]
+        ),
+    )
+    cards.extend(
+        soup.find_all(
+            ["div", "article"],
+            attrs={"data-cy": lambda x: x and "job" in x.lower()},
+        )
+    )
+    for card in cards[:12]:
+        yield (
+            card.find(
+                ["h5", "h4", "h3"],
+                class_=_any_class("job-title", "card-title", lower=True),
+            )
+            or card.find(["a"], class_=_any_class("job-title", lower=True))
+            or card.find(["h5", "h4", "h3"]),
+            card.find(
+                ["span", "div", "p"],
+                class_=_any_class("company", "employer", lower=True),
+            )
+            or card.find(["span"], attrs={"data-cy": "company-name"}),
+            card.find(["span", "div"], class_=_any_class("location", "city", lower=True)),
+            card.find(
+                ["span", "div"], class_=_any_class("salary", "rate", "pay", lower=True)
+            ),
+        )
+
+
+def _compiled(spec):
+    def extract(soup):
+        for card in spec.find_cards(soup):
+            yield tuple(spec.extract(card).values())
+
+    return extract
+
+
+BOARDS = [
+    ("LinkedIn", "linkedin_search.html", _legacy_linkedin, scraper_linkedin),
+    ("Indeed", "indeed_search.html", _legacy_indeed, scraper_indeed),
+    ("Dice", "dice_search.html", _legacy_dice, scraper_dice),
+]
+
+
+def _cards_per_second(extract, soup):
+    cards = 0
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        cards += len(list(extract(soup)))
+    return cards / (time.perf_counter() - start)
+
+
+def _texts(fields):
+    return [elem.get_text(strip=True) if elem else None for elem in fields]
+
+
+def test_compiled_extraction_outperforms_lambda_finds(capsys):
+    rows = []
+    for name, fixture, legacy, module in BOARDS:
+        soup = BeautifulSoup((FIXTURES / fixture).read_bytes(), "html.parser")
+        compiled = _compiled(module.CARD_SPEC)
+
+        # Both extractors must pick the same elements before timing them
+        assert [_texts(f) for f in compiled(soup)] == [_texts(f) for f in legacy(soup)]
+
+        rows.append(
+            (name, _cards_per_second(legacy, soup), _cards_per_second(compiled, soup))
+        )
+
+    with capsys.disabled():
+        print(f"\n{ROUNDS} rounds per board, cards/sec")
+        print("board       lambda_finds    compiled  speedup")
+        for name, before, after in rows:
+            print(f"{name:<8}  {before:>12.0f}  {after:>10.0f}  {after / before:>6.1f}x")
+
+    for name, before, after in rows:
+        assert after > before, name
@@ -0,0 +1,117 @@
+"""
+Writes/sec of concurrent API-style writes: one commit per request versus
+the group-commit writer.
+
+CONCURRENCY threads each create keywords the way the keywords endpoint does.
+Per-request commits open a session, add the row and commit it; group commit
+submits the same mutation to ``GroupCommitWriter`` and waits for its future.
+Both run against file-backed SQLite databases built by ``create_db_engine``
+with synchronous=NORMAL and synchronous=FULL. Set BENCH_GROUP_WRITES and
+BENCH_GROUP_CONCURRENCY to change the load.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the numbers.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from src.config import Settings
+from src.models.database import Base, create_db_engine
+from src.models.job_application import JobApplication
+from src.models.keyword import Keyword
+from src.models.user import User
+from src.services.group_commit import GroupCommitWriter
+from src.services.keyword_service import KeywordService
+
+pytestmark = pytest.mark.benchmark
+
+WRITES = int(os.getenv("BENCH_GROUP_WRITES", "400"))
+CONCURRENCY = int(os.getenv("BENCH_GROUP_CONCURRENCY", "16"))
+
+PROFILES = [
+    ("NORMAL", Settings(SQLITE_SYNCHRONOUS="NORMAL")),
+    ("FULL", Settings(SQLITE_SYNCHRONOUS="FULL")),
+]
+
+keyword_service = KeywordService()
+
+
+def _session_factory(path, config):
+    engine = create_db_engine(
+        f"sqlite:///{path}", config, pool_size=CONCURRENCY, max_overflow=0
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = factory()
+    db.add(User(id=1, username="bench", email="b@example.com", password_hash="x"))
+    db.commit()
+    db.close()
+    return engine, factory
+
+
+def _commit_per_request(factory):
+    def write(i):
+        db = factory()
+        try:
+            keyword_service.create_keyword(db, term=f"term-{i}", user_id=1)
+        finally:
+            db.close()
+
+    return write
+
+
+def _group_commit(writer):
+    def write(i):
+        writer.submit(
+            partial(keyword_service.add_keyword, term=f"term-{i}", user_id=1)
+        ).result()
+
+    return write
+
+
+def _writes_per_second(write):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        list(pool.map(write, range(WRITES)))
+    return WRITES / (time.perf_counter() - start)
+
+
+def _count(factory):
+    db = factory()
+    try:
+        return db.query(Keyword).count()
+    finally:
+        db.close()
+
+
+def test_group_commit_raises_concurrent_write_throughput(tmp_path, capsys):
+    rows = []
+    for name, config in PROFILES:
+        engine, factory = _session_factory(tmp_path / f"single-{name}.db", config)
+        single = _writes_per_second(_commit_per_request(factory))
+        assert _count(factory) == WRITES
+        engine.dispose()
+
+        engine, factory = _session_factory(tmp_path / f"group-{name}.db", config)
+        writer = GroupCommitWriter(factory, max_batch=64, max_delay_ms=2)
+        try:
+            grouped = _writes_per_second(_group_commit(writer))
+        finally:
+            writer.stop()
+        assert _count(factory) == WRITES
+        engine.dispose()
+        rows.append((name, single, grouped, writer.stats()["commits"]))
+
+    with capsys.disabled():
+        print(f"\n{WRITES} writes from {CONCURRENCY} threads, writes/sec")
+        print("synchronous  per_request  group_commit  group_commits")
+        for name, single, grouped, commits in rows:
+            print(f"{name:<11}  {single:>11.0f}  {grouped:>12.0f}  {commits:>13}")
+
+    for name, single, grouped, _ in rows:
+        assert grouped > single, name
@@ -0,0 +1,134 @@
+"""
+Search latency over a synthetic corpus of BENCH_SEARCH_ROWS jobs: the FTS5
+index behind /api/jobs/search versus the ``ilike`` substring filter it
+replaces, which has to read every row.
+
+Descriptions are Zipf-distributed words from a 5000-word vocabulary plus
+two of eight skills, so "python" matches about a quarter of the corpus; the
+queries cover a rare word, a common word, a phrase and two prefixes. The
+``ilike`` baseline stops at the first LIMIT rows in table order without any
+ranking, so it only keeps up when most rows match. Building the corpus and
+its index dominates the runtime, so the default is a small 5k-row corpus
+that only checks the results; the speed-up is asserted from 100k rows on.
+Set BENCH_SEARCH_ROWS=200000 for the full comparison, or 1000000 for the
+1M-row corpus (about three minutes).
+
+Run with ``pytest tests/performance -s`` to see the numbers.
+"""
+
+import itertools
+import os
+import random
+import statistics
+import time
+
+from sqlalchemy import create_engine, or_
+from sqlalchemy.orm import sessionmaker
+
+from src.models.job import Job
+from src.models.migrations import migrate
+from src.services.job_search import search_jobs
+
+ROWS = int(os.getenv("BENCH_SEARCH_ROWS", "5000"))
+# Below this the whole table fits in a few pages and a scan is cheap too
+SCALE_ROWS = 100_000
+BATCH = 50_000
+REPEAT = 5
+LIMIT = 20
+
+TITLES = ["Developer", "Engineer", "Analyst", "Manager", "Designer", "Architect"]
+SKILLS = ["python", "java", "rust", "golang", "kotlin", "react", "postgres", "kafka"]
+VOCABULARY = [f"w{n}" for n in range(5000)]
+_ZIPF = list(itertools.accumulate(1 / rank for rank in range(1, len(VOCABULARY) + 1)))
+
+QUERIES = {
+    "rare word": "zymurgy",
+    "common word": "python",
+    "phrase": '"senior python developer"',
+    "prefix": "kafk* postg*",
+}
+
+
+def _rows(rng, start, count):
+    for i in range(start, start + count):
+        skill = SKILLS[min(int(rng.expovariate(0.6)), len(SKILLS) - 1)]
+        level = "Senior " if i % 3 == 0 else ""
+        words = rng.choices(VOCABULARY, cum_weights=_ZIPF, k=40)
+        words += rng.sample(SKILLS, k=2)
+        if i % 100_000 == 0:
+            words.append("zymurgy")
+        yield (
+            f"{level}{skill.title()} {TITLES[i % len(TITLES)]}",
+            f"Company {i % 5000}",
+            " ".join(words),
+            f"https://jobs.example/{i}",
+            f"{i:040x}",
+        )
+
+
+def _seed(engine):
+    migrate(engine)
+    rng = random.Random(7)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO users (id, username) VALUES (1, 'bench')")
+    for start in range(0, ROWS, BATCH):
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT INTO jobs (title, company, description, application_link,"
+                " fingerprint, status, user_id) VALUES (?, ?, ?, ?, ?, 'new', 1)",
+                list(_rows(rng, start, min(BATCH, ROWS - start))),
+            )
+
+
+def _ilike(db, query):
+    words = [w.strip('"*') for w in query.split()]
+    filters = [
+        or_(Job.title.ilike(f"%{w}%"), Job.description.ilike(f"%{w}%"))
+        for w in words
+    ]
+    return db.query(Job).filter(Job.user_id == 1, *filters).limit(LIMIT).all()
+
+
+def _latency_ms(run):
+    samples = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def test_fts_search_beats_substring_scan(tmp_path, capsys):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    start = time.perf_counter()
+    _seed(engine)
+    build_s = time.perf_counter() - start
+
+    db = sessionmaker(bind=engine)()
+    rows = []
+    try:
+        for name, query in QUERIES.items():
+            hits = search_jobs(db, 1, query, limit=LIMIT)
+            assert hits
+            assert all(hit.snippet for hit in hits)
+            rows.append(
+                (
+                    name,
+                    _latency_ms(lambda: search_jobs(db, 1, query, limit=LIMIT)),
+                    _latency_ms(lambda: _ilike(db, query)),
+                )
+            )
+    finally:
+        db.close()
+        engine.dispose()
+
+    with capsys.disabled():
+        print(f"\n{ROWS} jobs indexed in {build_s:.1f}s, top {LIMIT}, median ms")
+        print("query          fts5    ilike")
+        for name, fts_ms, ilike_ms in rows:
+            print(f"{name:<11}  {fts_ms:>6.1f}  {ilike_ms:>7.1f}")
+
+    if ROWS >= SCALE_ROWS:
+        by_name = {name: (fts_ms, ilike_ms) for name, fts_ms, ilike_ms in rows}
+        fts_ms, ilike_ms = by_name["rare word"]
+        assert fts_ms < ilike_ms / 10
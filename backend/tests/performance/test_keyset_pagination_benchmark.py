@@ -0,0 +1,104 @@
+"""
+Page latency of /api/jobs/ style listing: OFFSET versus keyset cursors.
+
+One user's jobs table is filled with BENCH_KEYSET_ROWS rows on a migrated
+database, then a page of PAGE_SIZE rows is read at increasing depths, once
+with ``skip`` and once with the cursor of the row just before the page.
+OFFSET walks past every earlier row, so its latency grows with depth; the
+cursor seeks in ix_jobs_user_id and should stay flat. The default 5k rows
+only check that both read the same pages; the latencies are compared from
+100k rows on, so set BENCH_KEYSET_ROWS=200000 for the full comparison.
+
+Run with ``pytest tests/performance -s`` to see the numbers.
+"""
+
+import os
+import statistics
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.models.job import Job
+from src.models.migrations import migrate
+from src.services import job_service
+
+ROWS = int(os.getenv("BENCH_KEYSET_ROWS", "5000"))
+# Below this OFFSET skips too few rows to be slower than a seek
+SCALE_ROWS = 100_000
+PAGE_SIZE = 50
+REPEAT = 20
+DEPTHS = [0, ROWS // 10, ROWS // 2, ROWS - PAGE_SIZE]
+
+
+def _seed(engine):
+    migrate(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO users (id, username) VALUES (1, 'bench')")
+        # A second user's rows interleave with the first's, as in a shared table
+        conn.exec_driver_sql(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n"
+            f" WHERE i < {ROWS * 2})"
+            " INSERT INTO jobs (title, company, application_link, status, user_id,"
+            " fingerprint) SELECT 'Job ' || i, 'Co', 'https://x.io/' || i, 'new',"
+            " 1 + i % 2, printf('%040d', i) FROM n"
+        )
+
+
+def _latency_ms(read):
+    samples = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        page = read()
+        samples.append((time.perf_counter() - start) * 1000)
+        assert len(page) == PAGE_SIZE
+    return statistics.median(samples)
+
+
+def test_cursor_pages_stay_flat_as_offset_grows(tmp_path, capsys):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    _seed(engine)
+    db = sessionmaker(bind=engine)()
+    user_jobs = db.query(Job.id).filter(Job.user_id == 1).order_by(Job.id)
+    rows = []
+    try:
+        for depth in DEPTHS:
+            cursor = None
+            if depth:
+                (last_id,) = user_jobs.offset(depth - 1).first()
+                cursor = job_service.JOB_ORDER.encode(Job(id=last_id))
+
+            by_offset = job_service.get_jobs(db, 1, skip=depth, limit=PAGE_SIZE)
+            by_cursor = job_service.get_jobs(db, 1, limit=PAGE_SIZE, cursor=cursor)
+            assert [j.id for j in by_offset] == [j.id for j in by_cursor]
+
+            rows.append(
+                (
+                    depth,
+                    _latency_ms(
+                        lambda: job_service.get_jobs(
+                            db, 1, skip=depth, limit=PAGE_SIZE
+                        )
+                    ),
+                    _latency_ms(
+                        lambda: job_service.get_jobs(
+                            db, 1, limit=PAGE_SIZE, cursor=cursor
+                        )
+                    ),
+                )
+            )
+    finally:
+        db.close()
+        engine.dispose()
+
+    with capsys.disabled():
+        print(f"\n{ROWS} jobs for the user, {PAGE_SIZE}-row pages, median ms")
+        print("     depth    offset    cursor")
+        for depth, offset_ms, cursor_ms in rows:
+            print(f"{depth:>10}  {offset_ms:>8.2f}  {cursor_ms:>8.2f}")
+
+    if ROWS >= SCALE_ROWS:
+        _, first_offset, first_cursor = rows[0]
+        _, last_offset, last_cursor = rows[-1]
+        assert last_cursor < last_offset / 5
+        assert last_cursor < max(first_cursor, first_offset) * 3
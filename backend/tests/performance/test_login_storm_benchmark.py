@@ -0,0 +1,159 @@
+"""
+Latency of an application read during a login storm.
+
+STORM_CLIENTS coroutines log in back to back for STORM_SECONDS while a
+reader fetches /api/applications/ every READ_INTERVAL and records each
+latency. Two setups are compared:
+
+* threadpool: bcrypt runs in the AnyIO threadpool with no admission
+  control, as the sync login endpoint used to do. Hashes hold every
+  threadpool slot, so the sync read endpoint queues behind them.
+* bounded: the dedicated ``PasswordHasher`` process pool, admitting
+  AUTH_HASH_MAX_PENDING hashes and rejecting the rest with a 503.
+
+The per-client rate limit is disabled here, since every request comes from
+one test client and it would otherwise stop the storm. Set
+BENCH_STORM_CLIENTS and BENCH_STORM_SECONDS to change the load.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the numbers.
+"""
+
+import asyncio
+import os
+import statistics
+import time
+from collections import Counter
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.main import app
+from src.middleware import rate_limit
+from src.middleware.auth import get_current_user
+from src.middleware.rate_limit import RateLimiter
+from src.models.database import Base, get_async_db, get_db
+from src.models.job_application import JobApplication
+from src.models.user import User
+from src.services import auth_service
+from src.services.password_hasher import PasswordHasher, get_password_hash
+
+pytestmark = pytest.mark.benchmark
+
+STORM_CLIENTS = int(os.getenv("BENCH_STORM_CLIENTS", "64"))
+# Logins reach the hasher only after their user lookup, so on a small machine
+# the threadpool takes a few seconds to fill; the storm has to outlast that
+STORM_SECONDS = float(os.getenv("BENCH_STORM_SECONDS", "8"))
+READ_INTERVAL = 0.05
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def _storm(client):
+    statuses = Counter()
+    read_ms = []
+    deadline = time.perf_counter() + STORM_SECONDS
+
+    async def login():
+        while time.perf_counter() < deadline:
+            response = await client.post(
+                "/api/auth/login", json={"username": "storm", "password": "pw"}
+            )
+            statuses[response.status_code] += 1
+            if response.status_code == 503:
+                await asyncio.sleep(0.05)
+
+    async def read():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = await client.get("/api/applications/")
+            assert response.status_code == 200
+            read_ms.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(READ_INTERVAL)
+
+    await asyncio.gather(read(), *(login() for _ in range(STORM_CLIENTS)))
+    return read_ms, statuses
+
+
+def _run(hasher):
+    transport = httpx.ASGITransport(app=app)
+
+    async def main():
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await _storm(client)
+
+    original = auth_service.password_hasher
+    auth_service.password_hasher = hasher
+    try:
+        return asyncio.run(main())
+    finally:
+        auth_service.password_hasher = original
+        hasher.shutdown()
+
+
+def test_reads_keep_latency_during_login_storm(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "app.db"
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    db.add(User(id=1, username="storm", password_hash=get_password_hash("pw")))
+    db.commit()
+    db.close()
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", poolclass=NullPool
+    )
+    async_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with async_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_current_user] = lambda: User(id=1, username="storm")
+    monkeypatch.setattr(rate_limit, "auth_rate_limiter", RateLimiter(per_minute=0))
+    rows = []
+    try:
+        for name, hasher in [
+            ("threadpool", PasswordHasher(workers=0, max_pending=10**6)),
+            ("bounded", PasswordHasher(workers=2, max_pending=16)),
+        ]:
+            read_ms, statuses = _run(hasher)
+            rows.append((name, read_ms, statuses))
+    finally:
+        app.dependency_overrides.clear()
+        asyncio.run(async_engine.dispose())
+        engine.dispose()
+
+    with capsys.disabled():
+        print(
+            f"\n{STORM_CLIENTS} clients logging in for {STORM_SECONDS:.0f}s,"
+            " /api/applications/ latency in ms"
+        )
+        print("hasher      reads  median     p99  logins_ok  rejected")
+        for name, read_ms, statuses in rows:
+            print(
+                f"{name:<10}  {len(read_ms):>5}  {statistics.median(read_ms):>6.1f}"
+                f"  {_percentile(read_ms, 0.99):>6.1f}  {statuses[200]:>9}"
+                f"  {statuses[503]:>8}"
+            )
+
+    (_, threadpool_ms, _), (_, bounded_ms, bounded_statuses) = rows
+    assert bounded_statuses[200] > 0
+    assert _percentile(bounded_ms, 0.99) < _percentile(threadpool_ms, 0.99) / 2
@@ -0,0 +1,114 @@
+"""
+Per-request cost of the metrics middleware.
+
+A minimal ASGI app is called directly, with no server or client in the way,
+bare and wrapped in each middleware. ``BaseHTTPMiddleware`` is the design
+MetricsMiddleware replaced: the same metrics recorded from ``dispatch``,
+which runs the app in a separate task and streams the response through a
+memory channel. The difference from the bare app is the overhead a request
+pays for its metrics.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the numbers.
+"""
+
+import asyncio
+import time
+
+import pytest
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.middleware.metrics import (
+    REQUEST_LATENCY,
+    REQUESTS_TOTAL,
+    MetricsMiddleware,
+)
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS = 5000
+REPEAT = 5
+
+# Upper bound on what recording metrics may add to a request
+MAX_OVERHEAD_US = 100
+
+
+class _Route:
+    path = "/items/{item_id}"
+
+
+async def _app(scope, receive, send):
+    scope["route"] = _Route
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b'{"id": 1}'})
+
+
+class _DispatchMetrics(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        with REQUEST_LATENCY.labels(method="GET", endpoint="/items/{item_id}").time():
+            response = await call_next(request)
+        REQUESTS_TOTAL.labels(
+            method="GET", endpoint="/items/{item_id}", status_code=response.status_code
+        ).inc()
+        return response
+
+
+def _scope():
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/1",
+        "raw_path": b"/items/1",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    pass
+
+
+def _per_request_us(app):
+    async def run():
+        for _ in range(REQUESTS):
+            await app(_scope(), _receive, _send)
+
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        asyncio.run(run())
+        timings.append((time.perf_counter() - start) / REQUESTS * 1e6)
+    return min(timings)
+
+
+def test_metrics_overhead_is_bounded(capsys):
+    bare = _per_request_us(_app)
+    rows = [
+        ("MetricsMiddleware", _per_request_us(MetricsMiddleware(_app))),
+        ("BaseHTTPMiddleware", _per_request_us(_DispatchMetrics(_app))),
+    ]
+
+    with capsys.disabled():
+        print(f"\n{REQUESTS} requests, microseconds per request (bare app {bare:.1f})")
+        print("middleware            total  overhead")
+        for name, total in rows:
+            print(f"{name:<20}  {total:>6.1f}  {total - bare:>8.1f}")
+
+    (_, asgi), (_, dispatch) = rows
+    assert asgi - bare < MAX_OVERHEAD_US
+    assert asgi < dispatch / 2
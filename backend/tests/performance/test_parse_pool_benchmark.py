@@ -0,0 +1,80 @@
+"""
+Parse throughput of the scrape pipeline's parse stage by worker count.
+
+A batch of saved search pages is pushed through ``ParseStage`` the way
+fetchers push them: first parsed inline on the event loop, then by 1, 2 and
+4 worker processes (capped at the CPU count). Pool start-up is excluded.
+Scaling is only asserted on machines with more than one core. Set
+BENCH_PARSE_PAGES to change the batch size.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the numbers.
+"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.services import scraper_dice, scraper_indeed, scraper_linkedin
+from src.services.scrape_orchestrator import ParseStage
+
+pytestmark = pytest.mark.benchmark
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+PAGES = int(os.getenv("BENCH_PARSE_PAGES", "60"))
+CORES = os.cpu_count() or 1
+
+BOARD_PAGES = [
+    (scraper_linkedin.parse_search_page, "linkedin_search.html"),
+    (scraper_indeed.parse_search_page, "indeed_search.html"),
+    (scraper_dice.parse_search_page, "dice_search.html"),
+]
+
+
+def _batch():
+    pages = [(parse, (FIXTURES / name).read_bytes()) for parse, name in BOARD_PAGES]
+    return [pages[i % len(pages)] for i in range(PAGES)]
+
+
+async def _timed_parse(batch, workers):
+    if workers == 0:
+        start = time.perf_counter()
+        results = [parse(content, "Python") for parse, content in batch]
+        return time.perf_counter() - start, results
+
+    async with ParseStage(workers, queue_size=2 * workers) as stage:
+
+        async def parse_all(pages):
+            return await asyncio.gather(
+                *(stage.parse(parse, content, "Python") for parse, content in pages)
+            )
+
+        await parse_all(batch[:workers])  # start every worker process
+        start = time.perf_counter()
+        results = await parse_all(batch)
+        return time.perf_counter() - start, results
+
+
+def _pages_per_second(batch, workers):
+    elapsed, results = asyncio.run(_timed_parse(batch, workers))
+    assert all(results)
+    return len(batch) / elapsed
+
+
+def test_parse_throughput_scales_with_workers(capsys):
+    batch = _batch()
+    worker_counts = [0] + [n for n in (1, 2, 4) if n <= max(CORES, 1)]
+    rows = [(workers, _pages_per_second(batch, workers)) for workers in worker_counts]
+
+    with capsys.disabled():
+        print(f"\n{len(batch)} pages, {CORES} cores")
+        print("workers  pages/sec")
+        for workers, rate in rows:
+            label = "inline" if workers == 0 else str(workers)
+            print(f"{label:>7}  {rate:>9.1f}")
+
+    if CORES >= 2:
+        rates = dict(rows)
+        assert rates[2] > rates[1] * 1.3
@@ -0,0 +1,132 @@
+"""
+Per-page parse latency and memory of full versus card-only parsing.
+
+Each saved search page is parsed into a complete BeautifulSoup tree and into
+the partial tree ``CardSpec.parse`` builds, which keeps only job cards and
+JSON-LD scripts. Latency is the median of BENCH_PARSE_ROUNDS parses; peak
+heap is the tracemalloc peak of one parse. Peak RSS is measured in a fresh
+interpreter that holds BENCH_PARSE_TREES parsed copies of the page, and is
+reported per page.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the table.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+import pytest
+
+from src.services import scraper_dice, scraper_indeed, scraper_linkedin
+from src.services.extraction import HTML_PARSER
+
+pytestmark = pytest.mark.benchmark
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+ROUNDS = int(os.getenv("BENCH_PARSE_ROUNDS", "20"))
+TREES = int(os.getenv("BENCH_PARSE_TREES", "100"))
+
+BOARDS = [
+    ("LinkedIn", "linkedin_search.html", "scraper_linkedin", scraper_linkedin),
+    ("Indeed", "indeed_search.html", "scraper_indeed", scraper_indeed),
+    ("Dice", "dice_search.html", "scraper_dice", scraper_dice),
+]
+
+# Runs in a fresh interpreter, on this one's import path, so the RSS growth
+# belongs to the parsed trees
+RSS_SCRIPT = """
+import os, resource, sys
+sys.path[:] = sys.argv[1].split(os.pathsep)
+from bs4 import BeautifulSoup
+from src.services import {module} as board
+from src.services.extraction import HTML_PARSER
+content = open(sys.argv[2], "rb").read()
+parse = (lambda: board.CARD_SPEC.parse(content)) if sys.argv[3] == "partial" else (
+    lambda: BeautifulSoup(content, HTML_PARSER)
+)
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+trees = [parse() for _ in range({trees})]
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print((after - before) / {trees})
+"""
+
+
+def _median_ms(parse):
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        parse()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _peak_heap_kib(parse):
+    tracemalloc.start()
+    try:
+        tree = parse()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del tree
+    return peak / 1024
+
+
+def _rss_kib_per_page(module, fixture, mode):
+    script = RSS_SCRIPT.format(module=module, trees=TREES)
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            script,
+            os.pathsep.join(sys.path),
+            str(FIXTURES / fixture),
+            mode,
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def test_partial_parse_uses_less_time_and_memory(capsys):
+    rows = []
+    for name, fixture, module_name, module in BOARDS:
+        content = (FIXTURES / fixture).read_bytes()
+
+        def full():
+            return BeautifulSoup(content, HTML_PARSER)
+
+        def partial():
+            return module.CARD_SPEC.parse(content)
+
+        rows.append(
+            (
+                name,
+                _median_ms(full),
+                _median_ms(partial),
+                _peak_heap_kib(full),
+                _peak_heap_kib(partial),
+                _rss_kib_per_page(module_name, fixture, "full"),
+                _rss_kib_per_page(module_name, fixture, "partial"),
+            )
+        )
+
+    with capsys.disabled():
+        print(f"\nper page, {HTML_PARSER}: full tree -> cards only")
+        print("board     latency_ms          peak_heap_kib        peak_rss_kib")
+        for name, t_full, t_part, h_full, h_part, r_full, r_part in rows:
+            print(
+                f"{name:<8}  {t_full:>6.2f} -> {t_part:>6.2f}"
+                f"  {h_full:>7.0f} -> {h_part:>7.0f}"
+                f"  {r_full:>7.0f} -> {r_part:>7.0f}"
+            )
+
+    for name, t_full, t_part, h_full, h_part, _, _ in rows:
+        assert h_part < h_full, name
+        assert t_part < t_full, name
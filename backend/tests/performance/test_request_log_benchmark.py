@@ -0,0 +1,141 @@
+"""
+Per-request cost of request logging on the event loop.
+
+A minimal ASGI app is called directly in RequestLogMiddleware. Each
+"Request processed" record goes through the python-json-logger formatter,
+either:
+
+* sync: a StreamHandler on the logger, as main.py used to set it up, so the
+  event loop formats and writes every record itself.
+* queue: the LogQueue pipeline, where the loop only enqueues the record and
+  a listener thread formats and writes it.
+
+Two sinks are used. One is a local file. The other is a stream that stalls
+for STALL_MS every STALL_EVERY writes, as stderr does when the process
+reading the pipe falls behind.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the numbers.
+"""
+
+import asyncio
+import io
+import logging
+import statistics
+import time
+
+import pytest
+from pythonjsonlogger import jsonlogger
+
+from src.middleware.request_log import LogQueue, RequestLogMiddleware
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS = 5000
+STALL_EVERY = 100
+STALL_MS = 2
+
+
+class _StallingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        if self.writes % STALL_EVERY == 0:
+            time.sleep(STALL_MS / 1000)
+        return len(text)
+
+
+async def _app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def _scope():
+    return {
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/jobs/",
+        "query_string": b"limit=100",
+        "root_path": "",
+        "headers": [(b"host", b"testserver")],
+        "server": ("testserver", 80),
+    }
+
+
+async def _receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message):
+    pass
+
+
+def _latencies_us(app):
+    async def run():
+        samples = []
+        for _ in range(REQUESTS):
+            start = time.perf_counter()
+            await app(_scope(), _receive, _send)
+            samples.append((time.perf_counter() - start) * 1e6)
+        return samples
+
+    return asyncio.run(run())
+
+
+def _json_handler(handler):
+    handler.setFormatter(
+        jsonlogger.JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+    )
+    return handler
+
+
+def _run(logger, middleware, make_handler, queued):
+    handler = _json_handler(make_handler())
+    log_queue = None
+    if queued:
+        log_queue = LogQueue([handler], maxsize=REQUESTS)
+        logger.handlers = [log_queue.handler]
+        log_queue.start()
+    else:
+        logger.handlers = [handler]
+    try:
+        samples = _latencies_us(middleware)
+    finally:
+        if log_queue:
+            log_queue.stop()
+            assert log_queue.dropped == 0
+        handler.close()
+        logger.handlers = []
+    samples.sort()
+    return statistics.mean(samples), samples[int(len(samples) * 0.99)]
+
+
+def test_queued_logging_keeps_request_overhead_low(tmp_path, capsys):
+    logger = logging.getLogger("bench.request_log")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    middleware = RequestLogMiddleware(_app, logger=logger, sample_rate=1.0)
+    sinks = {
+        "file": lambda: logging.FileHandler(tmp_path / "requests.log"),
+        "stalling": lambda: logging.StreamHandler(_StallingStream()),
+    }
+
+    results = {}
+    for sink, make_handler in sinks.items():
+        for mode in ("sync", "queue"):
+            results[sink, mode] = _run(
+                logger, middleware, make_handler, queued=mode == "queue"
+            )
+
+    with capsys.disabled():
+        print(f"\n{REQUESTS} logged requests, microseconds per request")
+        print("sink       mode     mean      p99")
+        for (sink, mode), (mean, p99) in results.items():
+            print(f"{sink:<9}  {mode:<5}  {mean:>6.1f}  {p99:>7.1f}")
+
+    # A local file rarely blocks, so the queue mainly has to cost no more
+    assert results["file", "queue"][0] < results["file", "sync"][0] * 1.25
+    assert results["stalling", "queue"][1] < results["stalling", "sync"][1] / 5
@@ -0,0 +1,116 @@
+"""
+Wall-clock benchmark of the scrape orchestrator against a local stub server.
+
+Every board is pointed at a threaded HTTP server that answers each search page
+after a fixed latency. The sequential baseline funnels every board through a
+single host with one request in flight, which is how the old blocking
+scrapers behaved; the concurrent run gives each board its own host throttle.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the timing table.
+"""
+
+import asyncio
+import dataclasses
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.config import settings
+from src.services.scrape_orchestrator import BOARDS, scrape_boards
+
+pytestmark = pytest.mark.benchmark
+
+STUB_LATENCY = 0.02
+KEYWORD_COUNTS = [1, 2, 4, 8]
+
+STUB_PAGE = b"""
+<html><body>
+<div class="base-card job-card"><h3 class="base-search-card__title">Engineer</h3>
+<h4 class="base-search-card__subtitle">Acme</h4></div>
+</body></html>
+"""
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(STUB_LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(STUB_PAGE)))
+        self.end_headers()
+        self.wfile.write(STUB_PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 drops bursts of concurrent connects
+    request_queue_size = 128
+
+
+@pytest.fixture(scope="module")
+def stub_url():
+    server = _StubServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def _stub_boards(base_url, shared_host):
+    boards = []
+    for spec in BOARDS:
+        board_url = f"{base_url}/{spec.name.lower()}"
+        boards.append(
+            dataclasses.replace(
+                spec,
+                host="stub" if shared_host else spec.host,
+                politeness_delay=(0, 0),
+                api_scraper=None,
+                build_urls=lambda keyword, limit, build=spec.build_urls, url=board_url: (
+                    build(keyword, limit, base_url=url)
+                ),
+            )
+        )
+    return boards
+
+
+def _wall_time(boards, keywords, max_concurrency_per_host):
+    start = time.perf_counter()
+    asyncio.run(
+        scrape_boards(
+            keywords,
+            boards=boards,
+            max_concurrency_per_host=max_concurrency_per_host,
+        )
+    )
+    return time.perf_counter() - start
+
+
+def test_concurrent_scrape_scales_with_keyword_count(stub_url, capsys, monkeypatch):
+    # Every stub board lives on one host, so size its pool for all of them
+    monkeypatch.setattr(settings, "SCRAPER_POOL_MAXSIZE", 4 * len(BOARDS))
+    sequential_boards = _stub_boards(stub_url, shared_host=True)
+    concurrent_boards = _stub_boards(stub_url, shared_host=False)
+
+    rows = []
+    for count in KEYWORD_COUNTS:
+        keywords = [f"keyword{i}" for i in range(count)]
+        sequential = _wall_time(sequential_boards, keywords, 1)
+        concurrent = _wall_time(concurrent_boards, keywords, 4)
+        rows.append((count, sequential, concurrent))
+
+    capsys.readouterr()
+    with capsys.disabled():
+        print("\nkeywords  sequential_s  concurrent_s  speedup")
+        for count, sequential, concurrent in rows:
+            print(
+                f"{count:>8}  {sequential:>12.3f}  {concurrent:>12.3f}"
+                f"  {sequential / concurrent:>6.1f}x"
+            )
+
+    largest = rows[-1]
+    assert largest[2] < largest[1] / 2
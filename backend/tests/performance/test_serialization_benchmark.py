@@ -0,0 +1,135 @@
+"""
+Time to load and serialize a 1k-row page of the list endpoints.
+
+``default`` is what FastAPI does with a returned list: validate ORM objects
+against ``response_model``, dump them to Python, walk that result in
+``jsonable_encoder`` and encode it with ``json.dumps``. ``json_list`` is
+the path the routes now take: one validation by a prebuilt ``TypeAdapter``
+that writes JSON bytes directly, fed Core rows for jobs and the ORM page
+(keywords included) for applications.
+
+Run with ``pytest tests/performance -m benchmark -s`` to see the numbers.
+"""
+
+import json
+import statistics
+import time
+from datetime import date
+
+from fastapi.encoders import jsonable_encoder
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from src.api.responses import json_list
+from src.models.job import Job
+from src.models.job_application import JobApplication
+from src.models.keyword import Keyword
+from src.models.migrations import migrate
+from src.schemas.job import JOB_LIST
+from src.schemas.job_application import JOB_APPLICATION_LIST
+from src.services import job_service
+from src.services.application_service import ApplicationService
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = 1000
+REPEAT = 20
+
+application_service = ApplicationService()
+
+
+def _seed(db):
+    db.execute(
+        Job.__table__.insert(),
+        [
+            {
+                "title": f"Backend Developer {i}",
+                "company": "Acme",
+                "description": "Build and run Python services. " * 20,
+                "application_link": f"https://x.io/{i}",
+                "salary": "$100k",
+                "status": "new",
+                "user_id": 1,
+                "fingerprint": f"{i:040d}",
+            }
+            for i in range(ROWS)
+        ],
+    )
+    keywords = [Keyword(term=term, user_id=1) for term in ("python", "sql", "aws")]
+    db.add_all(
+        JobApplication(
+            user_id=1,
+            job_title=f"Developer {i}",
+            company="Acme",
+            application_date=date(2026, 1, 1),
+            status="applied",
+            job_board="LinkedIn",
+            notes="Followed up by email.",
+            keywords=keywords,
+        )
+        for i in range(ROWS)
+    )
+    db.commit()
+
+
+def _default(adapter, items):
+    validated = adapter.validate_python(items, from_attributes=True)
+    return json.dumps(jsonable_encoder(adapter.dump_python(validated, mode="json")))
+
+
+def _median_ms(db, render):
+    samples = []
+    for _ in range(REPEAT):
+        db.expunge_all()
+        start = time.perf_counter()
+        render()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def test_json_list_beats_default_serialization(tmp_path, capsys):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    migrate(engine)
+    db = sessionmaker(bind=engine)()
+    rows = []
+    try:
+        db.connection().exec_driver_sql(
+            "INSERT INTO users (id, username) VALUES (1, 'bench')"
+        )
+        _seed(db)
+
+        def job_rows():
+            query = select(*job_service.JOB_LIST_COLUMNS).filter(Job.user_id == 1)
+            return [row._asdict() for row in db.execute(query.limit(ROWS))]
+
+        def applications():
+            return application_service.get_applications(db, 1, limit=ROWS)
+
+        cases = {
+            "jobs": (
+                lambda: _default(JOB_LIST, job_service.get_jobs(db, 1, limit=ROWS)),
+                lambda: json_list(JOB_LIST, job_rows()).body,
+            ),
+            "applications": (
+                lambda: _default(JOB_APPLICATION_LIST, applications()),
+                lambda: json_list(
+                    JOB_APPLICATION_LIST, applications(), from_attributes=True
+                ).body,
+            ),
+        }
+        for name, (default, fast) in cases.items():
+            assert json.loads(default()) == json.loads(fast())
+            rows.append((name, _median_ms(db, default), _median_ms(db, fast)))
+    finally:
+        db.close()
+        engine.dispose()
+
+    with capsys.disabled():
+        print(f"\nload + serialize {ROWS} rows, median ms")
+        print("endpoint       default  json_list")
+        for name, default_ms, fast_ms in rows:
+            print(f"{name:<13}  {default_ms:>7.1f}  {fast_ms:>9.1f}")
+
+    for _, default_ms, fast_ms in rows:
+        assert fast_ms < default_ms / 1.5
@@ -1,11 +1,12 @@
 import pytest
 from datetime import date
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from src.models.database import Base
 from src.models.user import User
 from src.models.job_application import JobApplication
 from src.services.application_service import ApplicationService
+from src.services.keyword_service import KeywordService
 
 # Setup in-memory SQLite for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -208,3 +209,77 @@ def test_delete_application(db_session, application_service, test_user):
         db_session, 999, test_user.id
     )
     assert not_found_deleted_app is None
+
+
+def _count_statements(run):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        return run(), statements
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+
+def test_resolve_keywords_batches_lookup_and_insert(db_session, test_user):
+    keyword_service = KeywordService()
+    user_id = test_user.id
+    keyword_service.resolve_keywords(db_session, ["Resolve A"], user_id)
+    db_session.commit()
+
+    keywords, statements = _count_statements(
+        lambda: keyword_service.resolve_keywords(
+            db_session,
+            ["Resolve B", "Resolve A", "Resolve C", "Resolve B"],
+            user_id,
+        )
+    )
+    db_session.commit()
+
+    assert [k.term for k in keywords] == ["Resolve B", "Resolve A", "Resolve C"]
+    assert all(k.id is not None for k in keywords)
+    assert statements == ["SELECT", "INSERT", "SELECT"]
+
+
+def test_get_applications_loads_keywords_per_page(
+    db_session, application_service, test_user
+):
+    keyword_service = KeywordService()
+    user_id = test_user.id
+    for i, terms in enumerate([["Page Go"], ["Page Go", "Page Rust"], []]):
+        application = application_service.add_application(
+            db_session,
+            user_id,
+            f"App {i}",
+            "Comp",
+            date.today(),
+            "Applied",
+            None,
+            None,
+            None,
+        )
+        application.keywords = keyword_service.resolve_keywords(
+            db_session, terms, user_id
+        )
+    db_session.commit()
+    db_session.expire_all()
+
+    keywords, statements = _count_statements(
+        lambda: [
+            sorted(k.term for k in application.keywords)
+            for application in application_service.get_applications(
+                db_session, user_id
+            )
+        ]
+    )
+
+    assert keywords == [["Page Go"], ["Page Go", "Page Rust"], []]
+    assert statements == ["SELECT", "SELECT"]
+
+    matching = application_service.get_applications(
+        db_session, user_id, keyword_terms=["Page Go", "Page Rust"]
+    )
+    assert [a.job_title for a in matching] == ["App 0", "App 1"]
@@ -21,3 +21,151 @@ def test_get_db_dependency():
         with pytest.raises(StopIteration):
             next(db_generator)  # Ensure the generator yields only once
         mock_db_session.close.assert_called_once()
+
+
+def _pragma(connection, name):
+    from sqlalchemy import text
+
+    return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_create_db_engine_applies_sqlite_pragmas(tmp_path):
+    from backend.src.config import Settings
+    from backend.src.models.database import create_db_engine
+
+    config = Settings(
+        SQLITE_SYNCHRONOUS="FULL", SQLITE_CACHE_SIZE=-2000, SQLITE_BUSY_TIMEOUT_MS=750
+    )
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'app.db'}", config)
+    try:
+        with engine.connect() as connection:
+            assert _pragma(connection, "journal_mode") == "wal"
+            assert _pragma(connection, "synchronous") == 2  # FULL
+            assert _pragma(connection, "cache_size") == -2000
+            assert _pragma(connection, "busy_timeout") == 750
+    finally:
+        engine.dispose()
+
+
+def test_create_db_engine_sizes_the_pool_from_settings(tmp_path):
+    from backend.src.config import Settings
+    from backend.src.models.database import create_db_engine
+
+    config = Settings(DATABASE_POOL_SIZE=3, DATABASE_MAX_OVERFLOW=1)
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'app.db'}", config)
+    try:
+        assert engine.pool.size() == 3
+        assert engine.pool._max_overflow == 1
+    finally:
+        engine.dispose()
+
+
+def test_create_db_engine_defaults_to_settings_url():
+    from backend.src.config import Settings
+    from backend.src.models.database import create_db_engine
+
+    engine = create_db_engine(config=Settings(DATABASE_URL="sqlite://"))
+    try:
+        with engine.connect() as connection:
+            assert _pragma(connection, "journal_mode") == "memory"
+    finally:
+        engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("sqlite:///./sql_app.db", "sqlite+aiosqlite:///./sql_app.db"),
+        ("postgresql://app:pw@db/jobs", "postgresql+asyncpg://app:pw@db/jobs"),
+        ("sqlite+pysqlite:///./sql_app.db", "sqlite+pysqlite:///./sql_app.db"),
+    ],
+)
+def test_async_database_url(url, expected):
+    from backend.src.models.database import async_database_url
+
+    assert async_database_url(url) == expected
+
+
+@pytest.fixture
+def engine_pair(tmp_path):
+    from backend.src.config import Settings
+    from backend.src.models.database import Base, create_engine_pair
+    from backend.src.models import job, job_application, keyword, user  # noqa: F401
+
+    writer, reader = create_engine_pair(
+        f"sqlite:///{tmp_path / 'app.db'}", Settings(DATABASE_SPLIT_READS=True)
+    )
+    Base.metadata.create_all(bind=writer)
+    yield writer, reader
+    writer.dispose()
+    reader.dispose()
+
+
+def _routing_session(engine_pair):
+    from backend.src.models.database import RoutingSession
+
+    writer, reader = engine_pair
+    return RoutingSession(reader=reader, writer=writer, autoflush=False)
+
+
+def _statements_by_engine(engine_pair):
+    from sqlalchemy import event
+
+    seen = []
+    for name, engine in zip(("writer", "reader"), engine_pair):
+
+        def record(conn, cursor, statement, *args, name=name):
+            seen.append((name, statement.split()[0]))
+
+        event.listen(engine, "before_cursor_execute", record)
+    return seen
+
+
+def test_engine_pair_splits_sqlite_file_into_single_writer_and_readers(engine_pair):
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+
+    writer, reader = engine_pair
+    assert writer is not reader
+    assert writer.pool.size() == 1
+    with reader.connect() as connection:
+        with pytest.raises(OperationalError, match="readonly"):
+            connection.execute(text("DELETE FROM jobs"))
+
+
+def test_engine_pair_shares_one_engine_for_memory_databases():
+    from backend.src.models.database import create_engine_pair
+
+    writer, reader = create_engine_pair("sqlite://")
+    assert writer is reader
+
+
+def test_routing_session_reads_from_reader_and_writes_to_writer(engine_pair):
+    from backend.src.models.job import Job
+
+    seen = _statements_by_engine(engine_pair)
+    db = _routing_session(engine_pair)
+    db.query(Job).all()
+    db.add(Job(title="T", company="C", application_link="http://x", user_id=1))
+    db.commit()
+    db.query(Job).all()
+    db.close()
+
+    assert seen == [("reader", "SELECT"), ("writer", "INSERT"), ("reader", "SELECT")]
+
+
+def test_routing_session_reads_its_own_writes_until_commit(engine_pair):
+    from backend.src.models.job import Job
+
+    db = _routing_session(engine_pair)
+    other = _routing_session(engine_pair)
+    db.add(Job(title="T", company="C", application_link="http://x", user_id=1))
+    db.flush()
+
+    # The open write transaction neither blocks nor leaks into other readers
+    assert other.query(Job).count() == 0
+    assert db.query(Job).count() == 1
+    db.commit()
+    assert other.query(Job).count() == 1
+    db.close()
+    other.close()
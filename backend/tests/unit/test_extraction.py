@@ -0,0 +1,127 @@
+import re
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from src.services import scraper_dice, scraper_indeed, scraper_linkedin
+from src.services.extraction import CardSpec, select
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+
+PAGE = """
+<div class="job-card outer">
+  <span class="Salary-Range">$100k</span>
+  <a data-jk="1" href="/a">Fallback Title</a>
+  <h2 class="jobTitle">Preferred Title</h2>
+  <div class="job-card inner"><h2 class="jobTitle">Nested Title</h2></div>
+</div>
+<div class="other" data-cy="job-row"><h3>Row Title</h3></div>
+"""
+
+
+def _soup(html=PAGE):
+    return BeautifulSoup(html, "html.parser")
+
+
+def test_earlier_alternatives_win_regardless_of_position():
+    spec = CardSpec(
+        cards=(select("div", classes=["job-card"]),),
+        fields={
+            "title": (select("h2", classes=["jobTitle"]), select("a", attrs={"data-jk": True})),
+            "salary": (select("span", classes=["salary"], ignore_case=True),),
+            "missing": (select("p"),),
+        },
+    )
+
+    card = spec.find_cards(_soup())[0]
+    fields = spec.extract(card)
+
+    assert fields["title"].get_text() == "Preferred Title"
+    assert fields["salary"].get_text() == "$100k"
+    assert fields["missing"] is None
+
+
+def test_nested_cards_are_kept_unless_outermost_only():
+    nested = CardSpec(cards=(select("div", classes=["job-card"]),))
+    outermost = CardSpec(cards=(select("div", classes=["job-card"]),), outermost_only=True)
+
+    assert len(nested.find_cards(_soup())) == 2
+    assert len(outermost.find_cards(_soup())) == 1
+
+
+def test_card_selectors_fall_back_or_combine():
+    selectors = (
+        select("section"),
+        select("div", attrs={"data-cy": re.compile("job")}),
+        select("div", classes=["job-card"]),
+    )
+
+    first = CardSpec(cards=selectors).find_cards(_soup())
+    combined = CardSpec(cards=selectors, combine_cards=True).find_cards(_soup())
+
+    assert [card["class"] for card in first] == [["other"]]
+    assert len(combined) == 3
+
+
+def test_case_sensitivity_follows_the_selector():
+    soup = _soup('<span class="SALARY"></span>')
+
+    assert select("span", classes=["salary"]).matches(soup.span, "SALARY") is False
+    assert select("span", classes=["salary"], ignore_case=True).matches(
+        soup.span, "SALARY"
+    )
+
+
+def test_board_specs_extract_fixture_cards():
+    counts = {}
+    for name, module in [
+        ("linkedin", scraper_linkedin),
+        ("indeed", scraper_indeed),
+        ("dice", scraper_dice),
+    ]:
+        content = (FIXTURES / f"{name}_search.html").read_bytes()
+        jobs = module.parse_search_page(content, "Python")
+        assert all(job["title"].endswith(" - Python") for job in jobs)
+        counts[name] = len(jobs)
+
+    assert counts == {"linkedin": 15, "indeed": 20, "dice": 12}
+
+
+def test_indeed_cards_skip_no_result_banner():
+    soup = _soup(
+        '<div class="jobsearch-NoResult-messageContainer"><h2 data-jk="x">None</h2></div>'
+    )
+
+    assert scraper_indeed.CARD_SPEC.find_cards(soup) == []
+
+
+def test_parse_builds_only_cards_and_kept_elements():
+    spec = CardSpec(
+        cards=(select("div", classes=["job-card"]),),
+        keep=(select("script", attrs={"type": "application/ld+json"}),),
+    )
+    html = (
+        '<html><body><nav><a href="/">Home</a></nav>' + PAGE
+        + '<script>var x = 1;</script>'
+        + '<script type="application/ld+json">{"@type": "JobPosting"}</script>'
+        + "</body></html>"
+    )
+
+    soup = spec.parse(html.encode())
+
+    assert soup.find("nav") is None
+    assert soup.find(attrs={"data-cy": "job-row"}) is None
+    assert [s.string for s in soup.find_all("script")] == ['{"@type": "JobPosting"}']
+    assert len(spec.find_cards(soup)) == len(spec.find_cards(_soup()))
+
+
+def test_dice_reads_json_ld_from_partial_parse():
+    html = b"""<html><head><script type="application/ld+json">
+    {"@type": "JobPosting", "title": "SRE", "url": "https://www.dice.com/job-detail/1",
+     "hiringOrganization": {"name": "Acme"}}
+    </script></head><body></body></html>"""
+
+    jobs = scraper_dice.parse_search_page(html, "Go")
+
+    assert jobs[0]["title"] == "SRE - Go"
+    assert jobs[0]["company"] == "Acme"
@@ -0,0 +1,117 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from src.models.database import Base
+from src.models.job import Job
+from src.models.job_application import JobApplication
+from src.models.keyword import Keyword
+from src.models.user import User
+from src.services import job_service
+from src.services.group_commit import GroupCommitWriter
+from src.services.keyword_service import KeywordService
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'app.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = factory()
+    db.add(User(id=1, username="writer", email="w@example.com", password_hash="x"))
+    db.commit()
+    db.close()
+    return factory
+
+
+@pytest.fixture
+def writer(session_factory):
+    writer = GroupCommitWriter(session_factory, max_batch=50, max_delay_ms=50)
+    yield writer
+    writer.stop()
+
+
+def _add_keyword(term):
+    return partial(KeywordService().add_keyword, term=term, user_id=1)
+
+
+def _terms(session_factory):
+    db = session_factory()
+    try:
+        return sorted(term for (term,) in db.query(Keyword.term))
+    finally:
+        db.close()
+
+
+def test_concurrent_writes_share_commits(writer, engine, session_factory):
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(conn))
+    terms = [f"term-{i}" for i in range(20)]
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        keywords = list(pool.map(lambda t: writer.submit(_add_keyword(t)).result(), terms))
+
+    assert [k.term for k in keywords] == terms
+    assert all(k.id is not None for k in keywords)
+    assert _terms(session_factory) == sorted(terms)
+    assert writer.stats()["writes"] == 20
+    assert len(commits) == writer.stats()["commits"] < 20
+
+
+def test_failed_write_only_fails_its_own_caller(writer, session_factory):
+    first = writer.submit(_add_keyword("python"))
+    duplicate = writer.submit(_add_keyword("python"))
+    other = writer.submit(_add_keyword("rust"))
+
+    assert first.result().term == "python"
+    with pytest.raises(IntegrityError):
+        duplicate.result()
+    assert other.result().term == "rust"
+    assert _terms(session_factory) == ["python", "rust"]
+
+
+def test_run_awaits_mutation_result(writer, session_factory):
+    db = session_factory()
+    job = Job(title="T", company="C", application_link="http://x", user_id=1)
+    db.add(job)
+    db.commit()
+    job_id = job.id
+    db.close()
+
+    updated = asyncio.run(
+        writer.run(
+            partial(
+                job_service.set_job_status,
+                job_id=job_id,
+                user_id=1,
+                new_status="saved",
+            )
+        )
+    )
+
+    assert updated.status == "saved"
+    db = session_factory()
+    assert db.get(Job, job_id).status == "saved"
+    db.close()
+
+
+def test_stop_commits_queued_writes(session_factory):
+    writer = GroupCommitWriter(session_factory, max_batch=50, max_delay_ms=1000)
+    futures = [writer.submit(_add_keyword(f"term-{i}")) for i in range(3)]
+    writer.stop()
+
+    assert all(future.done() for future in futures)
+    assert _terms(session_factory) == ["term-0", "term-1", "term-2"]
@@ -0,0 +1,160 @@
+import asyncio
+import dataclasses
+import threading
+import time
+
+import httpx
+import pytest
+
+from src.services.http_cache import HttpCache
+from src.services.scrape_orchestrator import BOARDS, scrape_boards
+
+CARD_PAGE = b"""
+<html><body>
+<div class="base-card"><h3 class="base-search-card__title">Backend Engineer</h3>
+<h4 class="base-search-card__subtitle">Acme</h4></div>
+<div class="base-card"><h3 class="base-search-card__title">Data Engineer</h3>
+<h4 class="base-search-card__subtitle">Globex</h4></div>
+<div class="base-card"><h3 class="base-search-card__title">Platform Engineer</h3>
+<h4 class="base-search-card__subtitle">Initech</h4></div>
+</body></html>
+"""
+
+JOBS = [{"title": "Engineer", "company": "Acme"}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HttpCache(path=str(tmp_path / "cache.db"), ttl_seconds=60, max_entries=10)
+    yield cache
+    cache.close()
+
+
+def test_fresh_entry_is_a_hit(cache):
+    assert cache.lookup("https://a/1") is None
+    cache.store("https://a/1", {"ETag": '"v1"'}, JOBS)
+
+    page = cache.lookup("https://a/1")
+
+    assert page.fresh
+    assert page.jobs == JOBS
+    assert page.conditional_headers() == {"If-None-Match": '"v1"'}
+    assert cache.stats() == {"hits": 1, "misses": 1, "revalidated": 0, "entries": 1}
+
+
+def test_stale_entry_is_revalidated(cache):
+    cache.ttl_seconds = 0
+    cache.store("https://a/1", {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, JOBS)
+
+    page = cache.lookup("https://a/1")
+
+    assert not page.fresh
+    assert page.conditional_headers() == {
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+    }
+    assert cache.not_modified(page) == JOBS
+    assert cache.stats() == {"hits": 0, "misses": 1, "revalidated": 1, "entries": 1}
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    cache.max_entries = 2
+    cache.store("https://a/1", {}, JOBS)
+    time.sleep(0.01)
+    cache.store("https://a/2", {}, JOBS)
+    time.sleep(0.01)
+    cache.lookup("https://a/1")
+    time.sleep(0.01)
+    cache.store("https://a/3", {}, JOBS)
+
+    assert len(cache) == 2
+    assert cache.lookup("https://a/2") is None
+    assert cache.lookup("https://a/1") is not None
+
+
+def test_no_store_responses_are_not_cached(cache):
+    cache.store("https://a/1", {"Cache-Control": "no-store"}, JOBS)
+
+    assert cache.lookup("https://a/1") is None
+
+
+def test_entries_survive_reopening(tmp_path):
+    path = str(tmp_path / "cache.db")
+    first = HttpCache(path=path, ttl_seconds=60)
+    first.store("https://a/1", {}, JOBS)
+    first.close()
+
+    second = HttpCache(path=path, ttl_seconds=60)
+    assert second.lookup("https://a/1").jobs == JOBS
+    second.close()
+
+
+def _linkedin_board():
+    return [dataclasses.replace(BOARDS[0], politeness_delay=(0, 0), api_scraper=None)]
+
+
+def _scrape(handler, cache, boards=None):
+    async def scrape():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await scrape_boards(
+                ["Python"], boards=boards or _linkedin_board(), client=client, cache=cache
+            )
+
+    return asyncio.run(scrape())["LinkedIn"]
+
+
+def test_orchestrator_serves_fresh_pages_without_fetching(cache):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=CARD_PAGE)
+
+    first = _scrape(handler, cache)
+    second = _scrape(handler, cache)
+
+    assert len(requests) == 2  # two search pages, fetched once
+    assert second == first
+    assert cache.hits == 2
+
+
+def test_orchestrator_revalidates_stale_pages_without_parsing(cache):
+    cache.ttl_seconds = 0
+    conditional = []
+
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            conditional.append(request.url)
+            return httpx.Response(304)
+        return httpx.Response(200, content=CARD_PAGE, headers={"ETag": '"v1"'})
+
+    first = _scrape(handler, cache)
+
+    def fail_parse(content, keyword):
+        raise AssertionError("unchanged page was parsed again")
+
+    boards = [dataclasses.replace(_linkedin_board()[0], parse_page=fail_parse)]
+    second = _scrape(handler, cache, boards)
+
+    assert len(conditional) == 2
+    assert second == first
+    assert cache.revalidated == 2
+
+
+def test_orchestrator_counts_pages_it_could_not_cache_as_misses(cache):
+    threads = set()
+    lookup = cache.lookup
+
+    def tracking_lookup(url):
+        threads.add(threading.current_thread())
+        return lookup(url)
+
+    cache.lookup = tracking_lookup
+
+    def handler(request):
+        return httpx.Response(503)
+
+    _scrape(handler, cache)
+
+    assert cache.stats() == {"hits": 0, "misses": 2, "revalidated": 0, "entries": 0}
+    # Lookups run in worker threads, never on the event loop's thread
+    assert threading.main_thread() not in threads
@@ -0,0 +1,188 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from src.config import settings
+from src.services import http_client
+from src.services.http_client import (
+    ConnectionStats,
+    RetryTransport,
+    build_async_client,
+    build_session,
+    session_connection_stats,
+)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_session_mounts_per_host_pools(monkeypatch):
+    monkeypatch.setattr(settings, "SCRAPER_HOST_POOL_SIZES", {"www.dice.com": 7})
+
+    session = build_session()
+
+    dice = session.get_adapter("https://www.dice.com/jobs")
+    other = session.get_adapter("https://www.indeed.com/jobs")
+    assert dice._pool_maxsize == 7
+    assert other._pool_maxsize == settings.SCRAPER_POOL_MAXSIZE
+    assert dice.max_retries.total == settings.SCRAPER_MAX_RETRIES
+    assert 503 in dice.max_retries.status_forcelist
+
+
+def test_async_client_mounts_a_pool_per_board_host(monkeypatch):
+    monkeypatch.setattr(settings, "SCRAPER_HOST_POOL_SIZES", {"www.dice.com": 7})
+
+    client = build_async_client(hosts=["www.linkedin.com", "www.indeed.com"])
+
+    def pool_for(url):
+        return client._transport_for_url(httpx.URL(url))._transport._pool
+
+    linkedin = pool_for("https://www.linkedin.com/jobs")
+    indeed = pool_for("https://www.indeed.com/jobs")
+    dice = pool_for("https://www.dice.com/jobs")
+    other = pool_for("https://example.com/")
+    assert len({id(linkedin), id(indeed), id(dice), id(other)}) == 4
+    assert other is client._transport._transport._pool
+    assert linkedin._max_connections == settings.SCRAPER_POOL_MAXSIZE
+    assert dice._max_connections == 7
+    asyncio.run(client.aclose())
+
+
+def test_session_reuses_connections(server_url):
+    session = build_session()
+
+    for page in range(5):
+        assert session.get(f"{server_url}/jobs?page={page}", timeout=5).ok
+
+    stats = session_connection_stats(session)
+    assert stats.requests == 5
+    assert stats.connections == 1
+    assert stats.reused == 4
+
+
+def test_async_client_reuses_connections(server_url):
+    stats = ConnectionStats()
+
+    async def fetch():
+        async with build_async_client(stats) as client:
+            for page in range(5):
+                response = await client.get(f"{server_url}/jobs?page={page}")
+                assert response.status_code == 200
+
+    asyncio.run(fetch())
+
+    assert stats.as_dict() == {"requests": 5, "connections": 1, "reused": 4}
+
+
+def test_retry_transport_retries_retryable_statuses():
+    statuses = iter([503, 429, 200])
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(next(statuses))
+
+    async def fetch():
+        transport = RetryTransport(httpx.MockTransport(handler), retries=2, backoff=0)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.get("https://www.dice.com/jobs")
+
+    response = asyncio.run(fetch())
+
+    assert response.status_code == 200
+    assert len(attempts) == 3
+
+
+def test_retry_transport_sends_other_methods_once():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(503)
+
+    async def post():
+        transport = RetryTransport(httpx.MockTransport(handler), retries=2, backoff=0)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.post("https://www.dice.com/jobs", json={})
+
+    response = asyncio.run(post())
+
+    assert response.status_code == 503
+    assert len(attempts) == 1
+
+
+def test_retry_transport_gives_up_after_retries():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    async def fetch():
+        transport = RetryTransport(httpx.MockTransport(handler), retries=1, backoff=0)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.get("https://www.dice.com/jobs")
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(fetch())
+
+
+def test_retry_after_header_sets_the_delay():
+    transport = RetryTransport(httpx.MockTransport(lambda r: None), retries=1, backoff=9)
+    response = httpx.Response(429, headers={"Retry-After": "2"})
+
+    assert transport._delay(0, response) == 2.0
+    assert transport._delay(1, None) <= 18
+
+
+def test_backoff_is_capped():
+    transport = RetryTransport(
+        httpx.MockTransport(lambda r: None), retries=3, backoff=9, max_backoff=5
+    )
+
+    assert transport._delay(3, None) <= 5
+    assert transport._delay(0, httpx.Response(503, headers={"Retry-After": "5"})) == 5
+
+
+def test_long_retry_after_is_not_waited_for():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    async def fetch():
+        transport = RetryTransport(
+            httpx.MockTransport(handler), retries=2, backoff=0, max_backoff=30
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.get("https://www.dice.com/jobs")
+
+    response = asyncio.run(asyncio.wait_for(fetch(), timeout=5))
+
+    assert response.status_code == 429
+    assert len(attempts) == 1
+
+
+def test_scrapers_share_one_session():
+    assert http_client.get_session() is http_client.get_session()
@@ -1,6 +1,7 @@
 import pytest
 from datetime import date
 from src.models.job_application import JobApplication
+from src.models.keyword import Keyword
 from src.models.user import User
 from src.models.database import Base, engine, SessionLocal
 from sqlalchemy import create_engine
@@ -53,7 +54,7 @@ def test_create_job_application(db_session, request):
         job_board="LinkedIn",
         url="http://linkedin.com/job/123",
         notes="First application",
-        keywords="Python, FastAPI",
+        keywords=[Keyword(term="Python"), Keyword(term="FastAPI")],
     )
     db_session.add(new_application)
     db_session.commit()
@@ -68,7 +69,7 @@ def test_create_job_application(db_session, request):
     assert new_application.job_board == "LinkedIn"
     assert new_application.url == "http://linkedin.com/job/123"
     assert new_application.notes == "First application"
-    assert new_application.keywords == "Python, FastAPI"
+    assert [k.term for k in new_application.keywords] == ["Python", "FastAPI"]
 
 
 def test_get_job_application_by_id(db_session, request):
@@ -86,7 +87,7 @@ def test_get_job_application_by_id(db_session, request):
         job_board="Indeed",
         url="http://indeed.com/job/456",
         notes="Second application",
-        keywords="R, SQL",
+        keywords=[Keyword(term="R"), Keyword(term="SQL")],
     )
     db_session.add(new_application)
     db_session.commit()
@@ -116,7 +117,7 @@ def test_update_job_application(db_session, request):
         job_board="Glassdoor",
         url="http://glassdoor.com/job/789",
         notes="Third application",
-        keywords="AWS, Docker",
+        keywords=[Keyword(term="AWS"), Keyword(term="Docker")],
     )
     db_session.add(new_application)
     db_session.commit()
@@ -152,7 +153,7 @@ def test_delete_job_application(db_session, request):
         job_board="Monster",
         url="http://monster.com/job/101",
         notes="Fourth application",
-        keywords="Automation",
+        keywords=[Keyword(term="Automation")],
     )
     db_session.add(new_application)
     db_session.commit()
@@ -0,0 +1,146 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.models.database import Base
+from src.models.job import Job
+from src.models.job_application import JobApplication
+from src.models.user import User
+from src.services import job_service
+from src.services.job_search import search_expression, search_jobs
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all([User(id=1, username="a"), User(id=2, username="b")])
+    db.commit()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+def _job(title, description=None, company="Acme", user_id=1):
+    return Job(
+        title=title,
+        company=company,
+        description=description,
+        application_link=f"https://x.io/{title}",
+        user_id=user_id,
+    )
+
+
+def _titles(db, query, user_id=1):
+    return [hit.job.title for hit in search_jobs(db, user_id, query)]
+
+
+@pytest.mark.parametrize(
+    "query, expression",
+    [
+        ("python developer", '"python" "developer"'),
+        ('"data engineer" remote', '"data engineer" "remote"'),
+        ("pyth*", '"pyth"*'),
+        ("c++ node.js", '"c" "node js"'),
+        ('NEAR( "unbalanced', '"NEAR" "unbalanced"'),
+        ("*** --", ""),
+    ],
+)
+def test_search_expression(query, expression):
+    assert search_expression(query) == expression
+
+
+def test_search_ranks_title_matches_first(db):
+    db.add_all(
+        [
+            _job("Office Manager", "Our team writes Python tools"),
+            _job("Python Developer", "Backend services"),
+            _job("Accountant", "Spreadsheets"),
+        ]
+    )
+    db.commit()
+
+    hits = search_jobs(db, 1, "python")
+
+    assert [hit.job.title for hit in hits] == ["Python Developer", "Office Manager"]
+    assert hits[0].rank < hits[1].rank
+
+
+def test_search_phrase_prefix_and_owner(db):
+    db.add_all(
+        [
+            _job("Senior Data Engineer"),
+            _job("Data Analyst", "Works with an engineer"),
+            _job("Data Engineer", user_id=2),
+        ]
+    )
+    db.commit()
+
+    assert _titles(db, '"data engineer"') == ["Senior Data Engineer"]
+    assert _titles(db, "analy* engin*") == ["Data Analyst"]
+    assert sorted(_titles(db, "engin*")) == ["Data Analyst", "Senior Data Engineer"]
+    assert _titles(db, "engineer", user_id=2) == ["Data Engineer"]
+    assert _titles(db, "***") == []
+
+
+def test_snippet_is_escaped_and_marked(db):
+    db.add(_job("Developer", "Build <script> tags & Python services"))
+    db.commit()
+
+    (hit,) = search_jobs(db, 1, "python")
+
+    assert "&lt;script&gt; tags &amp; <mark>Python</mark> services" in hit.snippet
+
+
+def test_index_follows_inserts_updates_and_deletes(db):
+    job = _job("Rust Developer")
+    db.add(job)
+    db.commit()
+    assert _titles(db, "rust") == ["Rust Developer"]
+
+    job.title = "Go Developer"
+    job.status = "saved"
+    db.commit()
+    assert _titles(db, "rust") == []
+    assert _titles(db, "go") == ["Go Developer"]
+
+    db.delete(job)
+    db.commit()
+    assert _titles(db, "developer") == []
+
+
+def test_index_follows_bulk_upsert(db):
+    posting = {
+        "title": "Kotlin Developer",
+        "company": "Acme",
+        "application_link": "https://x.io/kotlin",
+    }
+    job_service.bulk_upsert_jobs(db, [posting], user_id=1)
+    job_service.bulk_upsert_jobs(
+        db, [{**posting, "description": "Android apps"}], user_id=1
+    )
+
+    assert _titles(db, "kotlin android") == ["Kotlin Developer"]
+
+
+def test_search_falls_back_to_ilike_without_fts5(db, monkeypatch):
+    monkeypatch.setattr(db.get_bind().dialect, "name", "postgresql")
+    db.add_all(
+        [
+            _job("Senior Data Engineer"),
+            _job("Data Analyst", "Works with an engineer"),
+            _job("Data Engineer", user_id=2),
+            _job("Python_Developer"),
+            _job("Python Developer"),
+        ]
+    )
+    db.commit()
+
+    assert _titles(db, '"data engineer"') == ["Senior Data Engineer"]
+    assert _titles(db, "analy* ENGIN*") == ["Data Analyst"]
+    assert _titles(db, "engineer") == ["Data Analyst", "Senior Data Engineer"]
+    assert _titles(db, "python_") == ["Python_Developer"]
+    assert _titles(db, "***") == []
+    (hit,) = search_jobs(db, 2, "engineer")
+    assert hit.snippet is None
@@ -1,9 +1,13 @@
 import pytest
 from unittest.mock import MagicMock
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
 from src.services import job_service
-from src.models.job import Job
+from src.models.database import Base
+from src.models.job import Job, job_fingerprint
+from src.models.job_application import JobApplication
 from src.models.keyword import Keyword
+from src.models.user import User
 
 
 @pytest.fixture
@@ -31,7 +35,7 @@ def test_create_job(mock_db_session):
 
 def test_get_jobs(mock_db_session):
     user_id = 1
-    mock_db_session.query.return_value.filter.return_value.offset.return_value.limit.return_value.all.return_value = [
+    mock_db_session.query.return_value.filter.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [
         Job(id=1, title="Job 1", company="Comp 1", user_id=user_id),
         Job(id=2, title="Job 2", company="Comp 2", user_id=user_id),
     ]
@@ -87,3 +91,105 @@ def test_get_keywords(mock_db_session):
     keywords = job_service.get_keywords(mock_db_session)
     assert len(keywords) == 2
     assert keywords[0].term == "Python"
+
+
+@pytest.fixture
+def sqlite_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(id=1, username="bulk", email="bulk@example.com", password_hash="x"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _scraped_job(link, description="Desc", salary="$100,000 - $120,000"):
+    return {
+        "title": "Engineer",
+        "company": "Acme",
+        "description": description,
+        "application_link": link,
+        "salary": salary,
+        "status": "new",
+    }
+
+
+def test_bulk_upsert_jobs_inserts_all_rows(sqlite_session):
+    jobs = [_scraped_job(f"https://example.com/jobs/{i}") for i in range(1200)]
+
+    stored = job_service.bulk_upsert_jobs(sqlite_session, jobs, user_id=1)
+
+    assert stored == 1200
+    assert sqlite_session.query(Job).filter(Job.user_id == 1).count() == 1200
+
+
+def test_bulk_upsert_jobs_updates_known_postings(sqlite_session):
+    link = "https://example.com/jobs/1"
+    job_service.bulk_upsert_jobs(sqlite_session, [_scraped_job(link)], user_id=1)
+    existing = sqlite_session.query(Job).one()
+    existing.status = "saved"
+    sqlite_session.commit()
+
+    job_service.bulk_upsert_jobs(
+        sqlite_session,
+        [_scraped_job(link, description="Now remote", salary="$150,000")],
+        user_id=1,
+    )
+
+    sqlite_session.expire_all()
+    job = sqlite_session.query(Job).one()
+    assert job.description == "Now remote"
+    assert job.salary == "$150,000"
+    assert job.status == "saved"
+
+
+def test_bulk_upsert_jobs_with_no_rows(sqlite_session):
+    assert job_service.bulk_upsert_jobs(sqlite_session, [], user_id=1) == 0
+
+
+def test_job_fingerprint_ignores_formatting_and_tracking():
+    base = {
+        "title": "Backend Engineer",
+        "company": "Acme",
+        "application_link": "https://www.indeed.com/viewjob?jk=abc123",
+    }
+    variant = {
+        "title": "  backend   ENGINEER ",
+        "company": "ACME",
+        "application_link": "https://indeed.com/viewjob/?utm_source=mail&jk=abc123&from=serp",
+    }
+    other = dict(base, application_link="https://www.indeed.com/viewjob?jk=xyz789")
+
+    assert job_fingerprint(base) == job_fingerprint(variant)
+    assert job_fingerprint(base) != job_fingerprint(other)
+
+
+def test_create_job_sets_fingerprint(sqlite_session):
+    job = job_service.create_job(
+        sqlite_session, _scraped_job("https://example.com/jobs/1"), user_id=1
+    )
+
+    assert job.fingerprint == job_fingerprint(
+        _scraped_job("https://example.com/jobs/1")
+    )
+
+
+def test_insert_new_jobs_skips_known_postings(sqlite_session):
+    first = [_scraped_job(f"https://example.com/jobs/{i}") for i in range(3)]
+    repeat = first + [_scraped_job("https://example.com/jobs/3")]
+
+    assert job_service.insert_new_jobs(sqlite_session, first + first, user_id=1) == 3
+    assert job_service.insert_new_jobs(sqlite_session, repeat, user_id=1) == 1
+    assert job_service.insert_new_jobs(sqlite_session, repeat, user_id=1) == 0
+    assert sqlite_session.query(Job).count() == 4
+
+
+def test_existing_fingerprints_probes_in_batches(sqlite_session):
+    jobs = [_scraped_job(f"https://example.com/jobs/{i}") for i in range(1200)]
+    job_service.insert_new_jobs(sqlite_session, jobs, user_id=1)
+    fingerprints = [job_fingerprint(job) for job in jobs] + ["unknown"]
+
+    found = job_service.existing_fingerprints(sqlite_session, 1, fingerprints)
+
+    assert found == set(fingerprints[:-1])
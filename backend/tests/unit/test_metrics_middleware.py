@@ -0,0 +1,59 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from src.middleware.metrics import UNMATCHED_ENDPOINT, MetricsMiddleware
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _client():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="missing")
+        return {"id": item_id, "name": "x" * 100}
+
+    return TestClient(app)
+
+
+def test_requests_are_labelled_by_route_template():
+    client = _client()
+    labels = {"method": "GET", "endpoint": "/items/{item_id}"}
+    before_ok = _sample("http_requests_total", status_code="200", **labels)
+    before_missing = _sample("http_requests_total", status_code="404", **labels)
+    unmatched = {"method": "GET", "endpoint": UNMATCHED_ENDPOINT, "status_code": "404"}
+    before_unmatched = _sample("http_requests_total", **unmatched)
+
+    for item_id in (1, 2, 3, 0):
+        client.get(f"/items/{item_id}")
+    client.get("/elsewhere/42")
+
+    assert _sample("http_requests_total", status_code="200", **labels) == before_ok + 3
+    assert (
+        _sample("http_requests_total", status_code="404", **labels)
+        == before_missing + 1
+    )
+    assert _sample("http_requests_total", **unmatched) == before_unmatched + 1
+    # No series is created for the concrete path
+    raw = {"method": "GET", "endpoint": "/items/1", "status_code": "200"}
+    assert REGISTRY.get_sample_value("http_requests_total", raw) is None
+
+
+def test_response_size_and_in_flight_gauge():
+    client = _client()
+    labels = {"method": "GET", "endpoint": "/items/{item_id}"}
+    size_before = _sample("http_response_size_bytes_sum", **labels)
+
+    response = client.get("/items/7")
+
+    assert _sample("http_response_size_bytes_sum", **labels) == size_before + len(
+        response.content
+    )
+    # Every request has finished, so none is counted as in flight
+    assert _sample("http_requests_in_progress", method="GET") == 0
@@ -0,0 +1,107 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from src.models.job import job_fingerprint
+from src.models.migrations import MIGRATIONS, current_version, migrate
+
+# The schema as the first release's create_all left it
+LEGACY_SCHEMA = [
+    "CREATE TABLE users (id INTEGER NOT NULL PRIMARY KEY, username VARCHAR,"
+    " password_hash VARCHAR, email VARCHAR)",
+    "CREATE TABLE keywords (id INTEGER NOT NULL PRIMARY KEY, term VARCHAR)",
+    "CREATE TABLE jobs (id INTEGER NOT NULL PRIMARY KEY, title VARCHAR,"
+    " company VARCHAR, description VARCHAR, application_link VARCHAR NOT NULL,"
+    " salary VARCHAR, status VARCHAR, user_id INTEGER REFERENCES users (id))",
+    "CREATE TABLE job_applications (id INTEGER NOT NULL PRIMARY KEY,"
+    " user_id INTEGER REFERENCES users (id), job_title VARCHAR, company VARCHAR,"
+    " application_date DATE, status VARCHAR, job_board VARCHAR, url VARCHAR,"
+    " notes TEXT, keywords VARCHAR)",
+    "CREATE TABLE job_keywords_association (job_id INTEGER NOT NULL,"
+    " keyword_id INTEGER NOT NULL, PRIMARY KEY (job_id, keyword_id))",
+]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    yield engine
+    engine.dispose()
+
+
+def _indexes(engine, table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def test_migrate_builds_fresh_database_and_is_idempotent(engine):
+    latest = MIGRATIONS[-1].version
+
+    assert migrate(engine) == latest
+    assert migrate(engine) == latest
+
+    with engine.connect() as conn:
+        assert current_version(conn) == latest
+        applied = conn.execute(text("SELECT version FROM schema_version")).scalars()
+        assert list(applied) == [m.version for m in MIGRATIONS]
+    assert {
+        "ix_jobs_user_status",
+        "ix_jobs_user_id",
+        "uq_jobs_user_fingerprint",
+    } <= _indexes(engine, "jobs")
+
+
+def test_migrate_upgrades_legacy_database(engine):
+    job = {"title": "Dev", "company": "Acme", "application_link": "https://x.io/1"}
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO users (id, username) VALUES (1, 'a')"))
+        for _ in range(2):  # the same posting, stored twice before dedup
+            conn.execute(
+                text(
+                    "INSERT INTO jobs (title, company, application_link, user_id)"
+                    " VALUES (:title, :company, :application_link, 1)"
+                ),
+                job,
+            )
+        conn.execute(text("INSERT INTO keywords (id, term) VALUES (7, 'Python')"))
+        conn.execute(
+            text(
+                "INSERT INTO job_applications (id, user_id, job_title, keywords)"
+                " VALUES (1, 1, 'Dev', 'Python, SQL,')"
+            )
+        )
+
+    migrate(engine)
+
+    with engine.connect() as conn:
+        fingerprints = conn.execute(
+            text("SELECT fingerprint FROM jobs ORDER BY id")
+        ).scalars()
+        assert list(fingerprints) == [job_fingerprint(job), None]
+        # Jobs stored before the search index existed are searchable
+        matches = conn.execute(
+            text("SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH 'acme'")
+        ).scalars()
+        assert len(list(matches)) == 2
+    assert "user_id" in {c["name"] for c in inspect(engine).get_columns("keywords")}
+    with engine.connect() as conn:
+        linked = conn.execute(
+            text(
+                "SELECT k.id, k.term FROM job_application_keywords a"
+                " JOIN keywords k ON k.id = a.keyword_id"
+                " WHERE a.application_id = 1 ORDER BY k.id"
+            )
+        ).all()
+        assert [tuple(row) for row in linked] == [(7, "Python"), (8, "SQL")]
+    assert "keywords" not in {
+        c["name"] for c in inspect(engine).get_columns("job_applications")
+    }
+    assert "scrape_runs" in inspect(engine).get_table_names()
+    assert {
+        "ix_job_applications_user_status",
+        "ix_job_applications_user_job_board",
+        "ix_job_applications_user_id",
+    } <= _indexes(engine, "job_applications")
+    assert "ix_job_keywords_keyword_job" in _indexes(
+        engine, "job_keywords_association"
+    )
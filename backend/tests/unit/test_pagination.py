@@ -0,0 +1,30 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from src.models.job import Job
+from src.models.job_application import JobApplication
+from src.services.pagination import InvalidCursor, KeysetOrder
+
+
+def test_cursor_round_trips_typed_values():
+    order = KeysetOrder((JobApplication.application_date, JobApplication.id))
+    row = SimpleNamespace(application_date=date(2024, 5, 1), id=42)
+
+    assert order.decode(order.encode(row)) == (date(2024, 5, 1), 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "%%%", "bm90IGpzb24", "WyJhIl0", "WzEsMl0"])
+def test_decode_rejects_foreign_cursors(cursor):
+    with pytest.raises(InvalidCursor):
+        KeysetOrder((Job.id,)).decode(cursor)
+
+
+def test_next_cursor_only_for_full_pages():
+    order = KeysetOrder((Job.id,))
+    rows = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
+
+    assert order.decode(order.next_cursor(rows, limit=2)) == (2,)
+    assert order.next_cursor(rows, limit=3) is None
+    assert order.next_cursor([], limit=2) is None
@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.middleware import rate_limit
+from src.middleware.rate_limit import RateLimiter
+from src.services.password_hasher import HasherBusy, PasswordHasher
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hashes_in_worker_processes():
+    hasher = PasswordHasher(workers=1, max_pending=4)
+
+    async def round_trip():
+        hashed = await hasher.hash("s3cret")
+        return await asyncio.gather(
+            hasher.verify("s3cret", hashed), hasher.verify("wrong", hashed)
+        )
+
+    try:
+        assert asyncio.run(round_trip()) == [True, False]
+    finally:
+        hasher.shutdown()
+    assert hasher.stats() == {"pending": 0, "completed": 3, "rejected": 0}
+
+
+def test_rejects_past_max_pending():
+    hasher = PasswordHasher(workers=0, max_pending=2)
+
+    async def burst():
+        return await asyncio.gather(
+            *(hasher._run(time.sleep, 0.1) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(burst())
+
+    assert [type(r) for r in results] == [type(None), type(None), HasherBusy]
+    assert hasher.stats() == {"pending": 0, "completed": 2, "rejected": 1}
+
+
+def test_rate_limiter_allows_burst_then_refills():
+    clock = FakeClock()
+    limiter = RateLimiter(per_minute=6, burst=2, clock=clock)
+
+    assert limiter.acquire(("a", "/login")) == 0
+    assert limiter.acquire(("a", "/login")) == 0
+    assert limiter.acquire(("a", "/login")) == pytest.approx(10)
+    assert limiter.acquire(("b", "/login")) == 0
+
+    clock.now = 10
+    assert limiter.acquire(("a", "/login")) == 0
+
+
+def test_auth_endpoints_return_429_with_retry_after(monkeypatch):
+    monkeypatch.setattr(
+        rate_limit, "auth_rate_limiter", RateLimiter(per_minute=1, burst=1)
+    )
+    client = TestClient(app)
+    # Invalid bodies still pass through the limiter, without touching the database
+    first = client.post("/api/auth/login", json={})
+    second = client.post("/api/auth/login", json={})
+
+    assert first.status_code == 422
+    assert second.status_code == 429
+    assert second.headers["Retry-After"] == "60"
+    assert client.post("/api/auth/register", json={}).status_code == 422
@@ -0,0 +1,119 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.api.auth import create_access_token
+from src.main import app
+from src.models.database import Base, get_async_db
+from src.models.job_application import JobApplication
+from src.models.user import User
+from src.services.principal_cache import PrincipalCache, principal_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    db.add(User(id=1, username="alice", email="a@example.com", password_hash="x"))
+    db.commit()
+    db.close()
+    principal_cache.clear()
+    yield factory
+    principal_cache.clear()
+    engine.dispose()
+
+
+def _alice(id=1):
+    return User(id=id, username="alice", email="a@example.com", password_hash="x")
+
+
+def test_entries_expire_and_are_bounded():
+    clock = FakeClock()
+    cache = PrincipalCache(ttl_seconds=60, max_entries=2, clock=clock)
+    cache.put("alice", _alice())
+
+    cached = cache.get("alice")
+    assert (cached.id, cached.username, cached.email) == (1, "alice", "a@example.com")
+    assert cached.password_hash is None
+    assert cached is not cache.get("alice")
+
+    cache.put("bob", _alice(2))
+    cache.put("carol", _alice(3))
+    assert cache.get("bob") is not None
+    clock.now = 61
+    assert cache.get("bob") is None
+    assert cache.stats() == {"hits": 3, "misses": 1, "entries": 1}
+
+
+def test_disabled_cache_stores_nothing():
+    cache = PrincipalCache(ttl_seconds=0)
+    cache.put("alice", _alice())
+    assert cache.get("alice") is None
+
+
+def test_committed_user_changes_invalidate(session_factory):
+    db = session_factory()
+    user = db.get(User, 1)
+    principal_cache.put("alice", user)
+
+    user.username = "alicia"
+    db.flush()
+    db.rollback()
+    assert principal_cache.get("alice") is not None
+
+    user = db.get(User, 1)
+    user.email = "new@example.com"
+    db.commit()
+    assert principal_cache.get("alice") is None
+
+    principal_cache.put("alice", user)
+    db.delete(db.get(User, 1))
+    db.commit()
+    assert principal_cache.get("alice") is None
+    db.close()
+
+
+def test_authenticated_requests_resolve_identity_once(tmp_path, session_factory):
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'app.db'}", poolclass=NullPool
+    )
+    identity_queries = []
+    event.listen(
+        async_engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: "FROM users" in statement
+        and identity_queries.append(statement),
+    )
+    factory = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'alice'})}"}
+    hits = principal_cache.stats()["hits"]
+    try:
+        with TestClient(app) as client:
+            for _ in range(3):
+                response = client.get("/api/jobs/", headers=headers)
+                assert response.status_code == 200
+    finally:
+        app.dependency_overrides.clear()
+
+    # jobs routes declare get_current_user on the router and in each handler
+    assert len(identity_queries) == 1
+    assert principal_cache.stats()["hits"] - hits == 2
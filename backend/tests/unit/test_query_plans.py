@@ -0,0 +1,110 @@
+"""
+EXPLAIN QUERY PLAN regression checks for the hot queries.
+
+The queries are captured from the services as they run against a migrated
+database, then explained with their real parameters. A plan step that
+scans a whole table, or sorts rows an index could return in order, fails
+the test, so a dropped index or a rewritten query that no longer uses one
+is caught here rather than in production.
+"""
+
+import re
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.models.job import Job
+from src.models.job_application import JobApplication
+from src.models.keyword import Keyword
+from src.models.migrations import migrate
+from src.services import job_service
+from src.services.application_service import APPLICATION_ORDER, ApplicationService
+from src.services.keyword_service import KeywordService
+
+# "SCAN jobs" reads every row; "SEARCH jobs USING INDEX ..." does not
+_FULL_SCAN = re.compile(r"^SCAN (TABLE )?(\w+)$")
+# Pages must come off the index in order, not be collected and sorted
+_SORT = re.compile(r"USE TEMP B-TREE FOR ORDER BY")
+
+application_service = ApplicationService()
+keyword_service = KeywordService()
+
+HOT_QUERIES = {
+    "jobs list": lambda db: job_service.get_jobs(db, 1),
+    "jobs page after cursor": lambda db: job_service.get_jobs(
+        db, 1, cursor=job_service.JOB_ORDER.encode(Job(id=50))
+    ),
+    "job by id": lambda db: job_service.get_job(db, 1, 1),
+    "jobs by status": lambda db: db.query(Job)
+    .filter(Job.user_id == 1, Job.status == "saved")
+    .all(),
+    "known fingerprints": lambda db: job_service.existing_fingerprints(
+        db, 1, ["a" * 40]
+    ),
+    "applications list": lambda db: application_service.get_applications(db, 1),
+    "applications by status": lambda db: application_service.get_applications(
+        db, 1, status="applied"
+    ),
+    "applications by board": lambda db: application_service.get_applications(
+        db, 1, job_board="LinkedIn"
+    ),
+    "applications by keyword": lambda db: application_service.get_applications(
+        db, 1, keyword_terms=["python"]
+    ),
+    "applications page after cursor": lambda db: application_service.get_applications(
+        db, 1, status="applied", cursor=APPLICATION_ORDER.encode(JobApplication(id=50))
+    ),
+    "application by id": lambda db: application_service.get_application(db, 1, 1),
+    "keywords list": lambda db: keyword_service.get_keywords(db, 1),
+    "keyword by term": lambda db: keyword_service.get_keyword_by_term(db, "python"),
+    "jobs for keyword": lambda db: db.get(Keyword, 1).jobs,
+}
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'app.db'}")
+    migrate(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO users (id, username) VALUES (1, 'a')")
+        conn.exec_driver_sql(
+            "INSERT INTO keywords (id, term, user_id) VALUES (1, 'python', 1)"
+        )
+    yield engine
+    engine.dispose()
+
+
+def _captured_statements(engine, run):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    db = sessionmaker(bind=engine)()
+    try:
+        run(db)
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", capture)
+    return statements
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_query_uses_an_index(engine, name):
+    statements = _captured_statements(engine, HOT_QUERIES[name])
+    assert statements
+
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).all()
+            scans = [
+                row[-1]
+                for row in plan
+                if _FULL_SCAN.match(row[-1]) or _SORT.match(row[-1])
+            ]
+            assert not scans, f"{name}: {scans}\n{statement}"
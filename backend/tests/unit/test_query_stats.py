@@ -0,0 +1,89 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from src.middleware.query_stats import QueryStatsMiddleware, track_queries
+
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def _client(engine, records):
+    logger = logging.getLogger("test.query_stats")
+    logger.propagate = False
+    logger.handlers = [records]
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, logger=logger, repeat_threshold=3)
+
+    @app.get("/items/{count}")
+    def items(count: int):
+        # One lookup per item, the N+1 shape
+        with engine.connect() as conn:
+            select = text("SELECT :i")
+            return [conn.execute(select, {"i": i}).scalar() for i in range(count)]
+
+    return TestClient(app)
+
+
+def test_requests_report_their_queries(engine):
+    records = _Records()
+    client = _client(engine, records)
+    labels = {"method": "GET", "endpoint": "/items/{count}"}
+    observed = REGISTRY.get_sample_value("http_request_db_queries_sum", labels) or 0
+
+    response = client.get("/items/2")
+
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert response.headers["Server-Timing"].endswith('desc="2 queries"')
+    assert (
+        REGISTRY.get_sample_value("http_request_db_queries_sum", labels)
+        == observed + 2
+    )
+    assert records.records == []
+
+
+def test_repeated_statements_are_logged(engine):
+    records = _Records()
+    client = _client(engine, records)
+
+    client.get("/items/4")
+
+    (record,) = records.records
+    assert record.getMessage() == "Repeated query"
+    assert (record.count, record.statement) == (4, "SELECT ?")
+
+
+def test_queries_outside_a_request_are_not_counted(engine):
+    with track_queries() as stats:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 2"))
+
+    assert stats.count == 1
+    assert stats.seconds > 0
+
+
+def test_query_budget_fails_with_the_statements(engine, query_budget):
+    with pytest.raises(pytest.fail.Exception, match=r"3 SQL statements, budget 2"):
+        with query_budget(2):
+            with engine.connect() as conn:
+                for i in range(3):
+                    conn.execute(text("SELECT :i"), {"i": i})
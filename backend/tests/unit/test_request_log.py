@@ -0,0 +1,84 @@
+import logging
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.middleware.request_log import LogQueue, RequestLogMiddleware
+
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _client(sample_rate, slow_seconds=1.0):
+    logger = logging.getLogger("test.request_log")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.handlers = [records := _Records()]
+    app = FastAPI()
+    app.add_middleware(
+        RequestLogMiddleware,
+        logger=logger,
+        sample_rate=sample_rate,
+        slow_seconds=slow_seconds,
+        sample=lambda: 0.5,
+    )
+
+    @app.get("/ok")
+    def ok():
+        return {"ok": True}
+
+    @app.get("/fail")
+    def fail():
+        raise HTTPException(status_code=404, detail="missing")
+
+    return TestClient(app), records.records
+
+
+def test_successes_are_sampled_and_failures_always_logged():
+    client, records = _client(sample_rate=0.1)
+
+    response = client.get("/ok")
+    client.get("/fail")
+
+    assert float(response.headers["X-Process-Time"]) >= 0
+    assert [(r.url, r.status_code) for r in records] == [
+        ("http://testserver/fail", 404)
+    ]
+
+    client, records = _client(sample_rate=0.9)
+    client.get("/ok?page=2")
+    assert records[0].method == "GET"
+    assert records[0].url == "http://testserver/ok?page=2"
+    assert records[0].process_time.endswith("s")
+
+
+def test_slow_requests_are_always_logged():
+    client, records = _client(sample_rate=0.0, slow_seconds=0.0)
+
+    client.get("/ok")
+
+    assert [r.status_code for r in records] == [200]
+
+
+def test_log_queue_writes_in_background_and_drops_when_full():
+    sink = _Records()
+    log_queue = LogQueue([sink], maxsize=2)
+    logger = logging.getLogger("test.log_queue")
+    logger.propagate = False
+    logger.handlers = [log_queue.handler]
+
+    # Not started yet, so the queue fills and the third record is dropped
+    for i in range(3):
+        logger.warning("record %d", i)
+    assert log_queue.dropped == 1
+
+    log_queue.start()
+    log_queue.stop()
+
+    assert [r.getMessage() for r in sink.records] == ["record 0", "record 1"]
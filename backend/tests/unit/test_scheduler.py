@@ -0,0 +1,246 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.models.database import Base
+from src.models.scrape_run import ScrapeRun
+from src.models.user import User
+from src.services.scheduler import ScrapeScheduler, last_run
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = factory()
+    db.add(User(username="scraper", email="scraper@example.com", password_hash="x"))
+    db.commit()
+    db.close()
+    yield factory
+    Base.metadata.drop_all(bind=engine)
+
+
+def test_run_once_records_successful_run(session_factory, monkeypatch):
+    monkeypatch.setenv("JOB_KEYWORDS", "Python")
+
+    async def fake_scrape(db, user_id):
+        return 7
+
+    scheduler = ScrapeScheduler(session_factory=session_factory, interval_minutes=60)
+    with patch("src.services.scheduler.scrape_all_jobs_async", fake_scrape):
+        run = asyncio.run(scheduler.run_once())
+
+    assert run.status == "succeeded"
+    assert run.jobs_stored == 7
+    assert run.finished_at is not None
+    db = session_factory()
+    assert last_run(db).id == run.id
+    db.close()
+
+
+def test_run_once_records_failure(session_factory, monkeypatch):
+    monkeypatch.setenv("JOB_KEYWORDS", "Python")
+
+    async def failing_scrape(db, user_id):
+        raise RuntimeError("board unreachable")
+
+    scheduler = ScrapeScheduler(session_factory=session_factory)
+    with patch("src.services.scheduler.scrape_all_jobs_async", failing_scrape):
+        run = asyncio.run(scheduler.run_once())
+
+    assert run.status == "failed"
+    assert run.error == "board unreachable"
+
+
+def test_run_once_skips_without_keywords(session_factory, monkeypatch):
+    monkeypatch.delenv("JOB_KEYWORDS", raising=False)
+    scheduler = ScrapeScheduler(session_factory=session_factory)
+
+    run = asyncio.run(scheduler.run_once())
+
+    assert run.status == "skipped"
+
+
+def test_start_does_not_wait_for_scrape(session_factory, monkeypatch):
+    monkeypatch.setenv("JOB_KEYWORDS", "Python")
+    scrape_started = None
+
+    async def slow_scrape(db, user_id):
+        scrape_started.set()
+        await asyncio.sleep(60)
+
+    async def scenario():
+        nonlocal scrape_started
+        scrape_started = asyncio.Event()
+        scheduler = ScrapeScheduler(
+            session_factory=session_factory, interval_minutes=60, run_on_startup=True
+        )
+        start = time.perf_counter()
+        scheduler.start()
+        elapsed = time.perf_counter() - start
+        await asyncio.wait_for(scrape_started.wait(), timeout=5)
+        assert scheduler.running
+        await scheduler.stop()
+        return elapsed
+
+    with patch("src.services.scheduler.scrape_all_jobs_async", slow_scrape):
+        elapsed = asyncio.run(scenario())
+
+    assert elapsed < 0.1
+
+
+def test_next_run_follows_persisted_last_run(session_factory):
+    finished = datetime.utcnow() - timedelta(minutes=10)
+    db = session_factory()
+    db.add(
+        ScrapeRun(
+            started_at=finished - timedelta(minutes=1),
+            finished_at=finished,
+            status="succeeded",
+            jobs_stored=3,
+        )
+    )
+    db.commit()
+    db.close()
+
+    async def scenario():
+        scheduler = ScrapeScheduler(
+            session_factory=session_factory, interval_minutes=60, run_on_startup=False
+        )
+        scheduler.start()
+        while scheduler.next_run_at is None:
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+        return scheduler.next_run_at
+
+    assert asyncio.run(scenario()) == finished + timedelta(minutes=60)
+
+
+def test_status_reports_last_run(session_factory):
+    db = session_factory()
+    db.add(ScrapeRun(status="succeeded", jobs_stored=4, finished_at=datetime.utcnow()))
+    db.commit()
+
+    status = ScrapeScheduler(session_factory=session_factory).status(db)
+    db.close()
+
+    assert status["running"] is False
+    assert status["last_run"].jobs_stored == 4
+
+
+def test_loop_survives_failed_run(session_factory, monkeypatch):
+    monkeypatch.setenv("JOB_KEYWORDS", "Python")
+    begin_run = ScrapeScheduler._begin_run
+    calls = 0
+    scraped = None
+
+    def flaky_begin_run(self, db):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("database is locked")
+        return begin_run(self, db)
+
+    async def fake_scrape(db, user_id):
+        scraped.set()
+        return 1
+
+    async def scenario():
+        nonlocal scraped
+        scraped = asyncio.Event()
+        scheduler = ScrapeScheduler(
+            session_factory=session_factory, interval_minutes=60, run_on_startup=True
+        )
+        scheduler.start()
+        while calls < 1:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        assert not scheduler._task.done()
+        scheduler.trigger()
+        await asyncio.wait_for(scraped.wait(), timeout=5)
+        await scheduler.stop()
+
+    with patch.object(ScrapeScheduler, "_begin_run", flaky_begin_run), patch(
+        "src.services.scheduler.scrape_all_jobs_async", fake_scrape
+    ):
+        asyncio.run(scenario())
+
+    assert calls == 2
+
+
+def test_cancelled_run_is_marked_failed(session_factory, monkeypatch):
+    monkeypatch.setenv("JOB_KEYWORDS", "Python")
+    scrape_started = None
+
+    async def slow_scrape(db, user_id):
+        scrape_started.set()
+        await asyncio.sleep(60)
+
+    async def scenario():
+        nonlocal scrape_started
+        scrape_started = asyncio.Event()
+        scheduler = ScrapeScheduler(
+            session_factory=session_factory, interval_minutes=60, run_on_startup=True
+        )
+        scheduler.start()
+        await asyncio.wait_for(scrape_started.wait(), timeout=5)
+        await scheduler.stop()
+
+    with patch("src.services.scheduler.scrape_all_jobs_async", slow_scrape):
+        asyncio.run(scenario())
+
+    db = session_factory()
+    run = last_run(db)
+    db.close()
+    assert run.status == "failed"
+    assert run.error == "cancelled"
+    assert run.finished_at is not None
+
+
+def test_stop_waits_for_a_commit_in_progress(session_factory, monkeypatch):
+    monkeypatch.setenv("JOB_KEYWORDS", "Python")
+    commit_run = ScrapeScheduler._commit_run
+    committing = threading.Event()
+    release = threading.Event()
+
+    def slow_commit(self, db, run):
+        if run.status == "succeeded":
+            committing.set()
+            release.wait(5)
+        commit_run(self, db, run)
+
+    async def fake_scrape(db, user_id):
+        return 3
+
+    async def scenario():
+        scheduler = ScrapeScheduler(
+            session_factory=session_factory, interval_minutes=60, run_on_startup=True
+        )
+        scheduler.start()
+        await asyncio.to_thread(committing.wait, 5)
+        # The commit is still using the session when the cancel lands
+        asyncio.get_running_loop().call_later(0.05, release.set)
+        await asyncio.wait_for(scheduler.stop(), timeout=5)
+
+    with patch.object(ScrapeScheduler, "_commit_run", slow_commit), patch(
+        "src.services.scheduler.scrape_all_jobs_async", fake_scrape
+    ):
+        asyncio.run(scenario())
+
+    db = session_factory()
+    run = last_run(db)
+    db.close()
+    assert (run.status, run.error) == ("succeeded", None)
+    assert run.jobs_stored == 3
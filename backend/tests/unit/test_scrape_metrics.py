@@ -0,0 +1,48 @@
+import json
+import re
+from pathlib import Path
+
+from prometheus_client import REGISTRY
+
+from src.services import scrape_metrics
+
+DASHBOARD = Path(__file__).parents[3] / "monitoring" / "grafana" / "scraper-dashboard.json"
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_collected_observations_are_recorded_on_replay():
+    labels = {"board": "Dice", "keyword": "collect-test"}
+    before = _sample("scraper_cards_found_total", **labels)
+
+    with scrape_metrics.collect() as observations:
+        scrape_metrics.observe("cards_found", 4, **labels)
+        scrape_metrics.observe("parse_seconds", 0.25, **labels)
+    assert _sample("scraper_cards_found_total", **labels) == before
+
+    scrape_metrics.replay(observations)
+
+    assert _sample("scraper_cards_found_total", **labels) == before + 4
+    assert _sample("scraper_parse_duration_seconds_sum", **labels) == 0.25
+
+
+def test_dashboard_only_queries_exported_metrics():
+    dashboard = json.loads(DASHBOARD.read_text())
+    suffixes = {"counter": ["_total"], "histogram": ["_bucket", "_sum", "_count"]}
+    exported = {
+        metric.name + suffix
+        for metric in REGISTRY.collect()
+        if metric.name.startswith("scraper_")
+        for suffix in suffixes[metric.type]
+    }
+    queried = {
+        name
+        for panel in dashboard["panels"]
+        for target in panel["targets"]
+        for name in re.findall(r"\bscraper_\w+", target["expr"])
+    }
+
+    assert queried
+    assert queried <= exported
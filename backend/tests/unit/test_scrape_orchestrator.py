@@ -0,0 +1,206 @@
+import asyncio
+import dataclasses
+import time
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from src.services.scrape_orchestrator import BOARDS, HostThrottle, scrape_boards
+
+CARD_PAGE = b"""
+<html><body>
+<div class="base-card"><h3 class="base-search-card__title">Backend Engineer</h3>
+<h4 class="base-search-card__subtitle">Acme</h4></div>
+<div class="base-card"><h3 class="base-search-card__title">Data Engineer</h3>
+<h4 class="base-search-card__subtitle">Globex</h4></div>
+<div class="base-card"><h3 class="base-search-card__title">Platform Engineer</h3>
+<h4 class="base-search-card__subtitle">Initech</h4></div>
+</body></html>
+"""
+
+
+def _stub_boards(delay=(0, 0)):
+    return [dataclasses.replace(spec, politeness_delay=delay) for spec in BOARDS]
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_scrape_boards_returns_jobs_per_board():
+    requested_hosts = []
+
+    def handler(request):
+        requested_hosts.append(request.url.host)
+        return httpx.Response(200, content=CARD_PAGE)
+
+    async def scrape():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await scrape_boards(
+                ["Python"], boards=_stub_boards(), client=client
+            )
+
+    results = _run(scrape())
+
+    assert list(results) == ["LinkedIn", "Indeed", "Dice"]
+    assert all(results[name] for name in results)
+    assert all("Python" in job["title"] for jobs in results.values() for job in jobs)
+    assert {"www.linkedin.com", "www.indeed.com", "www.dice.com"} <= set(
+        requested_hosts
+    )
+
+
+def test_linkedin_cards_are_parsed_without_fallback():
+    def handler(request):
+        return httpx.Response(200, content=CARD_PAGE)
+
+    async def scrape():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await scrape_boards(
+                ["Python"], boards=_stub_boards()[:1], client=client
+            )
+
+    jobs = _run(scrape())["LinkedIn"]
+
+    companies = {job["company"] for job in jobs}
+    assert {"Acme", "Globex", "Initech"} <= companies
+    assert len(jobs) == 6  # three cards on each of the two pages
+
+
+def test_http_errors_and_network_failures_use_board_fallbacks():
+    def handler(request):
+        if request.url.host == "www.linkedin.com":
+            return httpx.Response(403)
+        raise httpx.ConnectError("boom", request=request)
+
+    async def scrape():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await scrape_boards(["Go"], boards=_stub_boards(), client=client)
+
+    results = _run(scrape())
+
+    assert all("(Fallback" in job["title"] for job in results["LinkedIn"])
+    assert all("(Offline" in job["title"] for job in results["Indeed"])
+    assert all("(Offline" in job["title"] for job in results["Dice"])
+
+
+def test_host_throttle_caps_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, content=CARD_PAGE)
+
+    async def scrape():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await scrape_boards(
+                ["a", "b", "c", "d"],
+                boards=_stub_boards()[:1],
+                client=client,
+                max_concurrency_per_host=2,
+            )
+
+    _run(scrape())
+
+    assert peak == 2
+
+
+def test_host_throttle_spaces_request_starts():
+    async def measure():
+        throttle = HostThrottle(max_concurrency=5, delay=(0.05, 0.05))
+        starts = []
+
+        async def request():
+            async with throttle.slot():
+                starts.append(time.monotonic())
+
+        await asyncio.gather(*(request() for _ in range(3)))
+        return starts
+
+    starts = _run(measure())
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+
+
+def test_api_results_skip_web_scraping():
+    api_jobs = [{"title": "API Job - Rust", "company": "Acme", "status": "new"}]
+    spec = dataclasses.replace(
+        BOARDS[0], politeness_delay=(0, 0), api_scraper=lambda keywords, limit: api_jobs
+    )
+
+    def handler(request):
+        pytest.fail("web scraping should not run when the API returns jobs")
+
+    async def scrape():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await scrape_boards(["Rust"], boards=[spec], client=client)
+
+    assert _run(scrape()) == {"LinkedIn": api_jobs}
+
+
+def test_parse_workers_parse_pages_in_worker_processes():
+    def misses():
+        return (
+            REGISTRY.get_sample_value(
+                "scraper_json_ld_pages_total", {"board": "LinkedIn", "result": "miss"}
+            )
+            or 0
+        )
+
+    def handler(request):
+        return httpx.Response(200, content=CARD_PAGE)
+
+    async def scrape():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await scrape_boards(
+                ["Python"], boards=_stub_boards()[:1], client=client, parse_workers=2
+            )
+
+    labels = {"board": "LinkedIn", "keyword": "Python"}
+    before = misses()
+    cards_before = _sample("scraper_cards_found_total", **labels)
+    jobs = _run(scrape())["LinkedIn"]
+
+    assert {"Acme", "Globex", "Initech"} <= {job["company"] for job in jobs}
+    assert len(jobs) == 6
+    # Outcomes counted in the workers are replayed in this process
+    assert misses() == before + 2
+    assert _sample("scraper_cards_found_total", **labels) == cards_before + 6
+
+
+def test_scrape_records_metrics_per_board_and_keyword():
+    def handler(request):
+        if "start=25" in str(request.url):
+            return httpx.Response(403)
+        # Streamed like a network body, so the client counts the bytes it reads
+        return httpx.Response(200, stream=httpx.ByteStream(CARD_PAGE))
+
+    async def scrape():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await scrape_boards(
+                ["Metrics"], boards=_stub_boards()[:1], client=client
+            )
+
+    labels = {"board": "LinkedIn", "keyword": "Metrics"}
+    _run(scrape())
+
+    assert _sample("scraper_fetch_duration_seconds_count", **labels) == 2
+    assert _sample("scraper_downloaded_bytes_total", **labels) == len(CARD_PAGE)
+    assert _sample("scraper_http_responses_total", status_code="200", **labels) == 1
+    assert _sample("scraper_http_responses_total", status_code="403", **labels) == 1
+    assert _sample("scraper_politeness_sleep_seconds_count", **labels) == 2
+    assert _sample("scraper_parse_duration_seconds_count", **labels) == 1
+    assert _sample("scraper_cards_found_total", **labels) == 3
+    assert _sample("scraper_cards_extracted_total", **labels) == 3
+    assert _sample("scraper_fallback_jobs_total", reason="http_error", **labels) > 0
@@ -1,5 +1,12 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.models.database import Base
+from src.models.job import Job
+from src.models.job_application import JobApplication
+from src.models.user import User
 from src.services.scraper_linkedin import scrape_linkedin_jobs
 from src.services.scraper_indeed import scrape_indeed_jobs
 from src.services.scraper_dice import scrape_dice_jobs
@@ -7,7 +14,7 @@ from src.services.scraper import scrape_all_jobs, get_job_keywords
 import os
 
 
-# Mock response for requests.get
+# Mock response for requests.Session.get
 class MockResponse:
     def __init__(self, text, status_code):
         self.text = text
@@ -18,7 +25,7 @@ class MockResponse:
         return self.text.encode("utf-8")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_scrape_linkedin_jobs(mock_get):
     mock_get.return_value = MockResponse(
         '<html><body><div class="base-card"><h3>Software Engineer</h3><p>LinkedIn</p></div></body></html>',
@@ -32,7 +39,7 @@ def test_scrape_linkedin_jobs(mock_get):
     assert all("application_link" in job and job["application_link"].startswith("https://") for job in jobs)
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_scrape_indeed_jobs(mock_get):
     mock_get.return_value = MockResponse(
         '<html><body><div class="jobsearch-SerpJobCard"><h3>Data Scientist</h3><p>Indeed</p></div></body></html>',
@@ -46,7 +53,7 @@ def test_scrape_indeed_jobs(mock_get):
     assert all("application_link" in job and job["application_link"].startswith("https://") for job in jobs)
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_scrape_dice_jobs(mock_get):
     mock_get.return_value = MockResponse(
         '<html><body><div class="card-content"><h3>DevOps Engineer</h3><p>Dice</p></div></body></html>',
@@ -68,66 +75,80 @@ def test_get_job_keywords():
 
 
 def test_scrape_all_jobs_deduplication():
-    with patch("src.services.scraper.scrape_linkedin_jobs") as mock_linkedin:
-        with patch("src.services.scraper.scrape_indeed_jobs") as mock_indeed:
-            with patch("src.services.scraper.scrape_dice_jobs") as mock_dice:
-                with patch("src.services.job_service.create_job") as mock_create_job:
-
-                    mock_linkedin.return_value = [
-                        {
-                            "title": "Job A",
-                            "company": "Company X",
-                            "description": "",
-                            "application_link": "",
-                            "salary": "",
-                            "status": "new",
-                        }
-                    ]
-                    mock_indeed.return_value = [
-                        {
-                            "title": "Job A",
-                            "company": "Company X",
-                            "description": "",
-                            "application_link": "",
-                            "salary": "",
-                            "status": "new",
-                        },
-                        {
-                            "title": "Job B",
-                            "company": "Company Y",
-                            "description": "",
-                            "application_link": "",
-                            "salary": "",
-                            "status": "new",
-                        },
-                    ]
-                    mock_dice.return_value = [
-                        {
-                            "title": "Job A",
-                            "company": "Company X",
-                            "description": "",
-                            "application_link": "",
-                            "salary": "",
-                            "status": "new",
-                        },
-                        {
-                            "title": "Job C",
-                            "company": "Company Z",
-                            "description": "",
-                            "application_link": "",
-                            "salary": "",
-                            "status": "new",
-                        },
-                    ]
-
-                    os.environ["JOB_KEYWORDS"] = "test"
-                    # Pass dummy db and user_id, as create_job is mocked
-                    scrape_all_jobs(db=None, user_id=1)
-                    del os.environ["JOB_KEYWORDS"]
-
-                    # Assert that create_job was called for each unique job
-                    assert mock_create_job.call_count == 3
-                    # Further assertions can be made on the arguments passed to mock_create_job
+    # Jobs are stored from a worker thread, so share one in-memory connection
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add(User(id=1, username="scraper", email="scraper@example.com", password_hash="x"))
+    db.commit()
+
+    with patch("src.services.scraper.scrape_boards", new_callable=AsyncMock) as mock_boards:
+
+        mock_boards.return_value = {
+            "LinkedIn": [
+                {
+                    "title": "Job A",
+                    "company": "Company X",
+                    "description": "",
+                    "application_link": "",
+                    "salary": "",
+                    "status": "new",
+                }
+            ],
+            "Indeed": [
+                {
+                    "title": "Job A",
+                    "company": "Company X",
+                    "description": "",
+                    "application_link": "",
+                    "salary": "",
+                    "status": "new",
+                },
+                {
+                    "title": "Job B",
+                    "company": "Company Y",
+                    "description": "",
+                    "application_link": "",
+                    "salary": "",
+                    "status": "new",
+                },
+            ],
+            "Dice": [
+                {
+                    "title": "Job A",
+                    "company": "Company X",
+                    "description": "",
+                    "application_link": "",
+                    "salary": "",
+                    "status": "new",
+                },
+                {
+                    "title": "Job C",
+                    "company": "Company Z",
+                    "description": "",
+                    "application_link": "",
+                    "salary": "",
+                    "status": "new",
+                },
+            ],
+        }
+
+        os.environ["JOB_KEYWORDS"] = "test"
+        first_run = scrape_all_jobs(db=db, user_id=1)
+        # A repeat scrape of the same postings must not grow the jobs table
+        second_run = scrape_all_jobs(db=db, user_id=1)
+        del os.environ["JOB_KEYWORDS"]
+
+    assert mock_boards.await_args.args == (["test"],)
+    assert first_run == 3
+    assert second_run == 0
+    titles = sorted(title for (title,) in db.query(Job.title))
+    assert titles == ["Job A", "Job B", "Job C"]
+    db.close()
 
 
 def test_multiple_jobs_per_keyword():
@@ -155,3 +176,70 @@ def test_multiple_jobs_per_keyword():
     assert total_jobs >= 9, f"Total jobs should be much higher than old 3-job limit, got {total_jobs}"
     
     print(f"SUCCESS: Generated {total_jobs} jobs for 1 keyword (vs 3 in old system)")
+
+
+def test_repeat_scrape_of_synthetic_jobs_writes_nothing(caplog):
+    import dataclasses
+    import httpx
+    from src.services import scrape_orchestrator
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add(User(id=1, username="scraper", email="scraper@example.com", password_hash="x"))
+    db.commit()
+
+    # Dice serves one card, whose link is made up and which is topped up with
+    # fallback jobs; LinkedIn and Indeed fail and get their fallback jobs
+    dice_page = b'<div class="card job"><h5 class="job-title">SRE</h5></div>'
+
+    def handler(request):
+        if request.url.host == "www.dice.com":
+            return httpx.Response(200, content=dice_page)
+        if request.url.host == "www.linkedin.com":
+            return httpx.Response(403)
+        raise httpx.ConnectError("boom", request=request)
+
+    boards = [
+        dataclasses.replace(spec, politeness_delay=(0, 0))
+        for spec in scrape_orchestrator.BOARDS
+    ]
+
+    async def scrape_boards(keywords, **kwargs):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await scrape_orchestrator.scrape_boards(
+                keywords, boards=boards, client=client, parse_workers=0
+            )
+
+    with patch("src.services.scraper.scrape_boards", scrape_boards), patch(
+        "src.services.scraper.get_http_cache", return_value=None
+    ), patch.dict(os.environ, {"JOB_KEYWORDS": "Python"}), caplog.at_level(
+        "INFO", logger="src.services.scraper"
+    ):
+        first_run = scrape_all_jobs(db=db, user_id=1)
+        second_run = scrape_all_jobs(db=db, user_id=1)
+
+    assert first_run > 0
+    assert second_run == 0
+    assert db.query(Job).count() == first_run
+    (stats, _) = [r for r in caplog.records if r.message == "Scrape HTTP connections"]
+    assert {"requests", "connections", "reused"} <= vars(stats).keys()
+    db.close()
+
+
+def test_synthetic_fields_are_the_same_on_every_parse():
+    from src.services import scraper_dice
+
+    page = (
+        b'<div class="card job"><h5 class="job-title">SRE</h5>'
+        b'<span class="salary">Competitive</span></div>'
+    )
+
+    first = scraper_dice.parse_search_page(page, "Python")
+    second = scraper_dice.parse_search_page(page, "Python")
+
+    assert first and first == second
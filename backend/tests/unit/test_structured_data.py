@@ -0,0 +1,117 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from src.services import scraper_dice, scraper_indeed, scraper_linkedin
+from src.services.structured_data import (
+    extract_job_postings,
+    find_job_postings,
+    posting_fields,
+)
+
+POSTING = """{
+  "@context": "https://schema.org",
+  "@type": "JobPosting",
+  "title": "Site Reliability Engineer",
+  "description": "<p>Keep &amp; scale   our <b>platform</b></p>",
+  "url": "https://example.com/jobs/42",
+  "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+  "jobLocation": [{"address": {"addressLocality": "Austin", "addressRegion": "TX"}}],
+  "baseSalary": {"value": {"minValue": 120000, "maxValue": "150000.00"}}
+}"""
+
+# One card that the LinkedIn, Indeed and Dice selectors all recognise
+CARD = (
+    '<div class="base-card job-card search-card result">'
+    '<h3 class="base-search-card__title job-title">DOM Title</h3>'
+    '<span class="jobTitle">DOM Title</span></div>'
+)
+CARDS = CARD * 3
+
+
+def _page(*blocks, body=""):
+    scripts = "".join(
+        f'<script type="application/ld+json">{block}</script>' for block in blocks
+    )
+    return f"<html><head>{scripts}</head><body>{body}</body></html>".encode()
+
+
+def _pages(board, result):
+    return (
+        REGISTRY.get_sample_value(
+            "scraper_json_ld_pages_total", {"board": board, "result": result}
+        )
+        or 0
+    )
+
+
+def test_finds_postings_in_lists_graphs_and_typed_lists():
+    page = _page(
+        POSTING,
+        '[{"@type": "Organization"}, {"@type": ["JobPosting"], "title": "A"}]',
+        '{"@graph": [{"@type": "JobPosting", "title": "B"}]}',
+        "{not json",
+    )
+
+    titles = [posting["title"] for posting in find_job_postings(page)]
+
+    assert titles == ["Site Reliability Engineer", "A", "B"]
+
+
+def test_ignores_other_scripts():
+    page = b'<script>var x = {"@type": "JobPosting"};</script><script type="text/json">{}</script>'
+
+    assert find_job_postings(page) == []
+
+
+def test_posting_fields_are_normalized():
+    fields = posting_fields(find_job_postings(_page(POSTING))[0])
+
+    assert fields == {
+        "title": "Site Reliability Engineer",
+        "company": "Acme",
+        "description": "Keep & scale our platform",
+        "url": "https://example.com/jobs/42",
+        "location": "Austin, TX",
+        "salary": "$120,000 - $150,000",
+    }
+
+
+def test_missing_fields_are_none():
+    fields = posting_fields({"@type": "JobPosting", "url": "/relative"})
+
+    assert set(fields.values()) == {None}
+
+
+def test_hits_and_misses_are_counted_per_board():
+    hits, misses = _pages("Dice", "hit"), _pages("Dice", "miss")
+
+    extract_job_postings(_page(POSTING), "Dice")
+    extract_job_postings(_page(), "Dice")
+    extract_job_postings(_page(), "Dice")
+
+    assert _pages("Dice", "hit") == hits + 1
+    assert _pages("Dice", "miss") == misses + 2
+
+
+BOARDS = [(scraper_linkedin, "LinkedIn"), (scraper_indeed, "Indeed"), (scraper_dice, "Dice")]
+
+
+@pytest.mark.parametrize("module, board", BOARDS)
+def test_boards_prefer_json_ld_over_cards(module, board):
+    jobs = module.parse_search_page(_page(POSTING, body=CARDS), "SRE")
+
+    assert len(jobs) == 1
+    assert jobs[0]["title"] == "Site Reliability Engineer - SRE"
+    assert jobs[0]["company"] == "Acme"
+    assert jobs[0]["application_link"] == "https://example.com/jobs/42"
+    assert jobs[0]["salary"] == "$120,000 - $150,000"
+
+
+@pytest.mark.parametrize("module, board", BOARDS)
+def test_boards_fall_back_to_cards_on_a_miss(module, board):
+    misses = _pages(board, "miss")
+
+    jobs = module.parse_search_page(_page(body=CARDS), "SRE")
+
+    assert jobs and all("DOM Title" in job["title"] for job in jobs)
+    assert _pages(board, "miss") == misses + 1